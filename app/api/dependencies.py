@@ -9,9 +9,11 @@ from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.security.jwt import decode_token
+from app.core.security.jwt import decode_access_token, decoded_token_cache
+from app.core.security.principal import Principal, principal_cache_key
 from app.core.utils.cache import cache_or_get, invalidate_cache
 from app.core.utils.exceptions import CustomException
+from app.infra.database.routing import bind_session_to_user
 from app.infra.database.session import get_session
 from app.modules.auth.service import AuthService
 from app.modules.gdpr.repository import GDPRRepository
@@ -22,7 +24,6 @@ from app.modules.notifications.email.service import EmailNotificationService
 from app.modules.rbac.repository import RBACRepository
 from app.modules.rbac.service import RBACService
 from app.modules.shared.enums import ConsentType, Role
-from app.modules.user.models import User
 from app.modules.user.repository import UserRepository
 from app.modules.user.service import UserService
 from app.modules.wallet.repository import (TransactionRepository,
@@ -70,35 +71,35 @@ async def get_current_user(
     user_repo: UserRepository = Depends(
         lambda session=Depends(get_session): UserRepository(session)
     ),
-) -> User:
+) -> Principal:
     """
-    Retrieve the current authenticated user with Redis caching.
+    Retrieve the current authenticated user's principal with Redis caching.
     Cache only after validation (token version, account status).
+    Load the full `User` with `UserRepository.get_by_id` where it is needed.
     """
     try:
-        payload = decode_token(token)
+        payload = decode_access_token(token)
         user_email: str | None = payload.get("sub")
         token_version: int | None = payload.get("ver")
 
         if not user_email:
             CustomException.e401_unauthorized("Invalid authentication credentials.")
 
-        cache_key = f"user_current:{user_email}"
+        cache_key = principal_cache_key(user_email)
 
         async def fetch_user():
             _user = await user_repo.get_by_email(user_email)
             if not _user:
                 CustomException.e401_unauthorized("No account found with this email.")
-            return _user
+            return Principal.from_user(_user).to_cache()
 
         user_data = await cache_or_get(
             redis=redis, key=cache_key, fetch_func=fetch_user, ttl=600
         )
-
-        # Reconstruct Pydantic model
-        user = User(**user_data) if isinstance(user_data, dict) else user_data
+        user = Principal.from_cache(user_data)
 
         if token_version != user.token_version:
+            decoded_token_cache.delete(token)
             await invalidate_cache(redis, cache_key)
             CustomException.e401_unauthorized(
                 "Token has been invalidated. Please log in again."
@@ -110,6 +111,10 @@ async def get_current_user(
         if user.is_deleted:
             CustomException.e403_forbidden("Your account is scheduled for deletion.")
 
+        # The request shares this session; keep the user's reads on the primary
+        # for a short while after they write
+        await bind_session_to_user(user_repo.db, redis, user.id)
+
         return user
 
     except Exception as e:
@@ -120,12 +125,12 @@ async def get_current_user_ws(
     token: str,
     redis: Redis,
     user_repo: UserRepository,
-) -> User:
+) -> Principal:
     """
     Retrieve the current authenticated user for WebSocket connections.
     """
     try:
-        payload = decode_token(token)
+        payload = decode_access_token(token)
         user_email: str | None = payload.get("sub")
         token_version: int | None = payload.get("ver")
 
@@ -135,7 +140,7 @@ async def get_current_user_ws(
                 reason="Invalid authentication credentials.",
             )
 
-        cache_key = f"user_current:{user_email}"
+        cache_key = principal_cache_key(user_email)
 
         async def fetch_user():
             _user = await user_repo.get_by_email(user_email)
@@ -144,16 +149,15 @@ async def get_current_user_ws(
                     code=status.WS_1008_POLICY_VIOLATION,
                     reason="No account found with this email.",
                 )
-            return _user
+            return Principal.from_user(_user).to_cache()
 
         user_data = await cache_or_get(
             redis=redis, key=cache_key, fetch_func=fetch_user, ttl=600
         )
-
-        # Reconstruct Pydantic model
-        user = User(**user_data) if isinstance(user_data, dict) else user_data
+        user = Principal.from_cache(user_data)
 
         if token_version != user.token_version:
+            decoded_token_cache.delete(token)
             await invalidate_cache(redis, cache_key)
             raise WebSocketException(
                 code=status.WS_1008_POLICY_VIOLATION,
@@ -185,8 +189,8 @@ async def get_current_user_ws(
 
 
 async def get_current_admin_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
     """
     Validate that the current user has administrative privileges.
     """
@@ -198,8 +202,8 @@ async def get_current_admin_user(
 
 
 async def get_current_super_admin_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
     """
     Validate that the current user has super administrative privileges.
     """
@@ -254,8 +258,9 @@ async def get_wallet_service(db: AsyncSession = Depends(get_session)):
     """Dependency factory for wallet service."""
     wallet_repo = WalletRepository(db)
     transaction_repo = TransactionRepository(db)
+    user_repo = UserRepository(db)
     notification_manager = EmailNotificationService()
-    return WalletService(wallet_repo, transaction_repo, notification_manager)
+    return WalletService(wallet_repo, transaction_repo, user_repo, notification_manager)
 
 
 async def get_rbac_service(db: AsyncSession = Depends(get_session)):
@@ -322,7 +327,7 @@ async def get_ims_service(db: AsyncSession = Depends(get_session)):
 
 
 async def require_savebuddy_consent(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     gdpr_service: GDPRService = Depends(get_gdpr_service),
     redis: Redis = Depends(get_redis),
 ) -> bool:
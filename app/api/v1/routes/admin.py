@@ -3,10 +3,10 @@ from fastapi import APIRouter, Depends, Query
 from app.api.dependencies import (get_current_admin_user,
                                   get_current_super_admin_user,
                                   get_rbac_service)
+from app.core.security.principal import Principal
 from app.core.utils.response import AppMetricsResponse, PaginatedUsersResponse
 from app.modules.rbac.schemas import AdminUserUpdate
 from app.modules.rbac.service import RBACService
-from app.modules.user.models import User
 from app.modules.user.schemas import UserResponse
 
 router = APIRouter()
@@ -17,7 +17,7 @@ async def get_all_users(
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
     service: RBACService = Depends(get_rbac_service),
-    _: User = Depends(get_current_admin_user),
+    _: Principal = Depends(get_current_admin_user),
 ):
     """
     Retrieve a paginated list of all users in the system.
@@ -32,14 +32,16 @@ async def get_all_users(
 @router.get("/app-metrics", response_model=AppMetricsResponse)
 async def get_app_metrics(
     service: RBACService = Depends(get_rbac_service),
-    _: User = Depends(get_current_admin_user),
+    _: Principal = Depends(get_current_admin_user),
 ):
     """
     Retrieve application-wide metrics.
 
     Restricted to users with ADMIN or SUPER_ADMIN roles.
     It returns the total number of transactions, the sum of all wallet balances,
-    and the total number of registered users.
+    and the total number of registered users, plus the per-tier cache
+    hit/miss counters and database pool statistics (occupancy, timeouts and
+    checkout wait histogram) of the worker serving the request.
     """
     data = await service.get_app_metrics()
     return AppMetricsResponse(data=data, message="App metrics retrieved successfully.")
@@ -50,7 +52,7 @@ async def update_user(
     user_id: str,
     update_data: AdminUserUpdate,
     service: RBACService = Depends(get_rbac_service),
-    _: User = Depends(get_current_super_admin_user),
+    _: Principal = Depends(get_current_super_admin_user),
 ):
     """
     Update a specific user's details.
@@ -3,11 +3,14 @@
 from typing import Any
 
 from fastapi import APIRouter, BackgroundTasks, Depends, Request, status
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import (get_auth_service, get_current_user,
-                                  get_user_repo)
+                                  get_redis, get_user_repo)
 from app.core.middleware.rate_limiter import limiter
+from app.core.security.principal import Principal, principal_cache_key
+from app.core.utils.cache import invalidate_cache
 from app.core.utils.exceptions import CustomException
 from app.core.utils.response import LoginData, LoginResponse, standard_response
 from app.infra.database.session import get_session
@@ -15,7 +18,6 @@ from app.modules.auth.schemas import (EmailOnlyRequest, LoginRequest,
                                       RegisterRequest, ResetPasswordRequest,
                                       VerifyEmailRequest)
 from app.modules.auth.service import AuthService
-from app.modules.user.models import User
 from app.modules.user.repository import UserRepository
 
 router = APIRouter()
@@ -200,8 +202,9 @@ async def request_password_reset(
 async def logout_all_devices(
     request: Request,
     user_repo: UserRepository = Depends(get_user_repo),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     auth_service: AuthService = Depends(get_auth_service),
+    redis: Redis = Depends(get_redis),
 ) -> dict[str, Any]:
     """
     Logout from all devices by invalidating all existing tokens.
@@ -221,6 +224,8 @@ async def logout_all_devices(
         raise CustomException.e404_not_found("User not found.")
 
     await auth_service.logout_all_devices(user=user)
+    # Drop the cached user so every worker sees the new token version at once
+    await invalidate_cache(redis, principal_cache_key(user.email))
 
     return standard_response(
         status="success", message="Successfully logged out from all devices."
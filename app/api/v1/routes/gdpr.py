@@ -9,6 +9,7 @@ from redis.asyncio import Redis
 from app.api.dependencies import (get_current_user, get_gdpr_service,
                                   get_redis, get_user_repo)
 from app.core.middleware.rate_limiter import limiter
+from app.core.security.principal import Principal
 from app.core.utils.exceptions import CustomException
 from app.core.utils.response import standard_response
 from app.modules.auth.schemas import VerificationCodeOnlyRequest
@@ -16,7 +17,6 @@ from app.modules.gdpr.schemas import (ConsentActionResponse,
                                       ConsentCheckResponse, ConsentCreate,
                                       ConsentResponse, GdprSimpleResponse)
 from app.modules.gdpr.service import GDPRService
-from app.modules.user.models import User
 from app.modules.user.repository import UserRepository
 
 router = APIRouter()
@@ -31,7 +31,7 @@ router = APIRouter()
 async def request_account_deletion(
     request: Request,
     background_tasks: BackgroundTasks,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     user_repo: UserRepository = Depends(get_user_repo),
     gdpr_service: GDPRService = Depends(get_gdpr_service),
 ) -> dict[str, Any]:
@@ -66,7 +66,7 @@ async def schedule_account_deletion(
     request: Request,
     background_tasks: BackgroundTasks,
     deletion_request: VerificationCodeOnlyRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     user_repo: UserRepository = Depends(get_user_repo),
     gdpr_service: GDPRService = Depends(get_gdpr_service),
 ) -> dict[str, Any]:
@@ -110,7 +110,7 @@ async def schedule_account_deletion(
 async def request_data_export(
     request: Request,
     background_tasks: BackgroundTasks,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     user_repo: UserRepository = Depends(get_user_repo),
     gdpr_service: GDPRService = Depends(get_gdpr_service),
 ) -> dict[str, Any]:
@@ -137,7 +137,7 @@ async def request_data_export(
 async def grant_consent(
     request: Request,
     consent_data: ConsentCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     gdpr_service: GDPRService = Depends(get_gdpr_service),
     redis: Redis = Depends(get_redis),
 ) -> dict[str, Any]:
@@ -162,7 +162,7 @@ async def grant_consent(
 async def revoke_consent(
     request: Request,
     consent_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     gdpr_service: GDPRService = Depends(get_gdpr_service),
     redis: Redis = Depends(get_redis),
 ) -> dict[str, Any]:
@@ -194,7 +194,7 @@ async def revoke_consent(
 async def check_consent(
     request: Request,
     consent_type: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     gdpr_service: GDPRService = Depends(get_gdpr_service),
     redis: Redis = Depends(get_redis),
 ) -> dict[str, Any]:
@@ -14,6 +14,7 @@ from redis.asyncio import Redis
 from app.api.dependencies import (get_current_user, get_current_user_ws,
                                   get_group_service, get_redis)
 from app.core.middleware.rate_limiter import limiter
+from app.core.security.principal import Principal
 from app.core.utils.background_tasks import WebSocketBackgroundTasks
 from app.core.utils.response import (GroupMembersResponse, GroupResponse,
                                      GroupTransactionsResponse,
@@ -25,7 +26,6 @@ from app.modules.group.schemas import (AddMemberRequest, GroupDepositRequest,
 from app.modules.group.service import GroupService
 from app.modules.group.websockets import manager
 from app.modules.shared.enums import GroupRole
-from app.modules.user.models import User
 
 router = APIRouter()
 
@@ -36,7 +36,7 @@ async def create_group(
     request: Request,
     group_in: GroupBase,
     service: GroupService = Depends(get_group_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     """
     Create a new savings group. The user creating the group becomes its admin.
@@ -59,7 +59,7 @@ async def create_group(
 async def get_user_groups(
     request: Request,
     service: GroupService = Depends(get_group_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     """
     Get all groups the current user is a member of.
@@ -72,7 +72,7 @@ async def get_user_groups(
 async def get_user_goals(
     request: Request,
     service: GroupService = Depends(get_group_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     """
     Get all groups the current user is a member of.
@@ -87,7 +87,7 @@ async def get_group(
     request: Request,
     group_id: uuid.UUID,
     service: GroupService = Depends(get_group_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     """
     Get detailed information about a specific group. Only members can view group details.
@@ -124,7 +124,7 @@ async def get_group_members(
     request: Request,
     group_id: uuid.UUID,
     service: GroupService = Depends(get_group_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     """
     Get all members of a specific group. Only members can view this list.
@@ -158,7 +158,7 @@ async def get_group_transactions(
     request: Request,
     group_id: uuid.UUID,
     service: GroupService = Depends(get_group_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     """
     Get all transactions for a specific group, sorted by latest first.
@@ -222,7 +222,7 @@ async def update_group_settings(
     group_id: uuid.UUID,
     group_in: GroupUpdate,
     service: GroupService = Depends(get_group_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     """
     Update a group's settings. Only the group admin can perform this action.
@@ -248,7 +248,7 @@ async def delete_group(
     request: Request,
     group_id: uuid.UUID,
     service: GroupService = Depends(get_group_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     """
     Delete a group. Only the group admin can perform this action.
@@ -264,7 +264,7 @@ async def add_group_member(
     member_in: AddMemberRequest,
     background_tasks: BackgroundTasks = None,
     service: GroupService = Depends(get_group_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     """
     Add a member to a group. Only the group admin can perform this action.
@@ -282,7 +282,7 @@ async def remove_group_member(
     member_in: RemoveMemberRequest,
     background_tasks: BackgroundTasks = None,
     service: GroupService = Depends(get_group_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     """
     Remove a member from a group. Only the group admin can perform this action.
@@ -302,7 +302,7 @@ async def contribute_to_group(
     background_tasks: BackgroundTasks = None,
     redis: Redis = Depends(get_redis),
     service: GroupService = Depends(get_group_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     """
     Contribute funds to a group. This action is atomic and will either
@@ -324,7 +324,7 @@ async def remove_contribution(
     background_tasks: BackgroundTasks = None,
     redis: Redis = Depends(get_redis),
     service: GroupService = Depends(get_group_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     """
     Withdraw funds from a group. This action is atomic and will either
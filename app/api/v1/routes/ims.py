@@ -8,6 +8,8 @@ from redis.asyncio import Redis
 from app.api.dependencies import (get_current_user, get_ims_service, get_redis,
                                   require_savebuddy_consent)
 from app.core.middleware.rate_limiter import limiter
+from app.core.security.principal import Principal
+from app.core.tasks.cron_jobs import wake_scheduler
 from app.core.utils.exceptions import CustomException
 from app.core.utils.response import standard_response
 from app.modules.ims.schemas import (CancelResponse, ChatHistoryResponse,
@@ -18,7 +20,6 @@ from app.modules.ims.schemas import (CancelResponse, ChatHistoryResponse,
                                      ScheduledTransactionResponse)
 from app.modules.ims.service import IMSService
 from app.modules.shared.enums import TransactionStatus
-from app.modules.user.models import User
 
 router = APIRouter()
 
@@ -30,7 +31,7 @@ router = APIRouter()
 async def interpret_prompt(
     request: Request,
     input_data: IMSInputSchema,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     ims_service: IMSService = Depends(get_ims_service),
     _consent: bool = Depends(require_savebuddy_consent),
 ) -> dict[str, Any]:
@@ -80,8 +81,9 @@ async def interpret_prompt(
 async def confirm_transaction(
     request: Request,
     confirm_data: ConfirmTransactionRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     ims_service: IMSService = Depends(get_ims_service),
+    redis: Redis = Depends(get_redis),
     _consent: bool = Depends(require_savebuddy_consent),
 ) -> dict[str, Any]:
     """
@@ -112,6 +114,9 @@ async def confirm_transaction(
             request=confirm_data,
             current_user=current_user,
         )
+        if scheduled_tx.status == TransactionStatus.ACTIVE:
+            # Let the scheduler know in case this is now the earliest due schedule
+            await wake_scheduler(redis)
 
         response_data = ScheduledTransactionResponse(
             id=scheduled_tx.id,
@@ -144,7 +149,7 @@ async def confirm_transaction(
 async def get_scheduled_transactions(
     request: Request,
     status_filter: Optional[str] = None,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     ims_service: IMSService = Depends(get_ims_service),
 ) -> dict[str, Any]:
     """
@@ -198,7 +203,7 @@ async def get_scheduled_transactions(
 @limiter.limit("10/minute")
 async def get_chat_history(
     request: Request,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     ims_service: IMSService = Depends(get_ims_service),
 ) -> dict[str, Any]:
     """
@@ -225,7 +230,7 @@ async def get_chat_history(
 async def cancel_scheduled_transaction(
     request: Request,
     tx_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     ims_service: IMSService = Depends(get_ims_service),
 ) -> dict[str, Any]:
     """
@@ -8,10 +8,10 @@ from redis.asyncio import Redis
 from app.api.dependencies import (get_current_user, get_redis, get_user_repo,
                                   get_user_service)
 from app.core.middleware.rate_limiter import limiter
+from app.core.security.principal import Principal
 from app.core.utils.exceptions import CustomException
 from app.core.utils.response import (FinancialAnalyticsResponse,
                                      standard_response)
-from app.modules.user.models import User
 from app.modules.user.repository import UserRepository
 from app.modules.user.schemas import (ChangeEmailRequest,
                                       ChangePasswordRequest, UserUpdate)
@@ -24,7 +24,8 @@ router = APIRouter()
 @limiter.limit("20/minute")
 async def get_user_info(
     request: Request,
-    current_user: User = Depends(get_current_user),
+    user_repo: UserRepository = Depends(get_user_repo),
+    current_user: Principal = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service),
 ) -> dict[str, Any]:
     """
@@ -41,7 +42,11 @@ async def get_user_info(
     Raises:
         HTTPException: 429 Too Many Requests if the rate limit is exceeded.
     """
-    user_data = await user_service.get_user_details(current_user=current_user)
+    user = await user_repo.get_by_id(current_user.id)
+    if not user:
+        raise CustomException.e404_not_found("User not found.")
+
+    user_data = await user_service.get_user_details(current_user=user)
 
     return standard_response(
         status="success", message="User details retrieved successfully.", data=user_data
@@ -55,7 +60,7 @@ async def change_user_password(
     change_password_request: ChangePasswordRequest,
     background_tasks: BackgroundTasks,
     user_repo: UserRepository = Depends(get_user_repo),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service),
 ) -> dict[str, Any]:
     """
@@ -92,7 +97,7 @@ async def update_user_info(
     update_request: UserUpdate,
     redis: Redis = Depends(get_redis),
     user_repo: UserRepository = Depends(get_user_repo),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service),
 ) -> dict[str, Any]:
     """
@@ -130,7 +135,7 @@ async def change_user_email(
     background_tasks: BackgroundTasks,
     redis: Redis = Depends(get_redis),
     user_repo: UserRepository = Depends(get_user_repo),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service),
 ) -> dict[str, Any]:
     """
@@ -176,7 +181,8 @@ async def change_user_email(
 @limiter.limit("10/minute")
 async def view_login_history(
     request: Request,
-    current_user: User = Depends(get_current_user),
+    user_repo: UserRepository = Depends(get_user_repo),
+    current_user: Principal = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service),
 ) -> dict[str, Any]:
     """
@@ -191,7 +197,11 @@ async def view_login_history(
     Raises:
         HTTPException: 429 Too Many Requests if rate limit exceeded
     """
-    history = await user_service.get_login_history(current_user=current_user)
+    user = await user_repo.get_by_id(current_user.id)
+    if not user:
+        raise CustomException.e404_not_found("User not found.")
+
+    history = await user_service.get_login_history(current_user=user)
 
     return standard_response(
         status="success", message="Login history retrieved successfully", data=history
@@ -206,7 +216,7 @@ async def view_login_history(
 @limiter.limit("5/minute")
 async def get_financial_analytics(
     request: Request,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service),
 ) -> FinancialAnalyticsResponse:
     """
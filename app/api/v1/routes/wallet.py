@@ -1,6 +1,6 @@
 # app/api/v1/routes/wallet.py
 
-from typing import Any
+from typing import Any, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request, status
 from redis.asyncio import Redis
@@ -8,9 +8,9 @@ from redis.asyncio import Redis
 from app.api.dependencies import (get_current_user, get_redis, get_user_repo,
                                   get_wallet_service)
 from app.core.middleware.rate_limiter import limiter
+from app.core.security.principal import Principal
 from app.core.utils.exceptions import CustomException
 from app.core.utils.response import standard_response
-from app.modules.user.models import User
 from app.modules.user.repository import UserRepository
 from app.modules.wallet.schemas import (TransactionRequest,
                                         WalletBalanceResponse)
@@ -26,7 +26,7 @@ router = APIRouter()
 async def get_wallet_balance(
     request: Request,
     redis: Redis = Depends(get_redis),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     wallet_service: WalletService = Depends(get_wallet_service),
 ) -> dict[str, Any]:
     """
@@ -42,7 +42,7 @@ async def get_wallet_transactions(
     redis: Redis = Depends(get_redis),
     page: int = Query(1, ge=1, description="Page number (1-based)."),
     page_size: int = Query(20, ge=1, le=100, description="Items per page (max 100)."),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     wallet_service: WalletService = Depends(get_wallet_service),
 ) -> dict[str, Any]:
     """Retrieve a paginated list of wallet transactions for the authenticated user.
@@ -67,6 +67,50 @@ async def get_wallet_transactions(
     )
 
 
+@router.get("/transactions/cursor", status_code=status.HTTP_200_OK)
+@limiter.limit("15/minute")
+async def get_wallet_transactions_by_cursor(
+    request: Request,
+    redis: Redis = Depends(get_redis),
+    cursor: Optional[str] = Query(
+        None, description="`next_cursor` of the previous page; omit for page one."
+    ),
+    limit: int = Query(20, ge=1, le=100, description="Items per page (max 100)."),
+    include_total: bool = Query(
+        False, description="Also return the total number of transactions."
+    ),
+    current_user: Principal = Depends(get_current_user),
+    wallet_service: WalletService = Depends(get_wallet_service),
+) -> dict[str, Any]:
+    """Retrieve wallet transactions for the authenticated user with cursor pagination.
+
+    Unlike `/transactions`, the cost of a page does not grow with its depth, and
+    the total count is only computed when requested.
+
+    Query Parameters:
+        cursor (str): Opaque cursor returned as `next_cursor` by the previous page.
+        limit (int): Number of transactions per page. Defaults to 20. Max 100.
+        include_total (bool): Include `total_transactions`. Defaults to False.
+
+    Returns:
+        dict[str, Any]: Standard response containing transaction data with keys:
+            - transactions: list of transaction objects ordered by most recent first
+            - next_cursor: cursor for the next page, or null on the last page
+            - has_more: whether more transactions follow
+            - total_transactions: total number of transactions (if requested)
+    """
+    response = await wallet_service.get_transactions_by_cursor(
+        redis=redis,
+        current_user=current_user,
+        cursor=cursor,
+        limit=limit,
+        include_total=include_total,
+    )
+    return standard_response(
+        message="Transaction history retrieved successfully.", data=response
+    )
+
+
 @router.post("/deposit", status_code=status.HTTP_200_OK)
 @limiter.limit("5/minute")
 async def deposit(
@@ -75,7 +119,7 @@ async def deposit(
     background_tasks: BackgroundTasks,
     redis: Redis = Depends(get_redis),
     user_repo: UserRepository = Depends(get_user_repo),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     wallet_service: WalletService = Depends(get_wallet_service),
 ) -> dict[str, Any]:
     """
@@ -122,7 +166,7 @@ async def withdraw(
     background_tasks: BackgroundTasks,
     redis: Redis = Depends(get_redis),
     user_repo: UserRepository = Depends(get_user_repo),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     wallet_service: WalletService = Depends(get_wallet_service),
 ) -> dict[str, Any]:
     """
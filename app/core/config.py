@@ -33,17 +33,54 @@ class Settings(BaseSettings):
     POSTGRES_USER: Optional[str] = None
     POSTGRES_PASSWORD: Optional[str] = None
     POSTGRES_DB: Optional[str] = None
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # in seconds
+    DB_POOL_RECYCLE: int = 1800  # in seconds, -1 disables
+    DB_POOL_PRE_PING: bool = True
+    DB_PREPARED_STATEMENT_CACHE_SIZE: Optional[int] = None  # asyncpg, None = default
+    DB_REPLICA_HOST: Optional[str] = None  # read replica, unset = primary only
+    DB_REPLICA_PORT: Optional[int] = None  # defaults to DB_PORT
+    DB_READ_YOUR_WRITES_SECONDS: int = 5
     # CACHING
     REDIS_URL: Optional[str] = None
     CACHE_TTL: Optional[int] = 300
+    CACHE_CODEC: str = "msgpack"  # Options: "msgpack", "json"
+    CACHE_COMPRESSION: str = "lz4"  # Options: "lz4", "zlib", "none"
+    CACHE_COMPRESSION_THRESHOLD: int = 1024  # in bytes
+    LOCAL_CACHE_ENABLED: bool = False
+    LOCAL_CACHE_TTL: int = 30
+    LOCAL_CACHE_MAX_ENTRIES: int = 2048
+    LOCAL_CACHE_MAX_BYTES: int = 16_000_000
+    CACHE_INVALIDATION_CHANNEL: str = "cache_invalidation"
+    CACHE_FILL_LOCK_TTL_MS: int = 5000
+    CACHE_FILL_WAIT_MS: int = 2000
     # SECURITY
     JWT_SECRET_KEY: Optional[str] = None
     JWT_EXPIRATION_TIME: Optional[int] = None
     JWT_SIGNING_ALGORITHM: Optional[str] = None
+    JWT_DECODE_CACHE_MAX_ENTRIES: int = 10_000  # verified tokens per worker, 0 = off
+
+    PASSWORD_HASH_ROUNDS: int = 12  # bcrypt work factor for new hashes
+    PASSWORD_HASH_WORKERS: int = 2  # hashing processes per worker, 0 = thread pool
+    PASSWORD_HASH_MAX_PENDING: int = 32  # running + queued, beyond that 503
 
     MAX_FAILED_LOGIN_ATTEMPTS: Optional[int] = None
     IP_HASH_SALT: Optional[str] = None
+    IP_HASH_ALGORITHM: str = "sha256"  # Options: "sha256", "blake2b" (see hash_ip)
+    IP_HASH_CACHE_SIZE: int = 4096  # hashed IPs memoized per worker
     LOG_RETENTION_DAYS: Optional[int] = None
+    LOG_DIR: Optional[str] = None  # defaults to app/logs
+    LOG_QUEUE_SIZE: int = 10_000  # records waiting for the writer thread
+    LOG_BATCH_SIZE: int = 256  # records per write/flush
+    LOG_SAMPLE_RATE: int = 10  # keep 1 in N INFO records when the queue is 80% full
+    METRICS_FLUSH_INTERVAL_SECONDS: int = 15  # latency histograms merged into Redis
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_LOCAL_BATCH: int = 10  # tokens a worker reserves per Redis call
+    RATE_LIMIT_LOCAL_TTL_MS: int = 1000  # how long reserved tokens stay usable
+    HEALTH_SAMPLE_INTERVAL_SECONDS: int = 10  # CPU/memory sampled in the background
+    HEALTH_CHECK_TIMEOUT_SECONDS: float = 2.0  # per dependency probe
+    HEALTH_READINESS_TTL_SECONDS: float = 2.0  # readiness result reused for this long
     # AMOUNTS
     MIN_BALANCE_THRESHOLD: Optional[float] = None
     MIN_GROUP_THRESHOLD_AMOUNT: Optional[float] = None
@@ -70,6 +107,11 @@ class Settings(BaseSettings):
     # SCHEDULE
     HARD_DELETE_RETENTION_DAYS: Optional[int] = 14
     HARD_DELETE_CRON_INTERVAL_HOURS: Optional[int] = 24
+    ANONYMIZATION_BATCH_SIZE: int = 500
+    SCHEDULED_TX_BATCH_SIZE: int = 500
+    SCHEDULED_TX_CONCURRENCY: int = 4
+    SCHEDULED_TX_SCHEDULER: str = "due_time"
+    SCHEDULED_TX_POLL_INTERVAL_SECONDS: int = 60
     REMOVE_MEMBER_COOLDOWN_DAYS: Optional[int] = 7
 
     model_config = ConfigDict(env_file=".env", extra="ignore")
@@ -1,22 +1,31 @@
 import asyncio
+import atexit
 import datetime
 import json
 import logging
+import queue
 import sys
 import time
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path, PurePosixPath
 from typing import Optional
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.config import settings
+from app.core.middleware.rate_limiter import RateLimitExceeded
 from app.core.security.hashing import hash_ip
+from app.infra.metrics.latency import UNMATCHED_ROUTE, latency_histograms
+from app.infra.metrics.metrics_data import app_metrics
 
 # Detect environment
 ENV = settings.APP_ENV
 LOG_RETENTION_DAYS = settings.LOG_RETENTION_DAYS
+LOG_DIR = (
+    Path(settings.LOG_DIR)
+    if settings.LOG_DIR
+    else Path(__file__).parent.parent.parent / "logs"
+)
 
 # ---------------------------
 # Logger setup
@@ -60,6 +69,137 @@ class CleanupJsonFormatter(logging.Formatter):
         return json.dumps(log_entry)
 
 
+# ---------------------------
+# Queue pipeline
+# ---------------------------
+class SamplingQueueHandler(QueueHandler):
+    """
+    Hands records to a bounded queue without blocking the caller.
+
+    Once the queue is 80% full, only one in `sample_rate` records below
+    WARNING is kept; when it is completely full, records are dropped.
+    Drops are counted and reported with a warning once the queue has room.
+    """
+
+    def __init__(self, log_queue: queue.Queue, sample_rate: int):
+        super().__init__(log_queue)
+        self.sample_rate = max(sample_rate, 1)
+        self.high_water = max(int(log_queue.maxsize * 0.8), 1)
+        self.dropped = 0
+        self._unreported = 0
+        self._seen = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.levelno < logging.WARNING and self.queue.qsize() >= self.high_water:
+            self._seen += 1
+            if self._seen % self.sample_rate:
+                self._drop()
+                return
+
+        try:
+            if self._unreported and self.queue.qsize() < self.high_water:
+                self.queue.put_nowait(self._drop_report())
+                self._unreported = 0
+            self.enqueue(self.prepare(record))
+        except queue.Full:
+            self._drop()
+        except Exception:
+            self.handleError(record)
+
+    def _drop(self) -> None:
+        self.dropped += 1
+        self._unreported += 1
+
+    def _drop_report(self) -> logging.LogRecord:
+        record = logging.LogRecord(
+            self.name or "savings",
+            logging.WARNING,
+            __file__,
+            0,
+            f"Dropped {self._unreported} log records under load",
+            None,
+            None,
+        )
+        return record
+
+
+class BatchWriteMixin:
+    """
+    Collects formatted records and writes them with a single write() and
+    flush() per batch; the queue listener decides when a batch ends.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._batch.append(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+    def write_batch(self, data: str) -> None:
+        self.stream.write(data)
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            batch = getattr(self, "_batch", None)
+            if batch and self.stream:
+                data = "".join(batch)
+                batch.clear()
+                self.write_batch(data)
+            if self.stream and hasattr(self.stream, "flush"):
+                self.stream.flush()
+        except (OSError, ValueError):
+            # Stream already closed (e.g. during interpreter shutdown)
+            pass
+        finally:
+            self.release()
+
+
+class BatchStreamHandler(BatchWriteMixin, logging.StreamHandler):
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        self._batch: list[str] = []
+
+
+class BatchRotatingFileHandler(BatchWriteMixin, RotatingFileHandler):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._batch: list[str] = []
+
+    def write_batch(self, data: str) -> None:
+        if self.maxBytes > 0 and self.stream.tell() + len(data) >= self.maxBytes:
+            self.doRollover()
+        self.stream.write(data)
+
+
+class BatchQueueListener(QueueListener):
+    """
+    QueueListener that flushes its handlers once the queue is drained or
+    `batch_size` records have been handled, instead of after every record.
+    """
+
+    def __init__(self, log_queue: queue.Queue, *handlers, batch_size: int):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.batch_size = max(batch_size, 1)
+        self._pending = 0
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        self._pending += 1
+        if self._pending >= self.batch_size or self.queue.empty():
+            self.flush()
+
+    def flush(self) -> None:
+        self._pending = 0
+        for handler in self.handlers:
+            handler.flush()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            super().stop()
+        self.flush()
+
+
 # ---------------------------
 # Remove existing handlers
 # ---------------------------
@@ -72,21 +212,24 @@ if cleanup_logger.hasHandlers():
 # ---------------------------
 # Console and file handlers
 # ---------------------------
+# Written by the listener thread; callers only enqueue
+log_handlers: list[logging.Handler] = []
+
 # Console (prod)
 if ENV != "development":
-    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler = BatchStreamHandler(sys.stdout)
     console_handler.setFormatter(JsonFormatter())
-    logger.addHandler(console_handler)
+    log_handlers.append(console_handler)
 
 # File (dev)
 if ENV != "production":
-    log_dir = Path(__file__).parent.parent.parent / "logs"
-    log_dir.mkdir(exist_ok=True)
-    file_handler = RotatingFileHandler(
+    log_dir = LOG_DIR
+    log_dir.mkdir(parents=True, exist_ok=True)
+    file_handler = BatchRotatingFileHandler(
         log_dir / "requests.log", maxBytes=5_000_000, backupCount=3
     )
     file_handler.setFormatter(JsonFormatter())
-    logger.addHandler(file_handler)
+    log_handlers.append(file_handler)
 
     # Cleanup logs
     cleanup_file_handler = RotatingFileHandler(
@@ -95,6 +238,17 @@ if ENV != "production":
     cleanup_file_handler.setFormatter(CleanupJsonFormatter())
     cleanup_logger.addHandler(cleanup_file_handler)
 
+log_queue: queue.Queue = queue.Queue(maxsize=max(settings.LOG_QUEUE_SIZE, 1))
+queue_handler = SamplingQueueHandler(log_queue, settings.LOG_SAMPLE_RATE)
+logger.addHandler(queue_handler)
+
+log_listener = BatchQueueListener(
+    log_queue, *log_handlers, batch_size=settings.LOG_BATCH_SIZE
+)
+log_listener.start()
+# Write out whatever is still queued on interpreter exit
+atexit.register(log_listener.stop)
+
 
 # ---------------------------
 # Helper: descriptive messages
@@ -126,78 +280,79 @@ def get_request_log_message(status_code: int) -> str:
 # ---------------------------
 # Request logging middleware
 # ---------------------------
-def set_latest_latency_filtered(req: Request, ptime: float):
-    """Filter `health` endpoint from being set as latest req latency."""
-    from app.main import app_metrics
+def route_label(scope: Scope) -> str:
+    """Route template the request matched, keeping metric labels bounded."""
+    route = scope.get("route")
+    path = getattr(route, "path_format", None)
+    return path if isinstance(path, str) else UNMATCHED_ROUTE
+
+
+def set_latest_latency_filtered(scope: Scope, ptime: float, status_code: int):
+    """
+    Record the request in the latency histograms and filter `health` endpoint
+    from being set as latest req latency.
+    """
+    method, path = scope["method"], scope["path"]
+    latency_histograms.observe(method, route_label(scope), status_code, ptime / 1000)
 
     last_segment = PurePosixPath(
-        req.url.path
+        path
     ).name  # Only skip if the last segment of the path is 'health'
-    if last_segment != "health" and "admin" not in req.url.path:
-        app_metrics.set_latest_response_latency(ptime, req.url.path, req.method)
+    if last_segment != "health" and "admin" not in path:
+        app_metrics.set_latest_response_latency(ptime, path, method)
+
+
+def log_request(scope: Scope, status_code: int, process_time: float) -> None:
+    """Enqueue the request log record; the listener thread formats and writes."""
+    client = scope.get("client")
+    level = logging.WARNING if status_code == 429 else logging.INFO
+
+    logger.log(
+        level,
+        get_request_log_message(status_code),
+        extra={
+            "method": scope["method"],
+            "path": scope["path"],
+            "status_code": status_code,
+            "completed_in_ms": process_time,
+            "ip_anonymized": hash_ip(client[0]) if client else None,
+        },
+    )
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        # Import here to avoid circular dependency
-        from app.main import app_metrics
+class LoggingMiddleware:
+    """
+    Pure ASGI request logging: wraps `send` to pick up the response status,
+    then records latency and enqueues one log record once the response has
+    been sent. Response bodies pass through untouched, so streaming works.
+    """
 
-        ip = request.client.host
-        masked_ip = hash_ip(ip)
-        start_time = time.time()
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        try:
-            response = await call_next(request)
-        except Exception as exc:
-            # Handle rate-limited requests separately
-            from slowapi.errors import RateLimitExceeded
-
-            process_time = (time.time() - start_time) * 1000
-            set_latest_latency_filtered(req=request, ptime=process_time)
-
-            if isinstance(exc, RateLimitExceeded):
-                status_code = 429
-                message = "Request rate-limited"
-
-                # Run logging in a separate thread to avoid blocking the event loop
-                await asyncio.get_running_loop().run_in_executor(
-                    None,
-                    lambda: logger.warning(
-                        msg=message,
-                        extra={
-                            "method": request.method,
-                            "path": request.url.path,
-                            "status_code": status_code,
-                            "completed_in_ms": process_time,
-                            "ip_anonymized": masked_ip,
-                        },
-                    ),
-                )
-            # Re-raise for FastAPI exception handlers
-            raise
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Normal requests
-        process_time = (time.time() - start_time) * 1000
-        set_latest_latency_filtered(req=request, ptime=process_time)
+        status_code = 500
+        start_time = time.perf_counter()
 
-        message = get_request_log_message(response.status_code)
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
-        # Run logging in a separate thread to avoid blocking the event loop
-        await asyncio.get_running_loop().run_in_executor(
-            None,
-            lambda: logger.info(
-                msg=message,
-                extra={
-                    "method": request.method,
-                    "path": request.url.path,
-                    "status_code": response.status_code,
-                    "completed_in_ms": process_time,
-                    "ip_anonymized": masked_ip,
-                },
-            ),
-        )
-
-        return response
+        try:
+            await self.app(scope, receive, send_with_status)
+        except RateLimitExceeded:
+            status_code = 429
+            raise  # Re-raise for FastAPI exception handlers
+        finally:
+            process_time = (time.perf_counter() - start_time) * 1000
+            set_latest_latency_filtered(scope, process_time, status_code)
+            log_request(scope, status_code, process_time)
 
 
 # ---------------------------
@@ -219,7 +374,7 @@ def _cleanup_old_logs_sync(
     if ENV == "production":
         return
 
-    log_dir = log_dir or Path(__file__).parent.parent.parent / "logs"
+    log_dir = log_dir or LOG_DIR
     if not log_dir.exists():
         return
 
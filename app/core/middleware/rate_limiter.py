@@ -1,6 +1,248 @@
-# app/core/middleware/limiter.py
+# app/core/middleware/rate_limiter.py
 
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+import asyncio
+import functools
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Tuple
 
-limiter = Limiter(key_func=get_remote_address)
+from fastapi import Request
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.security.jwt import decode_access_token
+
+logger = logging.getLogger("savings")
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+# Sliding window counter: the previous fixed window counts in proportion to how
+# much of it still overlaps the sliding window. Grants up to ARGV[3] tokens at
+# once so workers can pre-allocate a batch.
+# KEYS: current window, previous window
+# ARGV: limit, previous window weight, tokens wanted, key TTL (ms)
+SLIDING_WINDOW_SCRIPT = """
+local curr = tonumber(redis.call('GET', KEYS[1]) or '0')
+local prev = tonumber(redis.call('GET', KEYS[2]) or '0')
+local limit = tonumber(ARGV[1])
+local used = prev * tonumber(ARGV[2]) + curr
+local granted = math.min(tonumber(ARGV[3]), math.floor(limit - used))
+if granted > 0 then
+    redis.call('INCRBY', KEYS[1], granted)
+    redis.call('PEXPIRE', KEYS[1], ARGV[4])
+else
+    granted = 0
+end
+return {granted, math.max(0, math.floor(limit - used - granted))}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """A parsed limit such as `10/minute`."""
+
+    amount: int
+    window: int  # seconds
+
+    @classmethod
+    def parse(cls, value: str) -> "RateLimit":
+        amount, period = value.split("/")
+        return cls(int(amount), PERIODS[period.strip().rstrip("s")])
+
+
+@dataclass
+class RateLimitInfo:
+    """Outcome of one check, sent back as rate limit headers."""
+
+    limit: int
+    remaining: int
+    reset: int  # seconds until the current window ends
+
+    def headers(self) -> Dict[str, str]:
+        return {
+            "RateLimit-Limit": str(self.limit),
+            "RateLimit-Remaining": str(self.remaining),
+            "RateLimit-Reset": str(self.reset),
+        }
+
+
+class RateLimitExceeded(Exception):
+    """Raised by `Limiter.limit` routes once the caller is over the limit."""
+
+    def __init__(self, info: RateLimitInfo):
+        super().__init__("Rate limit exceeded")
+        self.info = info
+
+
+class _LocalGrant:
+    __slots__ = ("tokens", "expires_at", "remaining", "window_end")
+
+    def __init__(self, tokens: int, expires_at: float, remaining: int, window_end: float):
+        self.tokens = tokens
+        self.expires_at = expires_at
+        self.remaining = remaining
+        self.window_end = window_end
+
+
+class Limiter:
+    """
+    Redis-backed sliding window rate limiter shared by all workers and nodes.
+
+    Authenticated requests are limited per user (the access token subject),
+    anonymous ones per client IP; each route has its own counters. Counters
+    live in Redis and are checked and incremented by one Lua script.
+
+    For limits of 20 or more per window a worker reserves a batch of up to
+    `RATE_LIMIT_LOCAL_BATCH` tokens (a tenth of the limit at most) and serves
+    the following requests of the same caller from it for up to
+    `RATE_LIMIT_LOCAL_TTL_MS` without touching Redis. Reserved tokens count
+    against the limit straight away, so batching can only make the limiter
+    stricter, never looser. If Redis is unavailable requests are let through.
+    """
+
+    def __init__(self, local_batch: int, local_ttl_ms: int, max_local_keys: int = 10_000):
+        self.enabled = settings.RATE_LIMIT_ENABLED
+        self.local_batch = local_batch
+        self.local_ttl = local_ttl_ms / 1000
+        self.max_local_keys = max_local_keys
+        self._grants: "OrderedDict[str, _LocalGrant]" = OrderedDict()
+        self._script = None
+
+    def limit(self, value: str) -> Callable:
+        """
+        Decorate a route to allow `value` requests (e.g. `5/minute`) per caller.
+
+        The route must take a `request: Request` parameter.
+        """
+        rate = RateLimit.parse(value)
+
+        def decorator(func: Callable) -> Callable:
+            scope_name = f"{func.__module__}.{func.__name__}"
+            is_coroutine = asyncio.iscoroutinefunction(func)
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                request = kwargs.get("request")
+                if self.enabled and isinstance(request, Request):
+                    await self.check(request, scope_name, rate)
+                if is_coroutine:
+                    return await func(*args, **kwargs)
+                return await run_in_threadpool(func, *args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    async def check(self, request: Request, scope_name: str, rate: RateLimit) -> None:
+        """Count the request; raise `RateLimitExceeded` when over the limit."""
+        key = f"rate_limit:{scope_name}:{rate.amount}/{rate.window}:{identify(request)}"
+        now = time.time()
+
+        grant = self._grants.get(key)
+        if grant and grant.tokens > 0 and time.monotonic() < grant.expires_at:
+            grant.tokens -= 1
+            allowed, info = True, RateLimitInfo(
+                rate.amount,
+                grant.remaining + grant.tokens,
+                max(math.ceil(grant.window_end - now), 0),
+            )
+        else:
+            try:
+                allowed, info = await self._reserve(request, key, rate, now)
+            except Exception as e:
+                logger.warning(f"Rate limiter unavailable, allowing request: {e}")
+                return
+
+        request.state.rate_limit = info
+        if not allowed:
+            raise RateLimitExceeded(info)
+
+    async def _reserve(
+        self, request: Request, key: str, rate: RateLimit, now: float
+    ) -> Tuple[bool, RateLimitInfo]:
+        """Take a batch of tokens from Redis and keep the spare ones locally."""
+        window_start = int(now - now % rate.window)
+        window_end = window_start + rate.window
+        weight = 1 - (now - window_start) / rate.window
+
+        granted, remaining = await self._run_script(
+            request.app.state.redis,
+            keys=[f"{key}:{window_start}", f"{key}:{window_start - rate.window}"],
+            args=[rate.amount, weight, self._batch_size(rate), rate.window * 2000],
+        )
+        granted, remaining = int(granted), int(remaining)
+        reset = max(math.ceil(window_end - now), 0)
+
+        spare = max(granted - 1, 0)
+        if spare:
+            self._remember(
+                key,
+                _LocalGrant(spare, time.monotonic() + self.local_ttl, remaining, window_end),
+            )
+        else:
+            self._grants.pop(key, None)
+        return granted > 0, RateLimitInfo(rate.amount, remaining + spare, reset)
+
+    def _batch_size(self, rate: RateLimit) -> int:
+        """Tokens to take per Redis call; one for small limits, which must stay exact."""
+        return max(min(self.local_batch, rate.amount // 10), 1)
+
+    def _remember(self, key: str, grant: _LocalGrant) -> None:
+        self._grants[key] = grant
+        self._grants.move_to_end(key)
+        while len(self._grants) > self.max_local_keys:
+            self._grants.popitem(last=False)
+
+    async def _run_script(self, redis, keys, args) -> Tuple[int, int]:
+        if self._script is None:
+            self._script = redis.register_script(SLIDING_WINDOW_SCRIPT)
+        return await self._script(keys=keys, args=args, client=redis)
+
+
+def identify(request: Request) -> str:
+    """`user:<email>` for a valid bearer token, otherwise `ip:<client ip>`."""
+    authorization = request.headers.get("Authorization", "")
+    if authorization[:7].lower() == "bearer ":
+        try:
+            subject = decode_access_token(authorization[7:]).get("sub")
+        except Exception:
+            subject = None
+        if subject:
+            return f"user:{subject}"
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
+class RateLimitHeadersMiddleware:
+    """Adds the rate limit headers of the route's last check to its response."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                info = scope.get("state", {}).get("rate_limit")
+                if info is not None:
+                    headers = list(message.get("headers", []))
+                    names = {name.lower() for name, _ in headers}
+                    for name, value in info.headers().items():
+                        if name.lower().encode() not in names:
+                            headers.append((name.lower().encode(), value.encode()))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+limiter = Limiter(
+    local_batch=settings.RATE_LIMIT_LOCAL_BATCH,
+    local_ttl_ms=settings.RATE_LIMIT_LOCAL_TTL_MS,
+)
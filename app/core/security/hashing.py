@@ -2,38 +2,75 @@
 
 import hashlib
 import os
+from functools import lru_cache
+from typing import Optional
 
-import bcrypt
 from passlib.context import CryptContext
 
+from app.core.config import settings
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 SALT = os.getenv("IP_HASH_SALT")
 
+# Stored instead of a hash for accounts that must never log in again. It can't
+# be produced by bcrypt, so no password verifies against it.
+UNUSABLE_PASSWORD_PREFIX = "!"
+UNUSABLE_PASSWORD_HASH = UNUSABLE_PASSWORD_PREFIX + "unusable"
 
-def hash_ip(ip: str) -> str:
+
+def _blake2b_key(salt: str) -> bytes:
+    """BLAKE2b takes keys of up to 64 bytes; longer salts are hashed down."""
+    key = salt.encode()
+    return key if len(key) <= 64 else hashlib.blake2b(key).digest()
+
+
+@lru_cache(maxsize=settings.IP_HASH_CACHE_SIZE)
+def _hash_ip(ip: str) -> str:
+    if SALT is None:
+        raise RuntimeError("IP_HASH_SALT is not set.")
+    if settings.IP_HASH_ALGORITHM == "blake2b":
+        return hashlib.blake2b(
+            ip.encode(), key=_blake2b_key(SALT), digest_size=32
+        ).hexdigest()
     return hashlib.sha256((ip + SALT).encode()).hexdigest()
 
 
-def hash_password(password: str) -> str:
-    """Hash a plain-text password using bcrypt."""
-    return pwd_context.hash(password)
+def hash_ip(ip: str) -> str:
+    """
+    Anonymize an IP address for logs and audit records.
 
+    Salted SHA-256 (`sha256(ip + IP_HASH_SALT)`) by default, the format of
+    every `ip_anonymized` value already stored. `IP_HASH_ALGORITHM=blake2b`
+    opts in to keyed BLAKE2b (a MAC keyed with `IP_HASH_SALT`). Both give 64
+    hex chars and depend only on the IP and the salt, so every worker produces
+    the same value. Results are memoized per worker in an LRU of
+    `IP_HASH_CACHE_SIZE` entries, as the same client IPs keep coming back.
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plain-text password against its hashed version."""
-    return pwd_context.verify(plain_password, hashed_password)
+    Switching algorithm is a cutover: values written before it no longer match
+    the same IP afterwards (as with a salt rotation), so switch all workers at
+    once, ideally together with a salt rotation, and don't correlate records
+    across the switch.
 
+    Args:
+        ip (str): The raw client IP.
 
-def generate_random_password_hash(length: int) -> str:
-    """
-    Generate a secure random password hash that cannot be used to log in.
+    Returns:
+        str: The hex digest.
     """
-    # Generate 32 random bytes
-    random_bytes = os.urandom(length)
+    return _hash_ip(ip)
+
+
+def hash_password(password: str, rounds: Optional[int] = None) -> str:
+    """Hash a plain-text password using bcrypt, optionally with a given work factor."""
+    if rounds is None:
+        return pwd_context.hash(password)
+    return pwd_context.handler("bcrypt").using(rounds=rounds).hash(password)
 
-    # Hash using bcrypt
-    hashed = bcrypt.hashpw(random_bytes, bcrypt.gensalt())
 
-    # Return as UTF-8 string
-    return hashed.decode("utf-8")
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a plain-text password against its hashed version."""
+    if hashed_password.startswith(UNUSABLE_PASSWORD_PREFIX):
+        return False
+    return pwd_context.verify(plain_password, hashed_password)
+
@@ -1,5 +1,8 @@
 # app/core/security/jwt.py
 
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional, Union
 
@@ -14,6 +17,64 @@ KEY = settings.JWT_SECRET_KEY
 EXPIRY = settings.JWT_EXPIRATION_TIME
 
 
+class DecodedTokenCache:
+    """
+    Bounded per-worker LRU of verified token payloads, keyed by a SHA-256 of
+    the token and kept until the token's `exp`.
+
+    A token's payload never changes once signed, so a cache hit only skips the
+    signature check; callers still compare `ver` with the user's current
+    token_version on every request. Tokens without `exp` are not cached.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[dict[str, Any]]:
+        """Return the cached payload, or None if absent or expired."""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, payload = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return payload
+
+    def set(self, token: str, payload: dict[str, Any]) -> None:
+        """Store a verified payload until its `exp`, evicting LRU entries when full."""
+        expires_at = payload.get("exp")
+        if self.max_entries <= 0 or not isinstance(expires_at, (int, float)):
+            return
+
+        key = self._key(token)
+        self._entries[key] = (expires_at, payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, token: str) -> None:
+        self._entries.pop(self._key(token), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+decoded_token_cache = DecodedTokenCache(settings.JWT_DECODE_CACHE_MAX_ENTRIES)
+
+
 def decode_token(token: str, expected_version: Optional[int] = None) -> dict[str, Any]:
     """
     Decode and validate JWT token, optionally checking token version.
@@ -44,6 +105,27 @@ def decode_token(token: str, expected_version: Optional[int] = None) -> dict[str
         ) from e
 
 
+def decode_access_token(token: str) -> dict[str, Any]:
+    """
+    Decode an access token, skipping signature verification for tokens this
+    worker already verified (see `DecodedTokenCache`).
+
+    Args:
+        token: The JWT token to decode
+
+    Returns:
+        dict: The decoded token payload, shared with the cache; do not modify
+
+    Raises:
+        HTTPException: If token is invalid or expired
+    """
+    payload = decoded_token_cache.get(token)
+    if payload is None:
+        payload = decode_token(token)
+        decoded_token_cache.set(token, payload)
+    return payload
+
+
 def create_password_reset_token(email: str) -> str:
     """Create password reset token valid for 15 minutes"""
     to_encode = {"sub": email, "type": "password_reset"}
@@ -0,0 +1,102 @@
+# app/core/security/password_hasher.py
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from app.core.config import settings
+from app.core.middleware.logging import logger
+from app.core.security.hashing import (UNUSABLE_PASSWORD_PREFIX, hash_password,
+                                       verify_password)
+from app.core.utils.exceptions import CustomException
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt hashing and verification off the event loop, in a pool of
+    worker processes, so a 100-300ms bcrypt call does not stall every other
+    request on this API worker.
+
+    At most `max_pending` calls may be running or queued at once. Further
+    calls are shed with 503 straight away instead of queueing behind a login
+    storm until their clients time out.
+    """
+
+    def __init__(self, workers: int, max_pending: int, rounds: int):
+        self.workers = workers
+        self.max_pending = max(max_pending, 1)
+        self.rounds = rounds
+        self.pending = 0
+        self.shed = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        if self.workers <= 0:
+            # The loop's default thread pool; bcrypt releases the GIL
+            return None
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                # Forking a process that runs an event loop and threads is unsafe
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self.pending >= self.max_pending:
+            self.shed += 1
+            CustomException.e503_service_unavailable(
+                "Too many requests are being processed. Please retry shortly.",
+                retry_after=1,
+            )
+
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            try:
+                return await loop.run_in_executor(executor, func, *args)
+            except BrokenProcessPool:
+                # A hashing process died; start a fresh pool and retry once.
+                # Other calls in flight on the same pool fail too, so only the
+                # first to get here replaces it; the rest reuse the new one.
+                if self._executor is executor:
+                    logger.warning("Password hashing pool broke, restarting it")
+                    self.shutdown()
+                return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self.pending -= 1
+
+    async def hash(self, password: str) -> str:
+        """Hash a plain-text password with the configured work factor."""
+        return await self._run(hash_password, password, self.rounds)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a plain-text password against its hashed version."""
+        if hashed_password.startswith(UNUSABLE_PASSWORD_PREFIX):
+            return False
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def stats(self) -> dict[str, int]:
+        """Return pool size, calls in flight and calls shed since startup."""
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "shed": self.shed,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the hashing processes; a later call starts a new pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    rounds=settings.PASSWORD_HASH_ROUNDS,
+)
@@ -0,0 +1,89 @@
+# app/core/security/principal.py
+
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional
+from uuid import UUID
+
+from app.modules.shared.enums import Currency, Role
+
+
+def principal_cache_key(email: str) -> str:
+    """Cache key of the principal of the user with this email."""
+    return f"user_principal:{email}"
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """
+    The authenticated user as request handlers see it: identity, role, token
+    version and account flags, plus the display fields most services need.
+
+    This is what `get_current_user` caches and returns instead of a full
+    `User`, so the password hash and other columns never reach the cache.
+    Endpoints that need the rest of the row, or want to modify it, load it
+    with `UserRepository.get_by_id(current_user.id)`.
+    """
+
+    id: UUID
+    email: str
+    role: Role
+    token_version: int
+    is_verified: bool
+    is_enabled: bool
+    is_deleted: bool
+    full_name: Optional[str] = None
+    stag: Optional[str] = None
+    preferred_currency: Optional[Currency] = None
+
+    @classmethod
+    def from_user(cls, user: Any) -> "Principal":
+        """Build a principal from a `User` row."""
+        return cls(
+            id=user.id,
+            email=user.email,
+            role=Role(user.role),
+            token_version=user.token_version,
+            is_verified=bool(user.is_verified),
+            is_enabled=bool(user.is_enabled),
+            is_deleted=bool(user.is_deleted),
+            full_name=user.full_name,
+            stag=user.stag,
+            preferred_currency=(
+                Currency(user.preferred_currency) if user.preferred_currency else None
+            ),
+        )
+
+    @classmethod
+    def from_cache(cls, data: Mapping[str, Any]) -> "Principal":
+        """Rebuild a principal from `to_cache` output read back from the cache."""
+        user_id = data["id"]
+        currency = data.get("preferred_currency")
+        return cls(
+            id=user_id if isinstance(user_id, UUID) else UUID(user_id),
+            email=data["email"],
+            role=Role(data["role"]),
+            token_version=data["token_version"],
+            is_verified=data["is_verified"],
+            is_enabled=data["is_enabled"],
+            is_deleted=data["is_deleted"],
+            full_name=data.get("full_name"),
+            stag=data.get("stag"),
+            preferred_currency=Currency(currency) if currency else None,
+        )
+
+    def to_cache(self) -> dict[str, Any]:
+        """Plain values that round-trip through either cache codec."""
+        return {
+            "id": str(self.id),
+            "email": self.email,
+            "role": self.role.value,
+            "token_version": self.token_version,
+            "is_verified": self.is_verified,
+            "is_enabled": self.is_enabled,
+            "is_deleted": self.is_deleted,
+            "full_name": self.full_name,
+            "stag": self.stag,
+            "preferred_currency": (
+                self.preferred_currency.value if self.preferred_currency else None
+            ),
+        }
@@ -1,5 +1,6 @@
 # app/core/setup/lifespan.py
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -16,19 +17,44 @@ async def run_lifespan(app: FastAPI):
     """
     FastAPI lifespan context:
     - Startup: initialize test accounts (dev), soft-delete simulation, set timezone, start scheduler
-    - Shutdown: stop scheduler
+      and scheduled transaction processor, start local cache invalidation listener,
+      latency metrics flusher and system metrics sampler
+    - Shutdown: stop scheduler, transaction processor, invalidation listener, metrics flusher
+      (flushing what is left), system metrics sampler and password hashing processes
     """
     from app.core.middleware.logging import cleanup_old_logs
+    from app.core.security.password_hasher import password_hasher
     from app.core.setup.redis import redis_client
+    from app.core.utils.cache import listen_for_invalidations
     from app.core.tasks.cron_jobs import (anonymize_soft_deleted_users,
-                                          process_scheduled_transactions)
+                                          process_scheduled_transactions,
+                                          run_due_time_scheduler)
     from app.infra.database.init_db import init_test_accounts
     from app.infra.database.session import set_utc_timezone
+    from app.infra.metrics.health import health_monitor
+    from app.infra.metrics.latency import (latency_histograms,
+                                           run_metrics_flusher)
 
     print(f"\n[STARTUP INFO] (i) Environment: {settings.APP_ENV}\n", flush=True)
 
     app.state.redis = redis_client
 
+    # --- Local cache tier: evict entries invalidated by other workers ---
+    invalidation_listener = None
+    if settings.LOCAL_CACHE_ENABLED:
+        invalidation_listener = asyncio.create_task(
+            listen_for_invalidations(redis_client)
+        )
+
+    # --- Latency histograms: merge this worker's counts into Redis ---
+    metrics_flusher = asyncio.create_task(
+        run_metrics_flusher(redis_client, settings.METRICS_FLUSH_INTERVAL_SECONDS)
+    )
+    # --- Health: CPU/memory sampled off the request path ---
+    system_sampler = asyncio.create_task(
+        health_monitor.run_sampler(settings.HEALTH_SAMPLE_INTERVAL_SECONDS)
+    )
+
     if settings.APP_ENV == "development":
         # 1. Initialize test accounts if missing
         await init_test_accounts()
@@ -57,19 +83,24 @@ async def run_lifespan(app: FastAPI):
         replace_existing=True,
     )
 
-    # --- Scheduled transaction processor (runs every minute) ---
-    async def run_scheduled_tx_job():
-        await process_scheduled_transactions()
-
-    scheduler.add_job(
-        run_scheduled_tx_job,
-        trigger="interval",
-        hours=24,
-        id="process_scheduled_transactions",
-        max_instances=1,
-        coalesce=True,
-        replace_existing=True,
-    )
+    # --- Scheduled transaction processor ---
+    due_time_scheduler = None
+    if settings.SCHEDULED_TX_SCHEDULER == "due_time":
+        # Wakes up when the earliest schedule falls due
+        due_time_scheduler = asyncio.create_task(run_due_time_scheduler(redis_client))
+    else:
+        async def run_scheduled_tx_job():
+            await process_scheduled_transactions()
+
+        scheduler.add_job(
+            run_scheduled_tx_job,
+            trigger="interval",
+            seconds=settings.SCHEDULED_TX_POLL_INTERVAL_SECONDS,
+            id="process_scheduled_transactions",
+            max_instances=1,
+            coalesce=True,
+            replace_existing=True,
+        )
 
     scheduler.start()
     print(
@@ -77,15 +108,33 @@ async def run_lifespan(app: FastAPI):
         f"{settings.HARD_DELETE_CRON_INTERVAL_HOURS} hour(s)\n",
         flush=True,
     )
-    print(
-        "[STARTUP INFO] (i) Scheduled transaction processor running every minute\n",
-        flush=True,
-    )
+    if due_time_scheduler:
+        print(
+            "[STARTUP INFO] (i) Scheduled transaction processor waking at the next due time\n",
+            flush=True,
+        )
+    else:
+        print(
+            f"[STARTUP INFO] (i) Scheduled transaction processor running every "
+            f"{settings.SCHEDULED_TX_POLL_INTERVAL_SECONDS} second(s)\n",
+            flush=True,
+        )
 
     # --- Yield control to app ---
     yield
 
     # --- Shutdown tasks ---
     scheduler.shutdown()
+    if due_time_scheduler:
+        due_time_scheduler.cancel()
+    if invalidation_listener:
+        invalidation_listener.cancel()
+    metrics_flusher.cancel()
+    system_sampler.cancel()
+    try:
+        await latency_histograms.flush(app.state.redis)
+    except Exception:
+        pass  # Redis unavailable; this worker's last counts are lost
+    password_hasher.shutdown()
     await app.state.redis.close()
     print("[SHUTDOWN INFO] Scheduler shut down\n", flush=True)
@@ -4,4 +4,5 @@ import redis.asyncio as redis
 
 from app.core.config import settings
 
-redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+# Raw bytes: cached values are binary frames (see app/core/utils/cache_codec.py)
+redis_client = redis.from_url(settings.REDIS_URL, decode_responses=False)
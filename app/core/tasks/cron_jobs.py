@@ -1,25 +1,28 @@
+import asyncio
 import logging
+import time
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Optional
+from typing import Collection, Optional
+from uuid import UUID
 
-from sqlalchemy.orm import selectinload
-from sqlmodel import select
+from redis.asyncio import Redis
 
 from app.core.config import settings
-from app.core.security.hashing import generate_random_password_hash
+from app.core.security.hashing import UNUSABLE_PASSWORD_HASH
 from app.core.setup.redis import redis_client
-from app.core.utils.cache import invalidate_cache
+from app.core.utils.cache import invalidate_many
 from app.infra.database.session import AsyncSessionLocal
-from app.modules.gdpr.helpers import snapshot_gdpr_for_anonymization
+from app.modules.gdpr.repository import GDPRRepository
 from app.modules.group.models import GroupMember
 from app.modules.group.repository import GroupRepository
 from app.modules.ims.models import ScheduledTransaction
 from app.modules.ims.repository import IMSRepository
 from app.modules.notifications.email.service import EmailNotificationService
 from app.modules.shared.enums import (Currency, DestinationType, GroupRole,
-                                      NotificationType, Role,
-                                      TransactionStatus, TransactionType)
+                                      NotificationType, TransactionStatus,
+                                      TransactionType)
 from app.modules.shared.helpers import transform_time
 from app.modules.user.models import User
 from app.modules.user.repository import UserRepository
@@ -28,80 +31,445 @@ from app.modules.wallet.repository import WalletRepository
 
 logger = logging.getLogger("savings")
 
+# Concurrent senders draining the scheduled transaction notification queue
+NOTIFICATION_SENDERS = 4
+# Pub/sub channel announcing new schedules to the due-time schedulers
+SCHEDULER_WAKEUP_CHANNEL = "scheduled_tx_wakeup"
 
-async def anonymize_soft_deleted_users() -> None:
+
+async def anonymize_soft_deleted_users() -> int:
     """
-    Async version: Anonymize users soft-deleted > retention_days ago.
+    Anonymize users soft-deleted > retention_days ago.
     Scrubs PII while keeping accounts for financial/audit purposes.
+
+    Users are claimed in ID order, ANONYMIZATION_BATCH_SIZE at a time with
+    FOR UPDATE SKIP LOCKED; each chunk's GDPR requests are snapshotted and its
+    users scrubbed with one set-based UPDATE each, then committed. Memory use
+    stays flat however large the backlog is, and a run that stops part way
+    leaves only committed chunks behind: the rest is picked up next time.
+
+    Returns:
+        The number of users anonymized.
     """
     retention_days = settings.HARD_DELETE_RETENTION_DAYS or 14
     cutoff_date = datetime.now(timezone.utc) - timedelta(days=retention_days)
+    batch_size = max(settings.ANONYMIZATION_BATCH_SIZE, 1)
+
+    started = time.perf_counter()
+    anonymized = 0
+    chunks = 0
+    last_id: Optional[UUID] = None
 
     async with AsyncSessionLocal() as db:
-        stmt = (
-            select(User)
-            .options(
-                selectinload(User.gdpr_requests)
-            )  # eager load to avoid lazy loading
-            .where(
-                User.is_deleted == True,
-                User.is_anonymized == False,
-                User.deleted_at <= cutoff_date,
+        user_repo = UserRepository(db)
+        gdpr_repo = GDPRRepository(db)
+
+        while True:
+            user_ids = await user_repo.claim_users_to_anonymize(
+                cutoff_date, batch_size, after_id=last_id
             )
-        )
-        result = await db.execute(stmt)
-        users_to_anonymize = result.scalars().all()
+            if not user_ids:
+                break
 
-        for user in users_to_anonymize:
             # Snapshot GDPR requests before PII is scrubbed
-            await snapshot_gdpr_for_anonymization(db, user)
-
-            # PII scrub
-            user.full_name = None
-            user.email = f"deleted_{user.id}@anonymized.local"
-            user.is_anonymized = True
-            user.role = Role.DELETED_USER
-            user.password_hash = generate_random_password_hash(32)
-            user.preferred_language = None
-            user.last_login_at = None
-            user.last_failed_login_at = None
-            user.failed_login_attempts = 0
-
-            db.add(user)
+            await gdpr_repo.snapshot_users_for_anonymization(user_ids)
+            await user_repo.anonymize_users(user_ids, UNUSABLE_PASSWORD_HASH)
+            await db.commit()
+
+            chunks += 1
+            anonymized += len(user_ids)
+            last_id = user_ids[-1]
+            elapsed = time.perf_counter() - started
+            logger.info(
+                f"Anonymization chunk {chunks}: {len(user_ids)} users "
+                f"({anonymized} total, {anonymized / elapsed:.0f} users/s)"
+            )
 
-        await db.commit()
+    if anonymized:
+        logger.info(
+            f"Anonymized {anonymized} users in {chunks} chunks "
+            f"({time.perf_counter() - started:.2f}s)"
+        )
+    return anonymized
 
 
-async def process_scheduled_transactions() -> None:
+async def process_scheduled_transactions(
+    failed_ids: Optional[set[UUID]] = None,
+) -> int:
     """
     Process all active scheduled transactions where next_run_at <= NOW().
     Executes the transfer and updates next_run_at or marks as COMPLETED.
+
+    SCHEDULED_TX_CONCURRENCY loops, each with its own session, repeatedly claim
+    up to SCHEDULED_TX_BATCH_SIZE due transactions with FOR UPDATE SKIP LOCKED
+    and execute them with one commit per batch. Claimed rows are invisible to
+    other claimers, so any number of workers or nodes can run this job at the
+    same time and split the work. Notifications are queued once their batch is
+    committed and sent in the background.
+
+    A transaction that fails even on its own is not claimed again by any loop
+    in the same run.
+
+    Args:
+        failed_ids (Optional[set[UUID]]): Collects the IDs of transactions that
+            failed even on their own and stay due.
+
+    Returns:
+        The number of transactions settled (executed, rescheduled or failed
+        permanently); transactions that hit an error stay due.
     """
-    async with AsyncSessionLocal() as db:
-        ims_repo = IMSRepository(db)
-        transactions = await ims_repo.get_active_due_transactions()
+    if failed_ids is None:
+        failed_ids = set()
+    notification_manager = EmailNotificationService()
+    notifications: asyncio.Queue = asyncio.Queue()
+    senders = [
+        asyncio.create_task(_send_notifications(notifications, notification_manager))
+        for _ in range(NOTIFICATION_SENDERS)
+    ]
+    try:
+        results = await asyncio.gather(
+            *(
+                _claim_and_process(notifications, failed_ids)
+                for _ in range(max(settings.SCHEDULED_TX_CONCURRENCY, 1))
+            ),
+            return_exceptions=True,
+        )
+        await notifications.join()
+    finally:
+        for sender in senders:
+            sender.cancel()
+
+    settled = 0
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error(f"Scheduled transaction processing stopped early: {result}")
+        else:
+            settled += result
+    if settled:
+        logger.info(f"Processed {settled} scheduled transactions")
+    return settled
 
-        if not transactions:
-            return
 
-        logger.info(f"Processing {len(transactions)} scheduled transactions")
+async def _claim_and_process(
+    notifications: asyncio.Queue, failed_ids: set[UUID]
+) -> int:
+    """
+    Claim and execute batches of due transactions in one session until none
+    are left.
 
-        group_repo = GroupRepository(db)
-        wallet_repo = WalletRepository(db)
-        user_repo = UserRepository(db)
-        notification_manager = EmailNotificationService()
+    `failed_ids` is shared by all loops of a run: rows that failed even on
+    their own stay due, and no loop claims them again in this run.
+
+    Returns:
+        The number of transactions settled.
+    """
+    batch_size = max(settings.SCHEDULED_TX_BATCH_SIZE, 1)
+    claimed = failed = 0
 
-        for tx in transactions:
+    async with AsyncSessionLocal() as db:
+        ims_repo = IMSRepository(db)
+        while True:
+            transactions = await ims_repo.claim_due_transactions(
+                batch_size, exclude_ids=failed_ids
+            )
+            if not transactions:
+                return claimed - failed
+
+            tx_ids = [tx.id for tx in transactions]
+            claimed += len(tx_ids)
             try:
-                await _process_single_transaction(
-                    db, tx, group_repo, wallet_repo, user_repo, notification_manager
+                updated_user_ids, pending = await _process_batch(db, transactions)
+                await db.commit()
+            except Exception as e:
+                logger.error(
+                    f"Scheduled transaction batch failed, retrying one by one: {e}"
                 )
+                # The rollback releases the rows; keep the other loops off them
+                # while this one retries them
+                failed_ids.update(tx_ids)
+                await db.rollback()
+                try:
+                    updated_user_ids, batch_failed_ids = await _process_individually(
+                        db, tx_ids, notifications
+                    )
+                finally:
+                    failed_ids.difference_update(tx_ids)
+                failed_ids.update(batch_failed_ids)
+                failed += len(batch_failed_ids)
+                pending = []
+
+            await invalidate_wallet_caches(updated_user_ids)
+            for notification in pending:
+                notifications.put_nowait(notification)
+
+
+async def _process_batch(
+    db, transactions: list[ScheduledTransaction]
+) -> tuple[set, list[dict]]:
+    """
+    Execute a batch of claimed scheduled transactions with bulk reads and
+    writes. Users, wallets (locked) and groups are loaded with one IN-query each
+    and the balance changes are applied as executemany UPDATEs. Does not commit.
+
+    Returns:
+        The IDs of the users whose wallets changed, and the notifications to
+        send once the chunk is committed.
+    """
+    group_repo = GroupRepository(db)
+    wallet_repo = WalletRepository(db)
+    user_repo = UserRepository(db)
+
+    user_ids = {tx.user_id for tx in transactions}
+    users = {user.id: user for user in await user_repo.get_by_ids(user_ids)}
+    wallets = {
+        wallet.user_id: wallet
+        for wallet in await wallet_repo.get_wallets_by_user_ids(
+            user_ids, for_update=True
+        )
+    }
+    group_ids = {_target_group_id(tx) for tx in transactions} - {None}
+    groups = {group.id: group for group in await group_repo.get_groups_by_ids(group_ids)}
+
+    available = {
+        wallet.id: Decimal(str(wallet.total_balance))
+        - Decimal(str(wallet.locked_amount))
+        for wallet in wallets.values()
+    }
+    locked_deltas = defaultdict(Decimal)
+    group_deltas = defaultdict(Decimal)
+    member_deltas = defaultdict(Decimal)
+    wallet_txs = []
+    updated_user_ids = set()
+    pending = []
+
+    for tx in transactions:
+        user = users.get(tx.user_id)
+        wallet = wallets.get(tx.user_id)
+        target_group_id = _target_group_id(tx)
+        group = groups.get(target_group_id)
+
+        if not user or not wallet or not group:
+            logger.error(
+                f"User, wallet or target group {target_group_id} not found for "
+                f"transaction {tx.id}. Marking FAILED."
+            )
+            tx.status = TransactionStatus.FAILED
+            continue
+
+        if available[wallet.id] < tx.amount:
+            logger.warning(
+                f"Insufficient funds for user {user.id}. Skipping execution for now."
+            )
+            _advance_schedule(tx)
+            continue
+
+        available[wallet.id] -= tx.amount
+        locked_deltas[wallet.id] += tx.amount
+        group_deltas[group.id] += tx.amount
+        member_deltas[(group.id, user.id)] += tx.amount
+
+        tx_type = _savings_transaction_type(tx)
+        wallet_txs.append(
+            Transaction(
+                wallet_id=wallet.id,
+                owner_id=user.id,
+                amount=-float(tx.amount),
+                type=tx_type,
+                description=f"Scheduled execution: {tx.destination_type.value} {group.name}",
+                status=TransactionStatus.COMPLETED,
+            )
+        )
+        await group_repo.create_group_transaction_message(
+            group.id, user.id, tx.amount, tx_type
+        )
+        pending.append(
+            _contribution_notification(
+                user, group, tx, group.current_balance + group_deltas[group.id]
+            )
+        )
+
+        _advance_schedule(tx)
+        updated_user_ids.add(user.id)
+
+    db.add_all(wallet_txs)
+    await wallet_repo.update_locked_amounts(locked_deltas)
+    await group_repo.update_group_balances(group_deltas)
+    await group_repo.update_member_contributions(member_deltas)
+    await user_repo.apply_transactions_to_summary(wallet_txs)
+
+    logger.info(
+        f"Executed {len(wallet_txs)} of {len(transactions)} scheduled transactions in batch"
+    )
+    return updated_user_ids, pending
+
+
+async def _process_individually(
+    db, tx_ids: list[UUID], notifications: asyncio.Queue
+) -> tuple[set, set]:
+    """
+    Fallback for a failed batch: execute its transactions one per commit, so a
+    single bad row does not hold back the rest. Notifications are queued once
+    their transaction is committed.
+
+    Returns:
+        The IDs of the users whose wallets changed, and the IDs of the
+        transactions that failed.
+    """
+    ims_repo = IMSRepository(db)
+    group_repo = GroupRepository(db)
+    wallet_repo = WalletRepository(db)
+    user_repo = UserRepository(db)
+    updated_user_ids = set()
+    failed_ids = set()
+
+    for tx_id in tx_ids:
+        pending: list[dict] = []
+        try:
+            # Re-claim each row: the rollback released the batch's locks
+            transactions = await ims_repo.claim_due_transactions(1, tx_ids=[tx_id])
+            if not transactions:
+                continue
+
+            user_id = await _process_single_transaction(
+                db,
+                transactions[0],
+                group_repo,
+                wallet_repo,
+                user_repo,
+                pending,
+            )
+
+            await db.commit()
+
+            if user_id:
+                updated_user_ids.add(user_id)
+            for notification in pending:
+                notifications.put_nowait(notification)
+
+        except Exception as e:
+            logger.error(f"Failed to process scheduled transaction {tx_id}: {e}")
+            await db.rollback()
+            failed_ids.add(tx_id)
+
+    return updated_user_ids, failed_ids
 
-                await db.commit()
 
+async def _send_notifications(
+    queue: asyncio.Queue, notification_manager: EmailNotificationService
+) -> None:
+    """Send queued contribution notifications until cancelled."""
+    while True:
+        notification = await queue.get()
+        try:
+            await notification_manager.send(**notification)
+        except Exception as e:
+            logger.error(f"Scheduled transaction notification failed: {e}")
+        finally:
+            queue.task_done()
+
+
+async def run_due_time_scheduler(redis: Redis) -> None:
+    """
+    Run `process_scheduled_transactions` as soon as the earliest active
+    schedule falls due, instead of polling on a fixed interval.
+
+    Sleeps until the earliest next_run_at (one lookup on the partial due-time
+    index), for at most SCHEDULED_TX_POLL_INTERVAL_SECONDS, and wakes up early
+    when a schedule is confirmed on any worker (see `wake_scheduler`). Runs for
+    the lifetime of the worker.
+    """
+    wakeup = asyncio.Event()
+    listener = asyncio.create_task(_listen_for_wakeups(redis, wakeup))
+    poll_interval = settings.SCHEDULED_TX_POLL_INTERVAL_SECONDS
+
+    try:
+        while True:
+            # Cleared before the lookup, so a confirm racing with it still wakes us
+            wakeup.clear()
+            try:
+                delay = await _seconds_until_next_due(poll_interval)
+                if delay <= 0:
+                    failed_ids: set[UUID] = set()
+                    if await process_scheduled_transactions(failed_ids):
+                        continue
+                    # Nothing settled: the due rows keep failing or are held by
+                    # another worker. Sleep until the next row that did not just
+                    # fail; failing rows are retried on the next run.
+                    delay = await _seconds_until_next_due(
+                        poll_interval, exclude_ids=failed_ids
+                    )
+                    if delay <= 0:
+                        delay = poll_interval
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logger.error(f"Failed to process scheduled transaction {tx.id}: {e}")
-                await db.rollback()
+                logger.error(f"Scheduled transaction scheduler error: {e}")
+                delay = poll_interval
+
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        listener.cancel()
+
+
+async def _seconds_until_next_due(
+    limit: float, exclude_ids: Collection[UUID] = ()
+) -> float:
+    """Seconds until the earliest active schedule is due, capped at `limit`."""
+    async with AsyncSessionLocal() as db:
+        next_due_at = await IMSRepository(db).get_next_due_at(exclude_ids)
+    if next_due_at is None:
+        return limit
+    return min((next_due_at - datetime.now(timezone.utc)).total_seconds(), limit)
+
+
+async def _listen_for_wakeups(redis: Redis, wakeup: asyncio.Event) -> None:
+    """Set `wakeup` whenever any worker announces a new schedule."""
+    while True:
+        pubsub = redis.pubsub()
+        try:
+            await pubsub.subscribe(SCHEDULER_WAKEUP_CHANNEL)
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    wakeup.set()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Scheduler wake-up listener disconnected: {e}")
+            # Re-check the due time in case a wake-up was missed
+            wakeup.set()
+            await asyncio.sleep(1)
+        finally:
+            await pubsub.reset()
+
+
+async def wake_scheduler(redis: Redis) -> None:
+    """
+    Make the due-time schedulers of all workers re-read the earliest due time,
+    e.g. after a schedule was confirmed. Best effort: schedulers poll at least
+    every SCHEDULED_TX_POLL_INTERVAL_SECONDS anyway.
+    """
+    try:
+        await redis.publish(SCHEDULER_WAKEUP_CHANNEL, b"1")
+    except Exception as e:
+        logger.warning(f"Failed to wake the transaction scheduler: {e}")
+
+
+async def invalidate_wallet_caches(user_ids) -> None:
+    """
+    Drop cached wallet data (balance, transaction pages) of the given users
+    in a single Redis round-trip.
+    """
+    if not user_ids:
+        return
+    try:
+        await invalidate_many(
+            redis_client, tags=[f"wallet:{user_id}" for user_id in user_ids]
+        )
+    except Exception as e:
+        logger.warning(f"Redis invalidation failed: {e}")
 
 
 async def _process_single_transaction(
@@ -110,10 +478,19 @@ async def _process_single_transaction(
     group_repo: GroupRepository,
     wallet_repo: WalletRepository,
     user_repo: UserRepository,
-    notification_manager: EmailNotificationService,
+    pending: list[dict],
 ):
     """
-    Execute logic for a single scheduled transaction.
+    Execute logic for a single scheduled transaction. Does not commit.
+
+    The contribution notification is appended to `pending` (as keyword
+    arguments of `send`) instead of being sent, so no email goes out while the
+    row is locked or before the transaction is committed.
+
+    Returns:
+        The ID of the user whose wallet changed, or None if nothing was executed.
+        Callers invalidate that user's wallet cache and send `pending` after
+        committing.
     """
     user = await user_repo.get_by_id(tx.user_id)
     if not user:
@@ -131,9 +508,7 @@ async def _process_single_transaction(
         db.add(tx)
         return
 
-    target_group_id = (
-        tx.group_id if tx.destination_type == DestinationType.GROUP else tx.goal_id
-    )
+    target_group_id = _target_group_id(tx)
 
     if not target_group_id:
         logger.error(
@@ -161,11 +536,7 @@ async def _process_single_transaction(
 
     await wallet_repo.update_locked_amount(wallet.id, tx.amount)
 
-    tx_type = (
-        TransactionType.INDIVIDUAL_SAVINGS_DEPOSIT
-        if tx.destination_type == DestinationType.GOAL
-        else TransactionType.GROUP_SAVINGS_DEPOSIT
-    )
+    tx_type = _savings_transaction_type(tx)
 
     wallet_tx = Transaction(
         wallet_id=wallet.id,
@@ -176,6 +547,7 @@ async def _process_single_transaction(
         status=TransactionStatus.COMPLETED,
     )
     db.add(wallet_tx)
+    await user_repo.apply_transaction_to_summary(wallet_tx)
 
     await group_repo.update_group_balance(group.id, tx.amount)
 
@@ -185,39 +557,51 @@ async def _process_single_transaction(
         group.id, user.id, tx.amount, tx_type
     )
 
-    try:
-        await invalidate_cache(redis_client, f"wallet_transactions:{user.id}:*")
-        await invalidate_cache(redis_client, f"wallet_balance:{user.id}")
-    except Exception as e:
-        logger.warning(f"Redis invalidation failed: {e}")
+    pending.append(
+        _contribution_notification(user, group, tx, group.current_balance + tx.amount)
+    )
+
+    logger.info(
+        f"Successfully executed scheduled transaction {tx.id} for user {user.id}"
+    )
+
+    _advance_schedule(tx)
+    db.add(tx)
+
+    return user.id
+
+
+def _target_group_id(tx: ScheduledTransaction) -> Optional[UUID]:
+    return tx.group_id if tx.destination_type == DestinationType.GROUP else tx.goal_id
+
 
+def _savings_transaction_type(tx: ScheduledTransaction) -> TransactionType:
+    return (
+        TransactionType.INDIVIDUAL_SAVINGS_DEPOSIT
+        if tx.destination_type == DestinationType.GOAL
+        else TransactionType.GROUP_SAVINGS_DEPOSIT
+    )
+
+
+def _contribution_notification(
+    user: User, group, tx: ScheduledTransaction, group_balance: Decimal
+) -> dict:
+    """Keyword arguments of `send` for a contribution notification."""
     context = {
         "contributor_name": user.full_name or user.email,
         "group_name": group.name,
         "contribution_amount": f"{float(tx.amount):,.2f}".rstrip("0").rstrip("."),
         "currency": tx.currency,
-        "group_current_balance": f"{float(group.current_balance + tx.amount):,.2f}".rstrip(
-            "0"
-        ).rstrip(
+        "group_current_balance": f"{float(group_balance):,.2f}".rstrip("0").rstrip(
             "."
         ),
         "transaction_date": transform_time(datetime.now(timezone.utc)),
     }
-
-    await notification_manager.schedule(
-        notification_manager.send,
-        background_tasks=None,  # Await immediately
-        notification_type=NotificationType.GROUP_CONTRIBUTION_NOTIFICATION,
-        recipients=[user.email],
-        context=context,
-    )
-
-    logger.info(
-        f"Successfully executed scheduled transaction {tx.id} for user {user.id}"
-    )
-
-    _advance_schedule(tx)
-    db.add(tx)
+    return {
+        "notification_type": NotificationType.GROUP_CONTRIBUTION_NOTIFICATION,
+        "recipients": [user.email],
+        "context": context,
+    }
 
 
 def _advance_schedule(tx: ScheduledTransaction):
@@ -1,65 +1,663 @@
 # app/core/utils/cache.py
 
+import asyncio
 import fnmatch
-import json
-from typing import Any, Callable, Optional
+import secrets
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Optional
 
 from pydantic import BaseModel
 from redis.asyncio import Redis
 
 from app.core.config import settings
 from app.core.middleware.logging import logger
+from app.core.utils import cache_codec
 from app.core.utils.helpers import mask_data
 
+_MISSING = object()
 
+
+def _is_pattern(key: str) -> bool:
+    """Return True if the key contains Redis glob characters."""
+    return any(char in key for char in "*?[")
+
+
+# ---------------------------
+# In-process (local) tier
+# ---------------------------
+class LocalCache:
+    """
+    Bounded per-worker LRU cache that sits in front of Redis.
+
+    Entries expire after their TTL, and the least recently used entries are
+    evicted once either the entry count or the approximate payload size
+    (length of the serialized value) exceeds its limit.
+
+    Values are stored already decoded, so callers must treat them as read-only.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[float, int, Any]] = OrderedDict()
+        self._size_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def get(self, key: str) -> Any:
+        """Return the cached value, or `_MISSING` if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+
+        expires_at, _, value = entry
+        if expires_at <= time.monotonic():
+            self.delete(key)
+            return _MISSING
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: int, size: int) -> None:
+        """Store a value for `ttl` seconds, evicting LRU entries when over budget."""
+        if size > self.max_bytes:
+            return
+
+        self.delete(key)
+        self._entries[key] = (time.monotonic() + ttl, size, value)
+        self._size_bytes += size
+
+        while (
+            len(self._entries) > self.max_entries or self._size_bytes > self.max_bytes
+        ):
+            _, (_, evicted_size, _) = self._entries.popitem(last=False)
+            self._size_bytes -= evicted_size
+            cache_stats.local_evictions += 1
+
+    def delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= entry[1]
+
+    def delete_pattern(self, pattern: str) -> None:
+        """Delete every key matching a Redis-style glob pattern."""
+        if not _is_pattern(pattern):
+            self.delete(pattern)
+            return
+        for key in [k for k in self._entries if fnmatch.fnmatchcase(k, pattern)]:
+            self.delete(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size_bytes = 0
+
+
+class CacheStats:
+    """Per-worker hit/miss counters for each cache tier."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.local_hits = 0
+        self.local_misses = 0
+        self.local_evictions = 0
+        self.redis_hits = 0
+        self.redis_misses = 0
+        self.stale_hits = 0
+        self.coalesced_misses = 0
+
+    def snapshot(self) -> dict[str, int]:
+        return {
+            "local_hits": self.local_hits,
+            "local_misses": self.local_misses,
+            "local_evictions": self.local_evictions,
+            "local_entries": len(local_cache),
+            "local_size_bytes": local_cache.size_bytes,
+            "redis_hits": self.redis_hits,
+            "redis_misses": self.redis_misses,
+            "stale_hits": self.stale_hits,
+            "coalesced_misses": self.coalesced_misses,
+        }
+
+
+local_cache = LocalCache(
+    max_entries=settings.LOCAL_CACHE_MAX_ENTRIES,
+    max_bytes=settings.LOCAL_CACHE_MAX_BYTES,
+)
+cache_stats = CacheStats()
+
+
+def _resolve_local_ttl(ttl: Optional[int], local_ttl: Optional[int]) -> int:
+    """Return the local-tier TTL for a key, or 0 if the local tier is not used."""
+    if not settings.LOCAL_CACHE_ENABLED:
+        return 0
+    if local_ttl is None:
+        local_ttl = settings.LOCAL_CACHE_TTL
+    if ttl:
+        local_ttl = min(local_ttl, ttl)
+    return max(local_ttl, 0)
+
+
+# ---------------------------
+# Single-flight fills
+# ---------------------------
+# Fetches in progress in this worker, keyed by cache key
+_inflight: dict[str, asyncio.Future] = {}
+# Strong references to background refreshes so they are not garbage collected
+_refresh_tasks: set[asyncio.Task] = set()
+
+# Envelope field holding the freshness deadline of stale-while-revalidate entries
+_FRESH_UNTIL = "__fresh_until__"
+
+# SET the value, add the key to each tag set and keep every tag set alive at
+# least as long as the keys it tracks. KEYS = [key, *tag_keys], ARGV = [payload, ttl]
+_SET_TAGGED_SCRIPT = """
+redis.call("set", KEYS[1], ARGV[1], "EX", ARGV[2])
+for i = 2, #KEYS do
+    redis.call("sadd", KEYS[i], KEYS[1])
+    if redis.call("ttl", KEYS[i]) < tonumber(ARGV[2]) then
+        redis.call("expire", KEYS[i], ARGV[2])
+    end
+end
+return 1
+"""
+
+# Unlink every key tracked by the given tag sets (and the sets themselves),
+# announce them on the invalidation channel (if given) and return them.
+# KEYS = tag_keys, ARGV = [channel or ""]
+_INVALIDATE_TAGS_SCRIPT = """
+local removed = {}
+for i = 1, #KEYS do
+    local members = redis.call("smembers", KEYS[i])
+    for j = 1, #members, 500 do
+        redis.call("unlink", unpack(members, j, math.min(j + 499, #members)))
+    end
+    for _, member in ipairs(members) do
+        table.insert(removed, member)
+    end
+    redis.call("unlink", KEYS[i])
+end
+if ARGV[1] ~= "" and #removed > 0 then
+    redis.call("publish", ARGV[1], table.concat(removed, "\n"))
+end
+return removed
+"""
+
+# Same as _SET_TAGGED_SCRIPT, but only if `version` is not older than the one
+# last stored for the key, so a slow writer cannot overwrite a newer value.
+# Versions live in a companion key that tag invalidation leaves in place.
+# First drops every other key tracked by the invalidated tag sets, so derived
+# entries and the new value change in one atomic step. Announces the removed
+# and stored keys on the invalidation channel (if given).
+# KEYS = [key, version_key, *tag_keys, *invalidated_tag_keys],
+# ARGV = [payload, ttl, version, channel or "", number of tag_keys]
+# Returns {1 if stored else 0, *removed keys}
+_SET_VERSIONED_SCRIPT = """
+local first_invalidated = 3 + tonumber(ARGV[5])
+local removed = {}
+for i = first_invalidated, #KEYS do
+    for _, member in ipairs(redis.call("smembers", KEYS[i])) do
+        if member ~= KEYS[1] then
+            redis.call("unlink", member)
+            table.insert(removed, member)
+        end
+    end
+    redis.call("unlink", KEYS[i])
+end
+
+local stored = 0
+local current = tonumber(redis.call("get", KEYS[2]))
+if not current or tonumber(ARGV[3]) >= current then
+    redis.call("set", KEYS[1], ARGV[1], "EX", ARGV[2])
+    redis.call("set", KEYS[2], ARGV[3], "EX", ARGV[2])
+    for i = 3, first_invalidated - 1 do
+        redis.call("sadd", KEYS[i], KEYS[1])
+        if redis.call("ttl", KEYS[i]) < tonumber(ARGV[2]) then
+            redis.call("expire", KEYS[i], ARGV[2])
+        end
+    end
+    stored = 1
+end
+
+local announced = {unpack(removed)}
+if stored == 1 then
+    table.insert(announced, KEYS[1])
+end
+if ARGV[4] ~= "" and #announced > 0 then
+    redis.call("publish", ARGV[4], table.concat(announced, "\n"))
+end
+table.insert(removed, 1, stored)
+return removed
+"""
+
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+async def _single_flight(key: str, fill: Callable[[], Any]) -> Any:
+    """
+    Run `fill` once per key in this worker; concurrent callers await the same result.
+
+    The shared fill runs with the resources of the caller that started it (e.g.
+    its request's DB session), so it is cancelled along with that caller. The
+    callers waiting on it then run their own `fill` instead of failing.
+    """
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(fill())
+        _inflight[key] = future
+        future.add_done_callback(lambda done: _discard_inflight(key, done))
+        return await future
+
+    cache_stats.coalesced_misses += 1
+    try:
+        # Shield so a cancelled waiter does not cancel the fill it shares
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        if not future.cancelled():
+            raise  # this waiter was cancelled
+        _discard_inflight(key, future)
+        return await _single_flight(key, fill)
+
+
+def _discard_inflight(key: str, future: asyncio.Future) -> None:
+    if _inflight.get(key) is future:
+        del _inflight[key]
+
+
+def _decode(cached: bytes) -> tuple[Any, int, bool]:
+    """Decode a Redis value into (data, payload size, is_stale)."""
+    data = cache_codec.decode(cached)
+
+    is_stale = False
+    if isinstance(data, dict) and _FRESH_UNTIL in data:
+        is_stale = data[_FRESH_UNTIL] <= time.time()
+        data = data["data"]
+    return data, len(cached), is_stale
+
+
+async def _store(
+    redis: Redis,
+    key: str,
+    stored: bytes,
+    expiry: int,
+    tags: Optional[list[str]] = None,
+    version: Optional[int] = None,
+    channel: str = "",
+    invalidate: Optional[list[str]] = None,
+) -> tuple[bool, list[str]]:
+    """
+    Write an encoded value, registering its tags.
+
+    Returns whether it was stored (False if a newer version is) and the keys
+    dropped through the `invalidate` tags, which need a `version`.
+    """
+    tag_keys = [_tag_key(tag) for tag in tags or ()]
+    if version is not None:
+        invalidated_tag_keys = [_tag_key(tag) for tag in invalidate or ()]
+        result = await redis.eval(
+            _SET_VERSIONED_SCRIPT,
+            2 + len(tag_keys) + len(invalidated_tag_keys),
+            key,
+            _version_key(key),
+            *tag_keys,
+            *invalidated_tag_keys,
+            stored,
+            expiry,
+            version,
+            channel,
+            len(tag_keys),
+        )
+        return bool(result[0]), [_to_str(removed) for removed in result[1:]]
+    if tag_keys:
+        await redis.eval(
+            _SET_TAGGED_SCRIPT, 1 + len(tag_keys), key, *tag_keys, stored, expiry
+        )
+    else:
+        await redis.set(key, stored, ex=expiry)
+    return True, []
+
+
+async def _wait_for_fill(redis: Redis, key: str) -> Any:
+    """Poll Redis until another worker fills the key, or give up after CACHE_FILL_WAIT_MS."""
+    deadline = time.monotonic() + settings.CACHE_FILL_WAIT_MS / 1000
+    while time.monotonic() < deadline:
+        await asyncio.sleep(0.05)
+        cached = await redis.get(key)
+        if cached:
+            return _decode(cached)[0]
+    return _MISSING
+
+
+async def _fill(
+    redis: Redis,
+    key: str,
+    fetch_func: Callable[[], Any],
+    ttl: int,
+    local_ttl: int,
+    stale_ttl: int,
+    tags: Optional[list[str]] = None,
+    version_field: Optional[str] = None,
+    background: bool = False,
+) -> Any:
+    """
+    Fetch and store a value while holding a Redis lock, so only one worker
+    runs `fetch_func` per key. Workers that lose the race wait for the winner's
+    value (or, for background refreshes, skip).
+    """
+    lock_key = f"lock:{key}"
+    token = secrets.token_hex(8)
+    acquired = await redis.set(
+        lock_key, token, nx=True, px=settings.CACHE_FILL_LOCK_TTL_MS
+    )
+    if not acquired:
+        if background:
+            return _MISSING
+        data = await _wait_for_fill(redis, key)
+        if data is not _MISSING:
+            return data
+        # Lock holder is too slow or gone; fetch without the lock
+
+    try:
+        data = await fetch_func()
+
+        if isinstance(data, BaseModel):
+            data = data.model_dump()
+
+        version = None
+        if version_field:
+            data = dict(data)
+            version = data.pop(version_field)
+
+        # Save to Redis with the configured codec
+        payload = cache_codec.encode(data)
+        stored, expiry = payload, ttl
+        if stale_ttl:
+            envelope = {_FRESH_UNTIL: time.time() + ttl, "data": data}
+            stored, expiry = cache_codec.encode(envelope), ttl + stale_ttl
+
+        is_stored, _ = await _store(redis, key, stored, expiry, tags, version)
+        if not is_stored:
+            # A write-through already stored a newer value; don't cache ours
+            return data
+
+        if local_ttl:
+            # Store the decoded form so local hits match what a Redis hit returns
+            local_cache.set(
+                key, cache_codec.decode(payload), ttl=local_ttl, size=len(payload)
+            )
+        return data
+    finally:
+        if acquired:
+            await redis.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+
+
+def _schedule_refresh(
+    redis: Redis,
+    key: str,
+    fetch_func: Callable[[], Any],
+    ttl: int,
+    local_ttl: int,
+    stale_ttl: int,
+    tags: Optional[list[str]],
+    version_field: Optional[str],
+) -> None:
+    """Refresh a stale key in the background, once per key across workers."""
+    if key in _inflight:
+        return
+
+    async def fill():
+        return await _fill(
+            redis,
+            key,
+            fetch_func,
+            ttl,
+            local_ttl,
+            stale_ttl,
+            tags,
+            version_field,
+            background=True,
+        )
+
+    def on_done(task: asyncio.Task):
+        _refresh_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.warning(
+                f"CACHE REFRESH FAILED: {mask_data(key)}: {task.exception()}"
+            )
+
+    task = asyncio.ensure_future(_single_flight(key, fill))
+    _refresh_tasks.add(task)
+    task.add_done_callback(on_done)
+
+
+# ---------------------------
+# Read / write
+# ---------------------------
 async def cache_or_get(
-    redis: Redis, key: str, fetch_func: Callable[[], Any], ttl: int = settings.CACHE_TTL
+    redis: Redis,
+    key: str,
+    fetch_func: Callable[[], Any],
+    ttl: int = settings.CACHE_TTL,
+    local_ttl: Optional[int] = None,
+    stale_ttl: int = 0,
+    tags: Optional[list[str]] = None,
+    version_field: Optional[str] = None,
 ):
     """
-    Check if key exists in redis, if yes, return json of cached data
-    If no, add key and data to redis.
+    Check if key exists in the local tier or redis, if yes, return cached data.
+    If no, add key and data to redis (and the local tier).
+
+    Concurrent misses for the same key share one `fetch_func` call: in-process
+    through an asyncio guard, and across workers through a Redis lock. If the
+    caller running the shared call is cancelled, the others call their own.
 
     Args:
         redis (Redis): Redis client
         key (str): key id stored in redis
         fetch_func (Callable): function to retrieve data
         ttl (int): Time to live for cached data - in seconds
+        local_ttl (Optional[int]): Time to live in the in-process tier, capped at `ttl`.
+            Defaults to LOCAL_CACHE_TTL; 0 skips the local tier for this key.
+        stale_ttl (int): Seconds past `ttl` during which the expired value is
+            still returned while one task refreshes it in the background.
+            `fetch_func` must then not depend on request-scoped resources
+            (e.g. the request's DB session).
+        tags (Optional[list[str]]): Tags the key is registered under, so it can be
+            dropped with `invalidate_tags` instead of a keyspace scan.
+        version_field (Optional[str]): Field of the fetched dict holding a monotonically
+            increasing row version. It is stripped from the cached value and used to
+            keep a slow fill from overwriting a newer `write_through`.
 
     Returns:
         Data requested
     """
+    local_ttl = _resolve_local_ttl(ttl, local_ttl)
+
+    if local_ttl:
+        data = local_cache.get(key)
+        if data is not _MISSING:
+            cache_stats.local_hits += 1
+            logger.info(f"CACHE HIT (local): {mask_data(key)}")
+            return data
+        cache_stats.local_misses += 1
+
     cached = await redis.get(key)
     if cached:
+        cache_stats.redis_hits += 1
+        data, size, is_stale = _decode(cached)
+
+        if is_stale:
+            cache_stats.stale_hits += 1
+            logger.info(f"CACHE HIT (stale): {mask_data(key)}")
+            _schedule_refresh(
+                redis, key, fetch_func, ttl, local_ttl, stale_ttl, tags, version_field
+            )
+            return data
+
         logger.info(f"CACHE HIT: {mask_data(key)}")
-        # Redis returns bytes, so decode first
-        cached_str = cached.decode("utf-8") if isinstance(cached, bytes) else cached
-        try:
-            data = json.loads(cached_str)
-        except json.JSONDecodeError:
-            # If for some reason cached value is raw string, fallback
-            data = cached_str
+        if local_ttl:
+            local_cache.set(key, data, ttl=local_ttl, size=size)
         return data
 
     # Cache miss
+    cache_stats.redis_misses += 1
     logger.info(f"CACHE MISS: {mask_data(key)}")
-    data = await fetch_func()
 
+    async def fill():
+        return await _fill(
+            redis, key, fetch_func, ttl, local_ttl, stale_ttl, tags, version_field
+        )
+
+    return await _single_flight(key, fill)
+
+
+async def write_through(
+    redis: Redis,
+    key: str,
+    data: Any,
+    version: int,
+    ttl: int = settings.CACHE_TTL,
+    local_ttl: Optional[int] = None,
+    tags: Optional[list[str]] = None,
+    invalidate: Optional[list[str]] = None,
+) -> bool:
+    """
+    Store a freshly written value instead of invalidating it, so the next read
+    is a hit. Writes carrying an older `version` than the stored one are dropped,
+    and workers evict their local copy of the key.
+
+    Args:
+        redis (Redis): Redis client
+        key (str): key id stored in redis
+        data (Any): Value to cache, as `cache_or_get` would return it
+        version (int): Monotonically increasing version of the source row
+        ttl (int): Time to live for cached data - in seconds
+        local_ttl (Optional[int]): Time to live in the in-process tier (see `cache_or_get`)
+        tags (Optional[list[str]]): Tags the key is registered under
+        invalidate (Optional[list[str]]): Tags whose other keys are dropped in the
+            same atomic step (and round-trip), e.g. entries derived from the value
+
+    Returns:
+        bool: False if a newer version was already cached.
+    """
     if isinstance(data, BaseModel):
         data = data.model_dump()
 
-    # Save to Redis as JSON string
-    await redis.set(key, json.dumps(data, default=str), ex=ttl)
-    return data
+    local_ttl = _resolve_local_ttl(ttl, local_ttl)
+    channel = settings.CACHE_INVALIDATION_CHANNEL if settings.LOCAL_CACHE_ENABLED else ""
+
+    payload = cache_codec.encode(data)
+    is_stored, removed = await _store(
+        redis, key, payload, ttl, tags, version, channel, invalidate
+    )
+    if removed:
+        logger.info(f"CACHE INVALIDATED: {len(removed)} key(s)")
+    if settings.LOCAL_CACHE_ENABLED:
+        for removed_key in removed:
+            local_cache.delete(removed_key)
+
+    if not is_stored:
+        logger.info(f"CACHE WRITE SKIPPED (newer version): {mask_data(key)}")
+        return False
+
+    logger.info(f"CACHE WRITE: {mask_data(key)}")
+    if local_ttl:
+        # Every worker (this one included, via the channel) re-reads it from Redis
+        local_cache.delete(key)
+    return True
+
+
+# ---------------------------
+# Invalidation
+# ---------------------------
+def _tag_key(tag: str) -> str:
+    return f"tag:{tag}"
+
+
+def _version_key(key: str) -> str:
+    return f"ver:{key}"
+
+
+def _to_str(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+async def invalidate_many(
+    redis: Redis, keys: Iterable[str] = (), tags: Iterable[str] = ()
+) -> None:
+    """
+    Delete exact keys and every key registered under the given tags in one
+    Redis round-trip (a single command, or one pipeline when several are needed),
+    and evict them from the local tier of every worker.
+
+    Args:
+        redis (Redis): Redis client
+        keys (Iterable[str]): Exact keys, e.g. 'user_principal:{email}'
+        tags (Iterable[str]): Tags, e.g. 'wallet:{user_id}'
+    """
+    keys, tag_keys = list(keys), [_tag_key(tag) for tag in tags]
+    if not keys and not tag_keys:
+        return
+
+    local_enabled = settings.LOCAL_CACHE_ENABLED
+    channel = settings.CACHE_INVALIDATION_CHANNEL if local_enabled else ""
+
+    commands: list[tuple[str, tuple]] = []
+    if keys:
+        commands.append(("unlink", tuple(keys)))
+        if local_enabled:
+            commands.append(("publish", (channel, "\n".join(keys))))
+    if tag_keys:
+        commands.append(
+            ("eval", (_INVALIDATE_TAGS_SCRIPT, len(tag_keys), *tag_keys, channel))
+        )
+
+    if len(commands) == 1:
+        name, args = commands[0]
+        results = [await getattr(redis, name)(*args)]
+    else:
+        pipe = redis.pipeline(transaction=False)
+        for name, args in commands:
+            getattr(pipe, name)(*args)
+        results = await pipe.execute()
+
+    removed = list(keys)
+    if tag_keys:
+        removed += [_to_str(key) for key in results[-1]]
+    if removed:
+        logger.info(f"CACHE INVALIDATED: {len(removed)} key(s)")
+
+    if local_enabled:
+        for key in removed:
+            local_cache.delete(key)
 
 
 async def invalidate_cache(redis: Redis, pattern: str):
     """
-    Delete all keys matching a pattern from Redis.
+    Delete all keys matching a pattern from Redis and from the local tier of
+    every worker. Exact keys are deleted directly; glob patterns need a
+    keyspace scan, so prefer `invalidate_tags` for per-user key families.
 
     Args:
         redis (Redis): Redis client
-        pattern (str): Pattern to match keys, e.g. 'user_current:*'
+        pattern (str): Pattern to match keys, e.g. 'user_principal:*'
     """
+    if not _is_pattern(pattern):
+        await invalidate_many(redis, keys=[pattern])
+        return
+
     # Scan keys instead of KEYS for performance on large datasets
     cursor = b"0"
     while cursor:
@@ -69,3 +667,52 @@ async def invalidate_cache(redis: Redis, pattern: str):
             logger.info(f"CACHE INVALIDATED: {mask_data(pattern)}")
         if cursor == 0 or cursor == b"0":
             break
+
+    if settings.LOCAL_CACHE_ENABLED:
+        local_cache.delete_pattern(pattern)
+        await redis.publish(settings.CACHE_INVALIDATION_CHANNEL, pattern)
+
+
+async def invalidate_tags(redis: Redis, *tags: str) -> None:
+    """
+    Delete every key registered under the given tags (see `cache_or_get`),
+    in one round-trip and without scanning the keyspace.
+
+    Args:
+        redis (Redis): Redis client
+        tags (str): Tags to invalidate, e.g. 'wallet:{user_id}'
+    """
+    await invalidate_many(redis, tags=tags)
+
+
+# ---------------------------
+# Cross-worker invalidation
+# ---------------------------
+async def listen_for_invalidations(redis: Redis) -> None:
+    """
+    Evict local-tier entries announced by any worker over Redis pub/sub.
+
+    Runs for the lifetime of the worker. If the subscription drops, the local
+    tier is cleared (invalidations may have been missed) and the listener
+    reconnects.
+    """
+    while True:
+        pubsub = redis.pubsub()
+        try:
+            await pubsub.subscribe(settings.CACHE_INVALIDATION_CHANNEL)
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                patterns = message["data"]
+                if isinstance(patterns, bytes):
+                    patterns = patterns.decode("utf-8")
+                for pattern in patterns.split("\n"):
+                    local_cache.delete_pattern(pattern)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Cache invalidation listener disconnected: {e}")
+            local_cache.clear()
+            await asyncio.sleep(1)
+        finally:
+            await pubsub.reset()
@@ -0,0 +1,152 @@
+# app/core/utils/cache_codec.py
+
+import json
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Protocol
+from uuid import UUID
+
+import lz4.frame
+import msgpack
+
+from app.core.config import settings
+
+# Framed values start with a NUL byte, which can never start a legacy JSON value:
+#   b"\x00" + codec id (1 byte) + compression id (1 byte) + body
+_FRAME_MARKER = 0
+_HEADER_SIZE = 3
+
+# msgpack extension type codes
+_EXT_DATETIME = 1
+_EXT_DATE = 2
+_EXT_UUID = 3
+_EXT_DECIMAL = 4
+
+
+class Codec(Protocol):
+    id: int
+    name: str
+
+    def dumps(self, data: Any) -> bytes: ...
+
+    def loads(self, body: bytes) -> Any: ...
+
+
+class JsonCodec:
+    """JSON text, the historical cache format. Non-JSON types degrade to strings."""
+
+    id = 1
+    name = "json"
+
+    def dumps(self, data: Any) -> bytes:
+        return json.dumps(data, default=str).encode("utf-8")
+
+    def loads(self, body: bytes) -> Any:
+        return json.loads(body)
+
+
+class MsgpackCodec:
+    """
+    Binary msgpack with extension types, so datetime, date, UUID and Decimal
+    values come back as the same Python types instead of strings.
+    """
+
+    id = 2
+    name = "msgpack"
+
+    @staticmethod
+    def _default(obj: Any) -> msgpack.ExtType:
+        if isinstance(obj, datetime):
+            return msgpack.ExtType(_EXT_DATETIME, obj.isoformat().encode())
+        if isinstance(obj, date):
+            return msgpack.ExtType(_EXT_DATE, obj.isoformat().encode())
+        if isinstance(obj, UUID):
+            return msgpack.ExtType(_EXT_UUID, obj.bytes)
+        if isinstance(obj, Decimal):
+            return msgpack.ExtType(_EXT_DECIMAL, str(obj).encode())
+        # Same fallback as the JSON codec
+        return str(obj)
+
+    @staticmethod
+    def _ext_hook(code: int, data: bytes) -> Any:
+        if code == _EXT_DATETIME:
+            return datetime.fromisoformat(data.decode())
+        if code == _EXT_DATE:
+            return date.fromisoformat(data.decode())
+        if code == _EXT_UUID:
+            return UUID(bytes=data)
+        if code == _EXT_DECIMAL:
+            return Decimal(data.decode())
+        return msgpack.ExtType(code, data)
+
+    def dumps(self, data: Any) -> bytes:
+        return msgpack.packb(data, default=self._default, datetime=False)
+
+    def loads(self, body: bytes) -> Any:
+        return msgpack.unpackb(body, ext_hook=self._ext_hook, strict_map_key=False)
+
+
+CODECS: dict[str, Codec] = {codec.name: codec for codec in (JsonCodec(), MsgpackCodec())}
+_CODECS_BY_ID: dict[int, Codec] = {codec.id: codec for codec in CODECS.values()}
+
+# Compression id -> (name, compress, decompress)
+_COMPRESSIONS = {
+    0: ("none", None, None),
+    1: ("zlib", zlib.compress, zlib.decompress),
+    2: ("lz4", lz4.frame.compress, lz4.frame.decompress),
+}
+_COMPRESSION_IDS = {name: cid for cid, (name, _, _) in _COMPRESSIONS.items()}
+
+
+def encode(
+    data: Any,
+    codec: str = settings.CACHE_CODEC,
+    compression: str = settings.CACHE_COMPRESSION,
+    threshold: int = settings.CACHE_COMPRESSION_THRESHOLD,
+) -> bytes:
+    """
+    Serialize a value for Redis.
+
+    Args:
+        data (Any): Value to serialize.
+        codec (str): Codec name, "json" or "msgpack".
+        compression (str): "none", "zlib" or "lz4"; only applied to bodies of at
+            least `threshold` bytes.
+        threshold (int): Minimum body size in bytes before compressing.
+
+    Returns:
+        bytes: Framed value (header + body).
+    """
+    selected = CODECS[codec]
+    body = selected.dumps(data)
+
+    compression_id = 0
+    if compression != "none" and len(body) >= threshold:
+        compression_id = _COMPRESSION_IDS[compression]
+        body = _COMPRESSIONS[compression_id][1](body)
+
+    return bytes((_FRAME_MARKER, selected.id, compression_id)) + body
+
+
+def decode(value: bytes | str) -> Any:
+    """
+    Deserialize a value read from Redis.
+
+    Framed values are decoded with the codec recorded in their header; anything
+    else is treated as legacy JSON text, falling back to the raw string.
+    """
+    if isinstance(value, bytes) and value[:1] == bytes((_FRAME_MARKER,)):
+        codec = _CODECS_BY_ID[value[1]]
+        body = value[_HEADER_SIZE:]
+        decompress = _COMPRESSIONS[value[2]][2]
+        if decompress:
+            body = decompress(body)
+        return codec.loads(body)
+
+    text = value.decode("utf-8") if isinstance(value, bytes) else value
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        # If for some reason cached value is raw string, fallback
+        return text
@@ -3,10 +3,10 @@
 from fastapi import Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
-from slowapi.errors import RateLimitExceeded
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.core.middleware.logging import logger
+from app.core.middleware.rate_limiter import RateLimitExceeded
 
 from .response import standard_response
 
@@ -19,6 +19,7 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
             status="error", message="Rate limit exceeded. Please try again later."
         ),
         status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        headers={**exc.info.headers(), "Retry-After": str(max(exc.info.reset, 1))},
     )
 
 
@@ -41,6 +42,8 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
             status="error",
             message=exc.detail,
         ),
+        # e.g. Retry-After on 503s
+        headers=exc.headers,
     )
 
 
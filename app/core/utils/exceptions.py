@@ -43,6 +43,17 @@ class CustomException(HTTPException):
     def internal_error(cls, detail: str = "Internal Server Error."):
         return cls(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=detail)
 
+    @classmethod
+    def service_unavailable(
+        cls, detail: str = "Service Unavailable.", retry_after: Optional[int] = None
+    ):
+        headers = {"Retry-After": str(retry_after)} if retry_after else None
+        return cls(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            headers=headers,
+        )
+
     # -------------------------------------------------------------------------
     # Backward Compatibility Methods (Static Factory Methods)
     # These maintain the existing API: CustomException.e400_bad_request(...)
@@ -71,3 +82,9 @@ class CustomException(HTTPException):
     @staticmethod
     def e500_internal_server_error(detail: str = "Internal Server Error."):
         raise CustomException.internal_error(detail)
+
+    @staticmethod
+    def e503_service_unavailable(
+        detail: str = "Service Unavailable.", retry_after: Optional[int] = None
+    ):
+        raise CustomException.service_unavailable(detail, retry_after)
@@ -2,7 +2,7 @@
 
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -86,10 +86,45 @@ class PaginatedUsersResponse(BaseResponse):
     data: PaginatedUsersData
 
 
+class CacheStatsData(BaseModel):
+    local_hits: int
+    local_misses: int
+    local_evictions: int
+    local_entries: int
+    local_size_bytes: int
+    redis_hits: int
+    redis_misses: int
+    stale_hits: int
+    coalesced_misses: int
+
+
+class DbPoolStatsData(BaseModel):
+    pool_size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    wait_ms_avg: float
+    wait_ms_max: float
+    wait_histogram_ms: Dict[str, int]
+
+
+class PasswordHasherStatsData(BaseModel):
+    workers: int
+    max_pending: int
+    pending: int
+    shed: int
+
+
 class AppMetricsData(BaseModel):
     transaction_count: int
     total_balance_sum: float
     user_count: int
+    cache_stats: Optional[CacheStatsData] = None  # Counters of the serving worker
+    db_pool: Optional[DbPoolStatsData] = None  # Pool of the serving worker
+    db_replica_pool: Optional[DbPoolStatsData] = None  # Only with a read replica
+    password_hasher: Optional[PasswordHasherStatsData] = None  # Serving worker
 
 
 class AppMetricsResponse(BaseResponse):
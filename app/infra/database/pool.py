@@ -0,0 +1,96 @@
+# app/infra/database/pool.py
+
+import time
+from bisect import bisect_left
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+# Upper bounds (ms) of the checkout wait histogram buckets; a last bucket is unbounded
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class PoolStats:
+    """Per-worker connection checkout counters and wait-time histogram."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+        self.wait_histogram = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def record_wait(self, wait_ms: float) -> None:
+        self.checkouts += 1
+        self.wait_ms_total += wait_ms
+        self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+        self.wait_histogram[bisect_left(WAIT_BUCKETS_MS, wait_ms)] += 1
+
+    def snapshot(self, pool: Pool) -> dict[str, Any]:
+        """
+        Return live pool occupancy together with the recorded checkout waits.
+
+        Args:
+            pool (Pool): The engine's connection pool.
+
+        Returns:
+            dict[str, Any]: Pool size, connections checked out / idle / in overflow,
+                successful checkout, timeout and error counts, and the wait
+                histogram of successful checkouts keyed by bucket ("<=1", "<=5",
+                ..., ">5000" milliseconds).
+        """
+        labels = [f"<={bound}" for bound in WAIT_BUCKETS_MS]
+        labels.append(f">{WAIT_BUCKETS_MS[-1]}")
+        return {
+            "pool_size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            # QueuePool counts overflow from -pool_size; only report extra connections
+            "overflow": max(pool.overflow(), 0),
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "wait_ms_avg": (
+                round(self.wait_ms_total / self.checkouts, 3) if self.checkouts else 0.0
+            ),
+            "wait_ms_max": round(self.wait_ms_max, 3),
+            "wait_histogram_ms": dict(zip(labels, self.wait_histogram)),
+        }
+
+
+pool_stats = PoolStats()
+replica_pool_stats = PoolStats()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that records how long each successful checkout takes,
+    including time spent queueing for a free connection. Checkouts that time out
+    or fail to connect are only counted, so they do not skew the wait times.
+    """
+
+    stats = pool_stats
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.stats.timeouts += 1
+            raise
+        except Exception:
+            self.stats.errors += 1
+            raise
+        self.stats.record_wait((time.perf_counter() - started) * 1000)
+        return connection
+
+
+class ReplicaAsyncQueuePool(InstrumentedAsyncQueuePool):
+    """Instrumented pool of the read replica engine, with its own statistics."""
+
+    stats = replica_pool_stats
@@ -0,0 +1,121 @@
+# app/infra/database/routing.py
+
+import functools
+from contextvars import ContextVar
+from typing import Any, Optional
+from uuid import UUID
+
+from redis.asyncio import Redis
+from sqlalchemy import Engine, Select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.middleware.logging import logger
+
+# Set while a method decorated with @read_only runs
+_read_only: ContextVar[bool] = ContextVar("db_read_only", default=False)
+
+
+def read_only(func):
+    """
+    Mark an async repository method as read-only, so its plain SELECTs may be
+    served by the read replica (see `RoutingSession`).
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        token = _read_only.set(True)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _read_only.reset(token)
+
+    return wrapper
+
+
+class RoutingSession(Session):
+    """
+    Session that sends read-only SELECTs to a replica and everything else to
+    the primary.
+
+    A statement goes to the replica only if all of these hold:
+    - a replica is configured (`replica_bind`),
+    - it runs inside a `@read_only` method, or the session is marked
+      read-only (`session.info["read_only"]`),
+    - it is a plain SELECT (no FOR UPDATE) outside a flush,
+    - the session has not written yet and is not pinned to the primary by
+      the read-your-writes window (`session.info["read_your_writes"]`).
+    """
+
+    replica_bind: Optional[Engine] = None
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        primary = super().get_bind(mapper, clause=clause, **kw)
+
+        is_plain_select = (
+            isinstance(clause, Select) and clause._for_update_arg is None
+        )
+        if self._flushing or not is_plain_select:
+            # Later reads in this session must see these writes
+            self.info["has_writes"] = True
+            return primary
+
+        if (
+            self.replica_bind is not None
+            and (_read_only.get() or self.info.get("read_only"))
+            and not self.info.get("has_writes")
+            and not self.info.get("read_your_writes")
+        ):
+            return self.replica_bind
+        return primary
+
+
+# ---------------------------
+# Read-your-writes window
+# ---------------------------
+def _read_your_writes_key(user_id: Any) -> str:
+    return f"ryw:{user_id}"
+
+
+async def bind_session_to_user(
+    session: AsyncSession, redis: Redis, user_id: UUID
+) -> None:
+    """
+    Associate a request's session with its user. If the user wrote within the
+    last DB_READ_YOUR_WRITES_SECONDS, the session reads from the primary so the
+    user sees their own changes despite replica lag.
+
+    Args:
+        session (AsyncSession): The request's database session.
+        redis (Redis): Redis client.
+        user_id (UUID): The authenticated user.
+    """
+    if not settings.DB_REPLICA_HOST:
+        return
+
+    session.info["user_id"] = user_id
+    session.info["redis"] = redis
+    try:
+        if await redis.exists(_read_your_writes_key(user_id)):
+            session.info["read_your_writes"] = True
+    except Exception as e:
+        # Can't tell, so stay on the primary
+        logger.warning(f"Read-your-writes check failed: {e}")
+        session.info["read_your_writes"] = True
+
+
+async def record_user_write(session: AsyncSession) -> None:
+    """Open the read-your-writes window if the session's user wrote anything."""
+    user_id = session.info.get("user_id")
+    redis = session.info.get("redis")
+    if not (session.info.get("has_writes") and user_id and redis):
+        return
+    try:
+        await redis.set(
+            _read_your_writes_key(user_id),
+            1,
+            ex=settings.DB_READ_YOUR_WRITES_SECONDS,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to open read-your-writes window: {e}")
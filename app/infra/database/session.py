@@ -9,6 +9,11 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
+from app.core.config import settings
+from app.infra.database.pool import (InstrumentedAsyncQueuePool,
+                                     ReplicaAsyncQueuePool)
+from app.infra.database.routing import RoutingSession, record_user_write
+
 load_dotenv()
 
 DB_HOST = os.getenv("DB_HOST")
@@ -23,13 +28,50 @@ encoded_password = quote_plus(POSTGRES_PASSWORD)
 # Async database URL
 DATABASE_URL = f"postgresql+asyncpg://{POSTGRES_USER}:{encoded_password}@{DB_HOST}:{DB_PORT}/{POSTGRES_DB}"
 
+# asyncpg prepared statement caches (SQLAlchemy's and asyncpg's own)
+connect_args = {}
+if settings.DB_PREPARED_STATEMENT_CACHE_SIZE is not None:
+    connect_args = {
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        "statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+    }
+
+engine_options = dict(
+    echo=False,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args=connect_args,
+)
+
 # Async engine
-async_engine = create_async_engine(DATABASE_URL, echo=False)
+async_engine = create_async_engine(
+    DATABASE_URL, poolclass=InstrumentedAsyncQueuePool, **engine_options
+)
+
+# Optional read replica (same credentials and database as the primary)
+replica_engine = None
+if settings.DB_REPLICA_HOST:
+    REPLICA_PORT = settings.DB_REPLICA_PORT or DB_PORT
+    REPLICA_DATABASE_URL = f"postgresql+asyncpg://{POSTGRES_USER}:{encoded_password}@{settings.DB_REPLICA_HOST}:{REPLICA_PORT}/{POSTGRES_DB}"
+    replica_engine = create_async_engine(
+        REPLICA_DATABASE_URL, poolclass=ReplicaAsyncQueuePool, **engine_options
+    )
+
+
+class AppSession(RoutingSession):
+    """Routes read-only SELECTs to the replica, if one is configured."""
+
+    replica_bind = replica_engine.sync_engine if replica_engine else None
+
 
 # Async session factory
 AsyncSessionLocal = sessionmaker(
     bind=async_engine,
     class_=AsyncSession,
+    sync_session_class=AppSession,
     expire_on_commit=False,
 )  # type: ignore
 
@@ -45,3 +87,5 @@ async def set_utc_timezone():
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         yield session
+        # Keep the user's next reads on the primary if this request wrote
+        await record_user_write(session)
@@ -0,0 +1,82 @@
+# app/infra/metrics/health.py
+
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.infra.metrics.metrics_data import (get_db_status, get_redis_status,
+                                            get_system_metrics)
+
+logger = logging.getLogger("savings")
+
+
+class HealthMonitor:
+    """
+    In-memory health state of this worker.
+
+    System metrics are sampled by a background task, so reading them costs
+    nothing. Readiness probes the database and Redis with a timeout each, and
+    the result is reused for `readiness_ttl` seconds; concurrent callers
+    share a single in-flight probe.
+    """
+
+    def __init__(self, check_timeout: float, readiness_ttl: float):
+        self.check_timeout = check_timeout
+        self.readiness_ttl = readiness_ttl
+        self.system_metrics: Dict[str, float] = {}
+        self._readiness: Optional[Dict[str, bool]] = None
+        self._checked_at = 0.0
+        self._probe: Optional[asyncio.Task] = None
+
+    def sample_system_metrics(self) -> None:
+        """Refresh CPU and memory usage."""
+        self.system_metrics = get_system_metrics()
+
+    async def run_sampler(self, interval_seconds: float) -> None:
+        """Sample system metrics every `interval_seconds` until cancelled."""
+        while True:
+            try:
+                self.sample_system_metrics()
+            except Exception as e:
+                logger.warning(f"Failed to sample system metrics: {e}")
+            await asyncio.sleep(interval_seconds)
+
+    async def check_readiness(self, redis: Redis) -> Dict[str, bool]:
+        """
+        Return whether the database and Redis are reachable.
+
+        Args:
+            redis (Redis): Client to ping.
+
+        Returns:
+            dict: `{"db": bool, "cache": bool}`.
+        """
+        if (
+            self._readiness is not None
+            and time.monotonic() - self._checked_at < self.readiness_ttl
+        ):
+            return self._readiness
+
+        if self._probe is None or self._probe.done():
+            self._probe = asyncio.create_task(self._run_probes(redis))
+        # Shield so one cancelled caller doesn't cancel the probe for the rest
+        return await asyncio.shield(self._probe)
+
+    async def _run_probes(self, redis: Redis) -> Dict[str, bool]:
+        db_ok, cache_ok = await asyncio.gather(
+            get_db_status(self.check_timeout),
+            get_redis_status(redis, self.check_timeout),
+        )
+        self._readiness = {"db": db_ok, "cache": cache_ok}
+        self._checked_at = time.monotonic()
+        return self._readiness
+
+
+health_monitor = HealthMonitor(
+    check_timeout=settings.HEALTH_CHECK_TIMEOUT_SECONDS,
+    readiness_ttl=settings.HEALTH_READINESS_TTL_SECONDS,
+)
@@ -0,0 +1,182 @@
+# app/infra/metrics/latency.py
+
+import asyncio
+import logging
+from bisect import bisect_left
+from typing import Dict, List, Tuple
+
+from redis.asyncio import Redis
+
+logger = logging.getLogger("savings")
+
+# Upper bounds in seconds; a final +Inf bucket catches the rest
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRIC_NAME = "http_request_duration_seconds"
+# Redis hash the workers merge their counts into
+METRICS_REDIS_KEY = "metrics:http_request_duration"
+UNMATCHED_ROUTE = "unmatched"
+
+SeriesKey = Tuple[str, str, str]  # (method, route, status)
+
+
+class Series:
+    """Bucket counts (non-cumulative, +Inf last) and the sum of observations."""
+
+    __slots__ = ("buckets", "total")
+
+    def __init__(self):
+        self.buckets: List[int] = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total: float = 0.0
+
+    def merge(self, other: "Series") -> None:
+        for i, count in enumerate(other.buckets):
+            self.buckets[i] += count
+        self.total += other.total
+
+
+class LatencyHistograms:
+    """
+    Per-worker request latency histograms keyed by method, route template and
+    status code.
+
+    Requests are observed on the event loop thread only, so counters are
+    plain integers without locks. `flush` moves the counts gathered since the
+    last flush into a Redis hash shared by all workers, and `collect` reads
+    the merged totals back for the /metrics endpoint.
+    """
+
+    def __init__(self):
+        self._pending: Dict[SeriesKey, Series] = {}
+        self._flushed: Dict[SeriesKey, Series] = {}
+
+    def observe(self, method: str, route: str, status: int, seconds: float) -> None:
+        """
+        Record one request.
+
+        Args:
+            method (str): HTTP method.
+            route (str): Route template (e.g. `/v1/user/{id}`), not the raw path.
+            status (int): Response status code.
+            seconds (float): Time taken to respond.
+        """
+        key = (method, route, str(status))
+        series = self._pending.get(key)
+        if series is None:
+            series = self._pending[key] = Series()
+        series.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        series.total += seconds
+
+    def local_series(self) -> Dict[SeriesKey, Series]:
+        """Everything this worker has observed, flushed or not."""
+        merged: Dict[SeriesKey, Series] = {}
+        for source in (self._flushed, self._pending):
+            for key, series in source.items():
+                merged.setdefault(key, Series()).merge(series)
+        return merged
+
+    async def flush(self, redis: Redis) -> None:
+        """
+        Add the counts observed since the last flush to the shared Redis hash.
+
+        On failure the counts are put back so the next flush retries them.
+        """
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        try:
+            pipe = redis.pipeline(transaction=False)
+            for key, series in pending.items():
+                prefix = "|".join(key)
+                for i, count in enumerate(series.buckets):
+                    if count:
+                        pipe.hincrby(METRICS_REDIS_KEY, f"{prefix}|{i}", count)
+                pipe.hincrbyfloat(METRICS_REDIS_KEY, f"{prefix}|sum", series.total)
+            await pipe.execute()
+        except Exception:
+            for key, series in pending.items():
+                self._pending.setdefault(key, Series()).merge(series)
+            raise
+
+        for key, series in pending.items():
+            self._flushed.setdefault(key, Series()).merge(series)
+
+    async def collect(self, redis: Redis) -> Dict[SeriesKey, Series]:
+        """
+        Return the histograms of all workers.
+
+        Falls back to this worker's own counts when Redis is unavailable.
+        """
+        try:
+            await self.flush(redis)
+            raw = await redis.hgetall(METRICS_REDIS_KEY)
+        except Exception as e:
+            logger.warning(f"Serving local latency metrics only: {e}")
+            return self.local_series()
+        return parse_redis_hash(raw)
+
+
+def parse_redis_hash(raw: Dict) -> Dict[SeriesKey, Series]:
+    """Rebuild series from the `method|route|status|bucket` hash fields."""
+    merged: Dict[SeriesKey, Series] = {}
+    for field, value in raw.items():
+        if isinstance(field, bytes):
+            field = field.decode()
+        method, rest = field.split("|", 1)
+        route, status, slot = rest.rsplit("|", 2)
+        series = merged.setdefault((method, route, status), Series())
+        if slot == "sum":
+            series.total = float(value)
+        else:
+            series.buckets[int(slot)] = int(value)
+    return merged
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_prometheus(series: Dict[SeriesKey, Series]) -> str:
+    """
+    Render histograms in the Prometheus text exposition format.
+
+    Args:
+        series (dict): Series keyed by (method, route, status).
+
+    Returns:
+        str: The exposition text, ending with a newline.
+    """
+    lines: List[str] = [
+        f"# HELP {METRIC_NAME} HTTP request latency by method, route and status.",
+        f"# TYPE {METRIC_NAME} histogram",
+    ]
+    bounds = [f"{b:g}" for b in LATENCY_BUCKETS] + ["+Inf"]
+
+    for (method, route, status), s in sorted(series.items()):
+        labels = (
+            f'method="{_escape(method)}",route="{_escape(route)}",'
+            f'status="{_escape(status)}"'
+        )
+        cumulative = 0
+        for bound, count in zip(bounds, s.buckets):
+            cumulative += count
+            lines.append(f'{METRIC_NAME}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f"{METRIC_NAME}_sum{{{labels}}} {s.total:.6f}")
+        lines.append(f"{METRIC_NAME}_count{{{labels}}} {cumulative}")
+
+    return "\n".join(lines) + "\n"
+
+
+async def run_metrics_flusher(redis: Redis, interval_seconds: float) -> None:
+    """Periodically merge this worker's latency counts into Redis."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await latency_histograms.flush(redis)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to flush latency metrics: {e}")
+
+
+latency_histograms = LatencyHistograms()
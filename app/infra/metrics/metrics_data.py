@@ -1,10 +1,11 @@
 # app/infra/metrics/metrics_data.py
+import asyncio
 from datetime import datetime, timezone
 
 import psutil
 from pydantic import BaseModel
 from redis.asyncio import Redis
-from sqlmodel import select
+from sqlalchemy import text
 
 
 class Metrics:
@@ -51,6 +52,10 @@ class Metrics_V2(BaseModel):
         self.latest_request_method = method
 
 
+# Shared by the request logging middleware and the health routes
+app_metrics = Metrics_V2()
+
+
 def get_uptime(start_time: datetime) -> str:
     """
     Calculate uptime from start_time to now.
@@ -67,8 +72,11 @@ def get_uptime(start_time: datetime) -> str:
 def get_system_metrics() -> dict:
     """
     Gather basic system metrics like CPU and memory usage.
+
+    CPU usage is measured since the previous call and never blocks; the first
+    call of a process reports 0.0.
     """
-    cpu_usage = psutil.cpu_percent(interval=0.5)
+    cpu_usage = psutil.cpu_percent(interval=None)
     memory = psutil.virtual_memory()
     memory_usage = memory.percent
 
@@ -78,27 +86,37 @@ def get_system_metrics() -> dict:
     }
 
 
-async def get_db_status() -> bool:
+async def get_db_status(timeout: float) -> bool:
     """
-    Check database connectivity status.
+    Check database connectivity status on a pooled connection.
+
+    Args:
+        timeout (float): Seconds to wait for a connection and `SELECT 1`.
     """
     # Import here to avoid initializing the database at module import time
-    from app.infra.database.session import AsyncSessionLocal
+    from app.infra.database.session import async_engine
 
-    async with AsyncSessionLocal() as session:
-        try:
-            await session.execute(select(1))
-            return True
-        except Exception:
-            return False
+    async def probe():
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
 
+    try:
+        await asyncio.wait_for(probe(), timeout)
+        return True
+    except Exception:
+        return False
 
-async def get_redis_status(redis_client: Redis) -> bool:
+
+async def get_redis_status(redis_client: Redis, timeout: float) -> bool:
     """
     Check Redis connectivity status.
+
+    Args:
+        redis_client (Redis): Client to ping.
+        timeout (float): Seconds to wait for the reply.
     """
     try:
-        ok = await redis_client.ping()
+        ok = await asyncio.wait_for(redis_client.ping(), timeout)
         return ok is True
     except Exception:
         return False
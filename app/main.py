@@ -4,8 +4,8 @@ from fastapi import Depends, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
+from fastapi.responses import JSONResponse, PlainTextResponse
 from redis.asyncio import Redis
-from slowapi.errors import RateLimitExceeded
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.cors import CORSMiddleware
 
@@ -13,25 +13,26 @@ from app.api.dependencies import authenticate_admin, get_redis
 from app.api.routers import main_router
 from app.core.config import settings
 from app.core.middleware.logging import LoggingMiddleware
-from app.core.middleware.rate_limiter import limiter
+from app.core.middleware.rate_limiter import (RateLimitExceeded,
+                                              RateLimitHeadersMiddleware,
+                                              limiter)
 from app.core.setup.instance import application
 from app.core.utils import error_handlers
-from app.core.utils.cache import cache_or_get
 from app.core.utils.response import standard_response
-from app.infra.metrics.metrics_data import (Metrics_V2, get_db_status,
-                                            get_redis_status,
-                                            get_system_metrics, get_uptime)
+from app.infra.metrics.health import health_monitor
+from app.infra.metrics.latency import latency_histograms, render_prometheus
+from app.infra.metrics.metrics_data import app_metrics, get_uptime
 
 app_name = settings.APP_NAME
 app_version = settings.APP_VERSION
 
 main_app = application
-app_metrics = Metrics_V2()
 
 # =======================================
 # MIDDLEWARE
 # =======================================
 main_app.add_middleware(LoggingMiddleware)
+main_app.add_middleware(RateLimitHeadersMiddleware)
 
 if settings.ALLOWED_ORIGINS:
     if isinstance(settings.ALLOWED_ORIGINS, str):
@@ -108,29 +109,22 @@ async def openapi_json(authenticated: bool = Depends(authenticate_admin)):
 # API Health Check
 # =======================================
 async def get_health_check(redis: Redis):
-    async def fetch_health_data():
-        app_metrics.uptime = get_uptime(app_metrics.startup_time)
-        app_metrics.system_metrics = get_system_metrics()
-        app_metrics.db_active = await get_db_status()
-        app_metrics.cache_active = await get_redis_status(redis)
-
-        return {
-            "uptime": app_metrics.uptime,
-            "hostname": f"api-{app_name.lower()}",
-            "db_status": "running" if app_metrics.db_active else "down",
-            "cache_status": "running" if app_metrics.cache_active else "down",
-            "last_request_latency_ms": app_metrics.latest_response_latency,
-            "last_request_path": app_metrics.latest_request_path,
-            "last_request_method": app_metrics.latest_request_method,
-            "system_metrics": app_metrics.system_metrics,
-        }
-
-    return await cache_or_get(
-        redis=redis,
-        key="api_health",
-        fetch_func=fetch_health_data,
-        ttl=120,  # Cache for 2 minutes
-    )
+    readiness = await health_monitor.check_readiness(redis)
+    app_metrics.uptime = get_uptime(app_metrics.startup_time)
+    app_metrics.system_metrics = health_monitor.system_metrics
+    app_metrics.db_active = readiness["db"]
+    app_metrics.cache_active = readiness["cache"]
+
+    return {
+        "uptime": app_metrics.uptime,
+        "hostname": f"api-{app_name.lower()}",
+        "db_status": "running" if app_metrics.db_active else "down",
+        "cache_status": "running" if app_metrics.cache_active else "down",
+        "last_request_latency_ms": app_metrics.latest_response_latency,
+        "last_request_path": app_metrics.latest_request_path,
+        "last_request_method": app_metrics.latest_request_method,
+        "system_metrics": app_metrics.system_metrics,
+    }
 
 
 @main_app.get("/health")
@@ -140,3 +134,38 @@ async def health_check(redis: Redis = Depends(get_redis)):
     return standard_response(
         status="success", message="API health status", data=response
     )
+
+
+@main_app.get("/health/live")
+async def liveness_check():
+    """Answers as long as the event loop runs; touches no dependency."""
+    return standard_response(status="success", message="API is alive")
+
+
+@main_app.get("/health/ready")
+async def readiness_check(redis: Redis = Depends(get_redis)):
+    """503 until both the database and Redis answer within the timeout."""
+    readiness = await health_monitor.check_readiness(redis)
+
+    if not all(readiness.values()):
+        return JSONResponse(
+            status_code=503,
+            content=standard_response(
+                status="error", message="API is not ready", data=readiness
+            ),
+        )
+    return standard_response(status="success", message="API is ready", data=readiness)
+
+# =======================================
+# Prometheus Metrics
+# =======================================
+@main_app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics(
+    redis: Redis = Depends(get_redis),
+    authenticated: bool = Depends(authenticate_admin),
+):
+    """Request latency histograms merged across all workers."""
+    series = await latency_histograms.collect(redis)
+    return PlainTextResponse(
+        render_prometheus(series), media_type="text/plain; version=0.0.4"
+    )
@@ -7,9 +7,10 @@ from fastapi import BackgroundTasks, Request
 
 from app.core.config import settings
 from app.core.middleware.logging import logger
-from app.core.security.hashing import hash_ip, hash_password, verify_password
+from app.core.security.hashing import hash_ip
 from app.core.security.jwt import (create_access_token,
                                    create_password_reset_token, decode_token)
+from app.core.security.password_hasher import password_hasher
 from app.core.utils.exceptions import CustomException
 from app.core.utils.helpers import get_client_ip, mask_email
 from app.modules.auth.schemas import (EmailOnlyRequest, LoginRequest,
@@ -43,7 +44,9 @@ class AuthService:
 
         new_user = User(
             email=str(register_request.email).lower().strip(),
-            password_hash=hash_password(register_request.password.get_secret_value()),
+            password_hash=await password_hasher.hash(
+                register_request.password.get_secret_value()
+            ),
             verification_code=verification_code,
             verification_code_expires_at=expires_at,
             created_at=datetime.now(timezone.utc),
@@ -149,7 +152,7 @@ class AuthService:
         if not user:
             raise CustomException.e401_unauthorized("Invalid credentials.")
 
-        if not verify_password(
+        if not await password_hasher.verify(
             login_request.password.get_secret_value(), user.password_hash
         ):
             await self._handle_failed_login(user, raw_ip, hashed_ip, background_tasks)
@@ -299,7 +302,7 @@ class AuthService:
                 raise CustomException.e404_not_found("Account not found.")
 
             updates = {
-                "password_hash": hash_password(
+                "password_hash": await password_hasher.hash(
                     reset_request.new_password.get_secret_value()
                 ),
                 "failed_login_attempts": 0,
@@ -3,10 +3,12 @@
 from typing import List, Optional
 from uuid import UUID
 
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.modules.gdpr.models import GDPRRequest, UserConsentAudit
+from app.modules.user.models import User
 from app.modules.wallet.models import Transaction
 
 
@@ -54,6 +56,26 @@ class GDPRRepository:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def snapshot_users_for_anonymization(self, user_ids: List[UUID]) -> None:
+        """
+        Copy the current email and full name of the given users into their GDPR
+        requests, in one UPDATE ... FROM. Call right before their PII is
+        scrubbed. Does not commit.
+
+        Args:
+            user_ids (List[UUID]): The users about to be anonymized.
+        """
+        stmt = (
+            update(GDPRRequest)
+            .where(GDPRRequest.user_id == User.id, User.id.in_(user_ids))
+            .values(
+                user_email_snapshot=User.email,
+                user_full_name_snapshot=User.full_name,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.execute(stmt)
+
     async def create_consent(self, consent: UserConsentAudit) -> UserConsentAudit:
         """Record a new user consent."""
         self.db.add(consent)
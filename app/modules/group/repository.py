@@ -2,12 +2,14 @@
 
 import uuid
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from sqlalchemy import bindparam, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
+from app.infra.database.routing import read_only
 from app.modules.group.models import (Group, GroupBase, GroupMember,
                                       GroupTransactionMessage,
                                       RemovedGroupMember)
@@ -94,6 +96,21 @@ class GroupRepository:
         result = await self.session.execute(select(Group).where(Group.id == group_id))
         return result.scalars().first()
 
+    async def get_groups_by_ids(self, group_ids: Iterable[uuid.UUID]) -> List[Group]:
+        """
+        Retrieves the groups with the given IDs in one query.
+
+        Args:
+            group_ids (Iterable[uuid.UUID]): The IDs of the groups to retrieve.
+
+        Returns:
+            List[Group]: The groups found.
+        """
+        result = await self.session.execute(
+            select(Group).where(Group.id.in_(list(group_ids)))
+        )
+        return list(result.scalars().all())
+
     async def get_group_details_by_id(self, group_id: uuid.UUID) -> Optional[Group]:
         """
         Retrieves a group by its ID, eagerly loading members and messages.
@@ -269,8 +286,6 @@ class GroupRepository:
             group_id (uuid.UUID): The ID of the group.
             amount_delta (Decimal): The amount to add (positive) or subtract (negative).
         """
-        from sqlalchemy import update
-
         await self.session.execute(
             update(Group)
             .where(Group.id == group_id)
@@ -288,14 +303,72 @@ class GroupRepository:
             user_id (uuid.UUID): The ID of the member.
             amount_delta (Decimal): The amount to add (positive) or subtract (negative).
         """
-        from sqlalchemy import update
-
         await self.session.execute(
             update(GroupMember)
             .where(GroupMember.group_id == group_id, GroupMember.user_id == user_id)
             .values(contributed_amount=GroupMember.contributed_amount + amount_delta)
         )
 
+    async def update_group_balances(
+        self, deltas: Dict[uuid.UUID, Decimal]
+    ) -> None:
+        """
+        Batch form of `update_group_balance`: one executemany UPDATE, applied in
+        group ID order so concurrent batches lock rows in the same order.
+
+        Args:
+            deltas (Dict[uuid.UUID, Decimal]): Group ID -> amount to add to its balance.
+        """
+        if not deltas:
+            return
+        table = Group.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("b_group_id"))
+            .values(
+                current_balance=table.c.current_balance + bindparam("b_amount_delta")
+            )
+        )
+        await self.session.execute(
+            stmt,
+            [
+                {"b_group_id": group_id, "b_amount_delta": delta}
+                for group_id, delta in sorted(deltas.items())
+            ],
+        )
+
+    async def update_member_contributions(
+        self, deltas: Dict[Tuple[uuid.UUID, uuid.UUID], Decimal]
+    ) -> None:
+        """
+        Batch form of `update_member_contribution`: one executemany UPDATE.
+
+        Args:
+            deltas (Dict[Tuple[uuid.UUID, uuid.UUID], Decimal]): (group ID, user ID)
+                -> amount to add to the member's contributed amount.
+        """
+        if not deltas:
+            return
+        table = GroupMember.__table__
+        stmt = (
+            update(table)
+            .where(
+                table.c.group_id == bindparam("b_group_id"),
+                table.c.user_id == bindparam("b_user_id"),
+            )
+            .values(
+                contributed_amount=table.c.contributed_amount
+                + bindparam("b_amount_delta")
+            )
+        )
+        await self.session.execute(
+            stmt,
+            [
+                {"b_group_id": group_id, "b_user_id": user_id, "b_amount_delta": delta}
+                for (group_id, user_id), delta in sorted(deltas.items())
+            ],
+        )
+
     async def create_group_transaction_message(
         self,
         group_id: uuid.UUID,
@@ -359,6 +432,7 @@ class GroupRepository:
         )
         return result.scalars().all()
 
+    @read_only
     async def get_group_transactions(
         self, group_id: uuid.UUID
     ) -> List[GroupTransactionMessage]:
@@ -387,7 +387,9 @@ class GroupService:
             )
 
             # 1. Lock funds in wallet
-            await self.wallet_repo.update_locked_amount(wallet.id, amount_to_contribute)
+            updated_wallet = await self.wallet_repo.update_locked_amount(
+                wallet.id, amount_to_contribute
+            )
 
             # 2. Create wallet transaction record
             from app.modules.wallet.models import Transaction
@@ -401,6 +403,7 @@ class GroupService:
                 status=TransactionStatus.COMPLETED,
             )
             self.wallet_repo.db.add(wallet_transaction)
+            await self.user_repo.apply_transaction_to_summary(wallet_transaction)
 
             # 3. Update group balance
             await self.group_repo.update_group_balance(group_id, amount_to_contribute)
@@ -418,11 +421,10 @@ class GroupService:
             # Commit all operations
             await self.group_repo.session.commit()
 
-            # Invalidate cache
-            from app.core.utils.cache import invalidate_cache
+            # Refresh wallet caches
+            from app.modules.wallet.service import refresh_wallet_caches
 
-            await invalidate_cache(redis, f"wallet_transactions:{current_user.id}:*")
-            await invalidate_cache(redis, f"wallet_balance:{current_user.id}")
+            await refresh_wallet_caches(redis, current_user.id, updated_wallet)
 
         except Exception:
             await self.group_repo.session.rollback()
@@ -648,7 +650,9 @@ class GroupService:
             )
 
             # 1. Unlock funds in wallet
-            await self.wallet_repo.update_locked_amount(wallet.id, -amount_to_withdraw)
+            updated_wallet = await self.wallet_repo.update_locked_amount(
+                wallet.id, -amount_to_withdraw
+            )
 
             # 2. Create wallet transaction record
             from app.modules.wallet.models import Transaction
@@ -662,6 +666,7 @@ class GroupService:
                 status=TransactionStatus.COMPLETED,
             )
             self.wallet_repo.db.add(wallet_transaction)
+            await self.user_repo.apply_transaction_to_summary(wallet_transaction)
 
             # 3. Update group balance
             await self.group_repo.update_group_balance(group_id, -amount_to_withdraw)
@@ -679,11 +684,10 @@ class GroupService:
             # Commit all operations
             await self.group_repo.session.commit()
 
-            # Invalidate cache
-            from app.core.utils.cache import invalidate_cache
+            # Refresh wallet caches
+            from app.modules.wallet.service import refresh_wallet_caches
 
-            await invalidate_cache(redis, f"wallet_transactions:{current_user.id}:*")
-            await invalidate_cache(redis, f"wallet_balance:{current_user.id}")
+            await refresh_wallet_caches(redis, current_user.id, updated_wallet)
 
         except Exception as e:
             await self.group_repo.session.rollback()
@@ -6,7 +6,7 @@ from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Optional
 
 from pydantic import ConfigDict
-from sqlalchemy import Column, DateTime, Numeric
+from sqlalchemy import Column, DateTime, Index, Numeric, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -53,6 +53,14 @@ class ScheduledTransaction(SQLModel, table=True):
     """
 
     __tablename__ = "scheduled_transaction"
+    __table_args__ = (
+        # Serves the scheduler's due-work lookups; only active rows are indexed
+        Index(
+            "ix_scheduled_transaction_active_next_run_at",
+            "next_run_at",
+            postgresql_where=text("status = 'ACTIVE'"),
+        ),
+    )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     user_id: uuid.UUID = Field(foreign_key="app_user.id", nullable=False)
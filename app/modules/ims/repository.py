@@ -1,10 +1,12 @@
 # app/modules/ims/repository.py
 
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Collection, List, Optional, Sequence
 from uuid import UUID
 
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload
 from sqlmodel import select
 
 from app.modules.ims.models import IMSAction, ScheduledTransaction
@@ -99,6 +101,87 @@ class IMSRepository:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def claim_due_transactions(
+        self,
+        limit: int,
+        tx_ids: Optional[Sequence[UUID]] = None,
+        exclude_ids: Collection[UUID] = (),
+    ) -> List[ScheduledTransaction]:
+        """
+        Claim up to `limit` active transactions that are due, oldest first.
+
+        Rows are locked with FOR UPDATE SKIP LOCKED: rows another worker holds
+        are skipped instead of waited for, so concurrent workers (or nodes) split
+        the due work without executing anything twice. The claim lasts until the
+        session's transaction ends. Goal/group relationships are not loaded;
+        callers load groups in bulk.
+
+        Args:
+            limit (int): Maximum number of transactions to claim.
+            tx_ids (Optional[Sequence[UUID]]): Only claim among these transactions.
+            exclude_ids (Collection[UUID]): Transactions not to claim (e.g. ones
+                that already failed in this run).
+
+        Returns:
+            List[ScheduledTransaction]: The claimed transactions.
+        """
+        now = datetime.now(timezone.utc)
+        stmt = (
+            select(ScheduledTransaction)
+            .options(
+                noload(ScheduledTransaction.goal), noload(ScheduledTransaction.group)
+            )
+            .where(
+                ScheduledTransaction.status == TransactionStatus.ACTIVE,
+                ScheduledTransaction.next_run_at <= now,
+            )
+            .order_by(ScheduledTransaction.next_run_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        if tx_ids is not None:
+            stmt = stmt.where(ScheduledTransaction.id.in_(tx_ids))
+        if exclude_ids:
+            stmt = stmt.where(ScheduledTransaction.id.not_in(exclude_ids))
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_next_due_at(
+        self, exclude_ids: Collection[UUID] = ()
+    ) -> Optional[datetime]:
+        """
+        Earliest next_run_at of all active transactions (an index lookup).
+
+        Args:
+            exclude_ids (Collection[UUID]): Transactions to leave out (e.g. ones
+                that just failed and stay due).
+        """
+        stmt = select(func.min(ScheduledTransaction.next_run_at)).where(
+            ScheduledTransaction.status == TransactionStatus.ACTIVE
+        )
+        if exclude_ids:
+            stmt = stmt.where(ScheduledTransaction.id.not_in(exclude_ids))
+        result = await self.db.execute(stmt)
+        return result.scalar()
+
+    async def lock_scheduled_transaction(
+        self, tx_id: UUID
+    ) -> Optional[ScheduledTransaction]:
+        """
+        Lock an active transaction for immediate execution (FOR UPDATE SKIP LOCKED).
+        Returns None if it is no longer active or a worker is executing it.
+        """
+        stmt = (
+            select(ScheduledTransaction)
+            .where(
+                ScheduledTransaction.id == tx_id,
+                ScheduledTransaction.status == TransactionStatus.ACTIVE,
+            )
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalars().first()
+
     async def update_scheduled_transaction(
         self, transaction: ScheduledTransaction
     ) -> ScheduledTransaction:
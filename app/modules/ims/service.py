@@ -542,29 +542,49 @@ class IMSService:
         if created_tx.frequency == TransactionFrequency.ONCE:
             try:
                 # Import here to avoid circular dependencies
-                from app.core.tasks.cron_jobs import _process_single_transaction
+                from app.core.tasks.cron_jobs import (
+                    _process_single_transaction, invalidate_wallet_caches)
                 from app.modules.wallet.repository import WalletRepository
                 from app.modules.user.repository import UserRepository
                 from app.modules.notifications.email.service import EmailNotificationService
 
                 logger.info(f"Executing ONCE transaction {created_tx.id} immediately")
-                
+
+                # The scheduler may have claimed it already; never execute it twice
+                if not await self.ims_repo.lock_scheduled_transaction(created_tx.id):
+                    logger.info(
+                        f"ONCE transaction {created_tx.id} already claimed by the scheduler"
+                    )
+                    return created_tx
+
                 wallet_repo = WalletRepository(self.ims_repo.db)
                 user_repo = UserRepository(self.ims_repo.db)
                 notification_manager = EmailNotificationService()
+                pending = []
 
-                await _process_single_transaction(
+                executed_user_id = await _process_single_transaction(
                     self.ims_repo.db,
                     created_tx,
                     self.group_repo,
                     wallet_repo,
                     user_repo,
-                    notification_manager
+                    pending
                 )
                 
                 # Commit the changes made during execution
                 await self.ims_repo.db.commit()
                 await self.ims_repo.db.refresh(created_tx)
+
+                if executed_user_id:
+                    await invalidate_wallet_caches([executed_user_id])
+
+                # Notify only once committed and the row lock is released
+                for notification in pending:
+                    await notification_manager.schedule(
+                        notification_manager.send,
+                        background_tasks=None,  # Await immediately
+                        **notification,
+                    )
                 
             except Exception as e:
                 logger.error(f"Failed to execute ONCE transaction immediately: {e}")
@@ -3,6 +3,7 @@
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.infra.database.routing import read_only
 from app.modules.user.models import User
 from app.modules.wallet.models import Transaction, Wallet
 
@@ -22,6 +23,7 @@ class RBACRepository:
 
         return users, total
 
+    @read_only
     async def get_app_metrics(self):
         trans_count_query = select(func.count(Transaction.id))
         trans_count = (await self.session.execute(trans_count_query)).scalar() or 0
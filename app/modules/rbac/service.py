@@ -1,6 +1,10 @@
 # app/modules/rbac/service.py
 
+from app.core.security.password_hasher import password_hasher
+from app.core.utils.cache import cache_stats
 from app.core.utils.exceptions import CustomException
+from app.infra.database.pool import pool_stats, replica_pool_stats
+from app.infra.database.session import async_engine, replica_engine
 from app.modules.rbac.repository import RBACRepository
 from app.modules.rbac.schemas import AdminUserUpdate
 
@@ -21,7 +25,15 @@ class RBACService:
         }
 
     async def get_app_metrics(self):
-        return await self.repo.get_app_metrics()
+        metrics = await self.repo.get_app_metrics()
+        metrics["cache_stats"] = cache_stats.snapshot()
+        metrics["db_pool"] = pool_stats.snapshot(async_engine.sync_engine.pool)
+        if replica_engine is not None:
+            metrics["db_replica_pool"] = replica_pool_stats.snapshot(
+                replica_engine.sync_engine.pool
+            )
+        metrics["password_hasher"] = password_hasher.stats()
+        return metrics
 
     async def update_user(self, user_id: str, update_data: AdminUserUpdate):
         user = await self.repo.get_user_by_id(user_id)
@@ -1,7 +1,9 @@
 # app/modules/shared/helpers.py
+import base64
 import secrets
 import string
 from datetime import datetime
+from uuid import UUID
 from zoneinfo import ZoneInfo
 
 import httpx
@@ -35,6 +37,27 @@ def transform_time(time: datetime) -> str:
     return transformed
 
 
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """Return an opaque pagination cursor pointing at a (created_at, id) position."""
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor created by `encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+
+
 async def get_location_from_ip(ip: str) -> str:
     """
     Async IP geolocation lookup (non-blocking).
@@ -5,7 +5,7 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 from pydantic import ConfigDict
-from sqlalchemy import Column, DateTime
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, Numeric, text
 from sqlmodel import Boolean, Field, Relationship, SQLModel
 
 from app.modules.shared.enums import Currency, Role
@@ -115,6 +115,54 @@ class User(UserBase, table=True):
     model_config = ConfigDict(validate_assignment=True)
 
 
+class UserTransactionSummary(SQLModel, table=True):
+    """
+    Per-user transaction aggregates behind the financial analytics endpoint.
+
+    Upserted in the same database transaction that records a Transaction,
+    backfilled by its migration, and rebuilt from history with
+    `scripts/maintenance/rebuild_transaction_summaries.py`.
+    """
+
+    __tablename__ = "user_transaction_summary"
+
+    user_id: UUID = Field(
+        sa_column=Column(ForeignKey("app_user.id"), primary_key=True)
+    )
+
+    total_transactions: int = Field(
+        default=0, sa_column=Column(Integer, nullable=False, server_default=text("0"))
+    )
+    total_amount_in: float = Field(
+        default=0,
+        sa_column=Column(Numeric(15, 4), nullable=False, server_default=text("0")),
+    )
+    total_amount_out: float = Field(
+        default=0,
+        sa_column=Column(Numeric(15, 4), nullable=False, server_default=text("0")),
+    )
+    deposit_count: int = Field(
+        default=0, sa_column=Column(Integer, nullable=False, server_default=text("0"))
+    )
+    withdrawal_count: int = Field(
+        default=0, sa_column=Column(Integer, nullable=False, server_default=text("0"))
+    )
+    group_contribution_count: int = Field(
+        default=0, sa_column=Column(Integer, nullable=False, server_default=text("0"))
+    )
+    solo_contribution_count: int = Field(
+        default=0, sa_column=Column(Integer, nullable=False, server_default=text("0"))
+    )
+
+    updated_at: Optional[datetime] = Field(
+        sa_column=Column(
+            DateTime(timezone=True),
+            server_default="now()",
+            onupdate=datetime.utcnow,
+        )
+    )
+
+
 from app.modules.gdpr.models import GDPRRequest
 from app.modules.group.models import GroupMember
 from app.modules.ims.models import IMSAction, ScheduledTransaction
@@ -2,15 +2,41 @@
 
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional
 from uuid import UUID
 
-from sqlalchemy import and_, func
+from sqlalchemy import and_, func, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.core.utils.helpers import coerce_datetimes
-from app.modules.user.models import User
+from app.infra.database.routing import read_only
+from app.modules.shared.enums import Role, TransactionType
+from app.modules.user.models import User, UserTransactionSummary
+from app.modules.wallet.models import Transaction
+
+# Transaction type -> (summary count column, summary amount column)
+_SUMMARY_COLUMNS = {
+    TransactionType.WALLET_DEPOSIT: ("deposit_count", "total_amount_in"),
+    TransactionType.WALLET_WITHDRAWAL: ("withdrawal_count", "total_amount_out"),
+    TransactionType.GROUP_SAVINGS_DEPOSIT: ("group_contribution_count", None),
+    TransactionType.INDIVIDUAL_SAVINGS_DEPOSIT: ("solo_contribution_count", None),
+}
+
+
+def _summary_aggregates() -> Dict[str, Any]:
+    """Summary column name -> aggregate expression over the Transaction table."""
+    aggregates = {"total_transactions": func.count(Transaction.id)}
+    for tx_type, (count_column, amount_column) in _SUMMARY_COLUMNS.items():
+        matches = Transaction.type == tx_type
+        aggregates[count_column] = func.count(Transaction.id).filter(matches)
+        if amount_column:
+            aggregates[amount_column] = func.coalesce(
+                func.sum(Transaction.amount).filter(matches), 0
+            )
+    return aggregates
 
 
 class UserRepository:
@@ -51,6 +77,12 @@ class UserRepository:
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_by_ids(self, ids: Iterable[UUID]) -> List[User]:
+        """Retrieve the Users with the given IDs in one query"""
+        stmt = select(User).where(User.id.in_(list(ids)))
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
     async def get_by_email(self, email: str) -> Optional[User]:
         """Retrieve a User by email"""
         stmt = select(User).where(User.email == email)
@@ -72,60 +104,73 @@ class UserRepository:
         return result.scalar_one_or_none()
 
     # ========================
-    # ANALYTICS METHODS
+    # ANONYMIZATION METHODS
     # ========================
 
-    async def get_wallet_transaction_stats(self, user_id: UUID) -> Dict[str, Any]:
+    async def claim_users_to_anonymize(
+        self, deleted_before: datetime, limit: int, after_id: Optional[UUID] = None
+    ) -> List[UUID]:
         """
-        Aggregate wallet transaction statistics for a user.
-
-        Returns total transaction count, sum of deposits, and sum of withdrawals.
+        Lock the next chunk of soft-deleted users due for anonymization, in ID
+        order starting after `after_id`. Rows locked by another worker are
+        skipped rather than waited for.
 
         Args:
-            user_id (UUID): The user's ID.
+            deleted_before (datetime): Only users deleted at or before this time.
+            limit (int): Maximum number of users to claim.
+            after_id (Optional[UUID]): Keyset cursor, the last ID of the previous chunk.
 
         Returns:
-            Dict[str, Any]: Dictionary containing:
-                - total_transactions: Total count of all transactions
-                - total_amount_in: Sum of all WALLET_DEPOSIT transactions
-                - total_amount_out: Sum of all WALLET_WITHDRAWAL transactions
+            List[UUID]: The claimed user IDs, ascending.
         """
-        from app.modules.shared.enums import TransactionType
-        from app.modules.wallet.models import Transaction
-
-        # Get total transaction count
-        count_stmt = select(func.count(Transaction.id)).where(
-            Transaction.owner_id == user_id
-        )
-        total_count = await self.db.execute(count_stmt)
-        total_transactions = total_count.scalar() or 0
-
-        # Get sum of deposits
-        deposit_stmt = select(func.coalesce(func.sum(Transaction.amount), 0)).where(
-            and_(
-                Transaction.owner_id == user_id,
-                Transaction.type == TransactionType.WALLET_DEPOSIT,
+        stmt = (
+            select(User.id)
+            .where(
+                User.is_deleted == True,
+                User.is_anonymized == False,
+                User.deleted_at <= deleted_before,
             )
+            .order_by(User.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
         )
-        deposit_result = await self.db.execute(deposit_stmt)
-        total_amount_in = float(deposit_result.scalar() or 0)
-
-        # Get sum of withdrawals
-        withdrawal_stmt = select(func.coalesce(func.sum(Transaction.amount), 0)).where(
-            and_(
-                Transaction.owner_id == user_id,
-                Transaction.type == TransactionType.WALLET_WITHDRAWAL,
+        if after_id is not None:
+            stmt = stmt.where(User.id > after_id)
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def anonymize_users(self, user_ids: List[UUID], password_hash: str) -> None:
+        """
+        Scrub the PII of the given users in one UPDATE, keeping the rows for
+        financial and audit records. Does not commit.
+
+        Args:
+            user_ids (List[UUID]): The users to anonymize.
+            password_hash (str): Unusable hash stored in place of the password.
+        """
+        stmt = (
+            update(User)
+            .where(User.id.in_(user_ids))
+            .values(
+                full_name=None,
+                email=func.concat("deleted_", User.id, "@anonymized.local"),
+                is_anonymized=True,
+                role=Role.DELETED_USER,
+                password_hash=password_hash,
+                preferred_language=None,
+                last_login_at=None,
+                last_failed_login_at=None,
+                failed_login_attempts=0,
             )
+            .execution_options(synchronize_session=False)
         )
-        withdrawal_result = await self.db.execute(withdrawal_stmt)
-        total_amount_out = float(withdrawal_result.scalar() or 0)
+        await self.db.execute(stmt)
 
-        return {
-            "total_transactions": int(total_transactions),
-            "total_amount_in": total_amount_in,
-            "total_amount_out": total_amount_out,
-        }
+    # ========================
+    # ANALYTICS METHODS
+    # ========================
 
+    @read_only
     async def get_transaction_count_last_n_days(
         self, user_id: UUID, days: int = 30
     ) -> int:
@@ -149,123 +194,176 @@ class UserRepository:
         result = await self.db.execute(stmt)
         return int(result.scalar() or 0)
 
-    async def get_transaction_type_distribution(self, user_id: UUID) -> Dict[str, int]:
+    @read_only
+    async def get_group_contribution_stats(self, user_id: UUID) -> Dict[str, Any]:
         """
-        Get breakdown of transactions by type.
-
-        Returns count of deposits, withdrawals, and group contributions.
+        Read a user's contributions to the (non-solo) groups they belong to, in one query.
 
         Args:
             user_id (UUID): The user's ID.
 
         Returns:
-            Dict[str, int]: Dictionary with keys 'deposit', 'withdrawal', 'group_contribution'
+            Dict[str, Any]: Dictionary containing:
+                - total_contributed: Total amount contributed across all groups
+                - active_groups: Number of active group memberships
+                - breakdown: Mapping of group names to contribution amounts
         """
-        from app.modules.shared.enums import TransactionType
-        from app.modules.wallet.models import Transaction
-
-        # Count deposits
-        deposit_stmt = select(func.count(Transaction.id)).where(
-            and_(
-                Transaction.owner_id == user_id,
-                Transaction.type == TransactionType.WALLET_DEPOSIT,
-            )
-        )
-        deposit_result = await self.db.execute(deposit_stmt)
-        deposit_count = int(deposit_result.scalar() or 0)
-
-        # Count withdrawals
-        withdrawal_stmt = select(func.count(Transaction.id)).where(
-            and_(
-                Transaction.owner_id == user_id,
-                Transaction.type == TransactionType.WALLET_WITHDRAWAL,
-            )
-        )
-        withdrawal_result = await self.db.execute(withdrawal_stmt)
-        withdrawal_count = int(withdrawal_result.scalar() or 0)
-
-        # Count group contributions (GROUP_SAVINGS_DEPOSIT transactions)
-        group_contrib_stmt = select(func.count(Transaction.id)).where(
-            and_(
-                Transaction.owner_id == user_id,
-                Transaction.type == TransactionType.GROUP_SAVINGS_DEPOSIT,
-            )
-        )
-        group_contrib_result = await self.db.execute(group_contrib_stmt)
-
-        group_contrib_count = int(group_contrib_result.scalar() or 0)
+        from app.modules.group.models import Group, GroupMember
 
-        # Count solo contributions (INDIVIDUAL_SAVINGS_DEPOSIT transactions)
-        solo_contrib_stmt = select(func.count(Transaction.id)).where(
-            and_(
-                Transaction.owner_id == user_id,
-                Transaction.type == TransactionType.INDIVIDUAL_SAVINGS_DEPOSIT,
-            )
+        stmt = (
+            select(Group.name, GroupMember.contributed_amount)
+            .join(Group, GroupMember.group_id == Group.id)
+            .where(GroupMember.user_id == user_id, Group.is_solo == False)
         )
-        solo_contrib_result = await self.db.execute(solo_contrib_stmt)
-        solo_contrib_count = int(solo_contrib_result.scalar() or 0)
+        rows = (await self.db.execute(stmt)).all()
 
         return {
-            "deposit": deposit_count,
-            "withdrawal": withdrawal_count,
-            "group_contribution": group_contrib_count,
-            "solo_contribution": solo_contrib_count,
+            "total_contributed": float(sum(row[1] or 0 for row in rows)),
+            "active_groups": len(rows),
+            "breakdown": {row[0]: float(row[1]) for row in rows},
         }
 
-    async def get_total_group_contributions(self, user_id: UUID) -> float:
+    # ========================
+    # TRANSACTION SUMMARY
+    # ========================
+
+    @read_only
+    async def get_transaction_summary(self, user_id: UUID) -> Dict[str, Any]:
         """
-        Calculate total amount contributed to all groups by a user.
+        Read a user's materialized transaction aggregates (a single-row lookup).
 
         Args:
             user_id (UUID): The user's ID.
 
         Returns:
-            float: Total amount contributed across all groups.
+            Dict[str, Any]: Dictionary containing:
+                - total_transactions: Total count of all transactions
+                - total_amount_in: Sum of all WALLET_DEPOSIT transactions
+                - total_amount_out: Sum of all WALLET_WITHDRAWAL transactions
+                - transaction_type_distribution: Counts with keys 'deposit',
+                  'withdrawal', 'group_contribution', 'solo_contribution'
         """
-        from app.modules.group.models import GroupMember, Group
-        
-        stmt = select(func.coalesce(func.sum(GroupMember.contributed_amount), 0)).join(Group, GroupMember.group_id == Group.id).where(
-            GroupMember.user_id == user_id, Group.is_solo == False
+        stmt = select(UserTransactionSummary).where(
+            UserTransactionSummary.user_id == user_id
         )
-        result = await self.db.execute(stmt)
-        return float(result.scalar() or 0)
+        summary = (await self.db.execute(stmt)).scalar_one_or_none()
+        if summary is None:
+            # The row is created with the user's first transaction
+            summary = UserTransactionSummary(user_id=user_id)
 
-    async def get_group_contribution_breakdown(self, user_id: UUID) -> Dict[str, float]:
-        """
-        Get per-group contribution breakdown for a user.
+        return {
+            "total_transactions": int(summary.total_transactions),
+            "total_amount_in": float(summary.total_amount_in),
+            "total_amount_out": float(summary.total_amount_out),
+            "transaction_type_distribution": {
+                "deposit": int(summary.deposit_count),
+                "withdrawal": int(summary.withdrawal_count),
+                "group_contribution": int(summary.group_contribution_count),
+                "solo_contribution": int(summary.solo_contribution_count),
+            },
+        }
 
-        Returns a dictionary mapping group names to contribution amounts.
+    async def apply_transaction_to_summary(self, transaction: Any) -> None:
+        """
+        Add a new transaction to its owner's summary row, creating the row if
+        needed. Does not commit, so the change lands in the same database
+        transaction as the insert.
 
         Args:
-            user_id (UUID): The user's ID.
+            transaction (Transaction): The transaction being recorded.
+        """
+        await self.apply_transactions_to_summary([transaction])
 
-        Returns:
-            Dict[str, float]: Dictionary mapping group names to contribution amounts.
+    async def apply_transactions_to_summary(self, transactions: Iterable[Any]) -> None:
         """
-        from app.modules.group.models import Group, GroupMember
+        Add new transactions to their owners' summary rows in one upsert.
 
-        stmt = (
-            select(Group.name, GroupMember.contributed_amount)
-            .join(Group, GroupMember.group_id == Group.id)
-            .where(GroupMember.user_id == user_id, Group.is_solo == False)
-        )
-        result = await self.db.execute(stmt)
-        rows = result.all()
+        The increments are summed per owner; owners without a row get one holding
+        just these increments, the others have them added atomically
+        (`ON CONFLICT (user_id) DO UPDATE SET col = col + excluded.col`), so
+        concurrent writers never lose an update. Does not commit.
 
-        return {row[0]: float(row[1]) for row in rows}
+        Args:
+            transactions (Iterable[Transaction]): The transactions being recorded.
+        """
+        columns = ["total_transactions"] + [
+            column
+            for pair in _SUMMARY_COLUMNS.values()
+            for column in pair
+            if column
+        ]
+        deltas: Dict[UUID, Dict[str, Any]] = defaultdict(
+            lambda: dict.fromkeys(columns, 0)
+        )
+        for transaction in transactions:
+            if transaction.owner_id is None:
+                continue
+            delta = deltas[transaction.owner_id]
+            delta["total_transactions"] += 1
+            count_column, amount_column = _SUMMARY_COLUMNS.get(
+                transaction.type, (None, None)
+            )
+            if count_column:
+                delta[count_column] += 1
+            if amount_column:
+                delta[amount_column] += Decimal(str(transaction.amount))
+
+        if not deltas:
+            return
+
+        table = UserTransactionSummary.__table__
+        # Sorted so concurrent batches lock rows in the same order
+        stmt = pg_insert(table).values(
+            [{"user_id": user_id, **delta} for user_id, delta in sorted(deltas.items())]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={
+                **{column: table.c[column] + stmt.excluded[column] for column in columns},
+                "updated_at": func.now(),
+            },
+        )
+        await self.db.execute(stmt)
 
-    async def get_active_groups_count(self, user_id: UUID) -> int:
+    async def rebuild_transaction_summaries(
+        self, user_id: Optional[UUID] = None, overwrite: bool = True
+    ) -> int:
         """
-        Count the number of groups a user is currently a member of.
+        Recompute summary rows from the transaction history in one statement.
+        For backfills and repairs only; it commits, and requests never call it.
 
         Args:
-            user_id (UUID): The user's ID.
+            user_id (Optional[UUID]): Only rebuild this user; None rebuilds every
+                user with transactions.
+            overwrite (bool): Replace existing rows. When False, only missing rows
+                are created and existing ones are left alone.
 
         Returns:
-            int: Number of active group memberships.
+            int: Number of summary rows written.
         """
-        from app.modules.group.models import GroupMember, Group
-        
-        stmt = select(func.count(GroupMember.id)).join(Group, GroupMember.group_id == Group.id).where(GroupMember.user_id == user_id, Group.is_solo == False)
+        aggregates = _summary_aggregates()
+        history = (
+            select(Transaction.owner_id, *aggregates.values())
+            .where(Transaction.owner_id.isnot(None))
+            .group_by(Transaction.owner_id)
+        )
+        if user_id is not None:
+            history = history.where(Transaction.owner_id == user_id)
+
+        stmt = pg_insert(UserTransactionSummary).from_select(
+            ["user_id", *aggregates], history
+        )
+        if overwrite:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["user_id"],
+                set_={
+                    **{name: stmt.excluded[name] for name in aggregates},
+                    "updated_at": func.now(),
+                },
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=["user_id"])
+
         result = await self.db.execute(stmt)
-        return int(result.scalar() or 0)
+        await self.db.commit()
+        return int(result.rowcount or 0)
@@ -7,7 +7,8 @@ from fastapi import BackgroundTasks, Request
 from redis.asyncio import Redis
 
 from app.core.middleware.logging import logger
-from app.core.security.hashing import hash_password, verify_password
+from app.core.security.password_hasher import password_hasher
+from app.core.security.principal import principal_cache_key
 from app.core.utils.cache import invalidate_cache
 from app.core.utils.exceptions import CustomException
 from app.core.utils.profanity_check import is_text_allowed_async
@@ -69,7 +70,7 @@ class UserService:
         user = await self.user_repo.get_by_email(current_user.email)
         await self.user_repo.update(user, update_data)
 
-        await invalidate_cache(redis, f"user_current:{user.email}")
+        await invalidate_cache(redis, principal_cache_key(user.email))
         return {"message": "User details updated successfully."}
 
     async def update_user_password(
@@ -84,12 +85,12 @@ class UserService:
         current_pass = change_password_request.current_password.get_secret_value()
 
         # Verify old password
-        if not verify_password(
+        if not await password_hasher.verify(
             plain_password=current_pass, hashed_password=current_user.password_hash
         ):
             CustomException.e403_forbidden("Invalid current password.")
 
-        new_hashed_password = hash_password(
+        new_hashed_password = await password_hasher.hash(
             change_password_request.new_password.get_secret_value()
         )
         # Update via repository
@@ -149,7 +150,7 @@ class UserService:
             )
 
         # Verify user password
-        if not verify_password(
+        if not await password_hasher.verify(
             plain_password=change_email_request.password.get_secret_value(),
             hashed_password=current_user.password_hash,
         ):
@@ -168,7 +169,7 @@ class UserService:
             + 1,  # invalidate existing tokens
         }
         await self.user_repo.update(current_user, updates)
-        await invalidate_cache(redis, f"user_current:{old_email}")
+        await invalidate_cache(redis, principal_cache_key(old_email))
 
         # Send notification to old email
         await self.notification_manager.schedule(
@@ -211,31 +212,24 @@ class UserService:
         """
         from app.modules.user.schemas import TransactionTypeDistribution
 
-        # Get wallet transaction statistics
-        wallet_stats = await self.user_repo.get_wallet_transaction_stats(
-            current_user.id
-        )
+        # Wallet totals and type distribution: one materialized row
+        wallet_stats = await self.user_repo.get_transaction_summary(current_user.id)
+        type_distribution = wallet_stats["transaction_type_distribution"]
 
-        # Get recent transaction frequency
+        # A rolling window can't be kept up to date by increments; this is an
+        # index range count on (owner_id, created_at)
         recent_transactions = await self.user_repo.get_transaction_count_last_n_days(
             current_user.id, days=30
         )
 
-        # Get transaction type distribution
-        type_distribution = await self.user_repo.get_transaction_type_distribution(
-            current_user.id
-        )
-
-        # Get group contribution data
-        total_group_contributions = await self.user_repo.get_total_group_contributions(
-            current_user.id
-        )
-        group_breakdown = await self.user_repo.get_group_contribution_breakdown(
-            current_user.id
-        )
-        active_groups_count = await self.user_repo.get_active_groups_count(
+        # Read live from the user's memberships, which also change on group
+        # withdrawals and member removal
+        group_stats = await self.user_repo.get_group_contribution_stats(
             current_user.id
         )
+        total_group_contributions = group_stats["total_contributed"]
+        group_breakdown = group_stats["breakdown"]
+        active_groups_count = group_stats["active_groups"]
 
         # Compute derived metrics
         net_flow = wallet_stats["total_amount_in"] - wallet_stats["total_amount_out"]
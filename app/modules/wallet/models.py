@@ -5,7 +5,7 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 from pydantic import ConfigDict
-from sqlalchemy import Boolean, Column, DateTime, Numeric, text
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, Numeric, text
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.modules.shared.enums import TransactionStatus, TransactionType
@@ -35,6 +35,11 @@ class Wallet(SQLModel, table=True):
         default=0,
         sa_column=Column(Numeric(15, 4), nullable=False, server_default=text("0")),
     )
+    # Incremented on every balance change; orders cached balance snapshots
+    version: int = Field(
+        default=0,
+        sa_column=Column(Integer, nullable=False, server_default=text("0")),
+    )
 
     created_at: datetime = Field(
         sa_column=Column(
@@ -91,6 +96,15 @@ class Transaction(SQLModel, table=True):
     """
 
     __tablename__ = "transaction"
+    __table_args__ = (
+        # Serves keyset pagination of a user's history (newest first)
+        Index(
+            "ix_transaction_owner_id_created_at_id",
+            "owner_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     is_anonymized: bool = Field(sa_column=Column(Boolean, server_default="false"))
@@ -1,13 +1,16 @@
 # app/modules/wallet/repository.py
 
+from datetime import datetime
 from decimal import Decimal
-from typing import Any, Coroutine, List, Optional
+from typing import Any, Coroutine, Dict, Iterable, List, Optional
 from uuid import UUID
 
-from sqlalchemy import func
+from sqlalchemy import bindparam, func, tuple_, update
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from app.infra.database.routing import read_only
 from app.modules.shared.enums import TransactionStatus
 from app.modules.wallet.models import Transaction, Wallet
 
@@ -28,6 +31,7 @@ class WalletRepository:
 
         for key, value in updates.items():
             setattr(wallet, key, value)
+        wallet.version = (wallet.version or 0) + 1
 
         await self.db.commit()
         await self.db.refresh(wallet)
@@ -39,22 +43,116 @@ class WalletRepository:
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_wallets_by_user_ids(
+        self, user_ids: Iterable[UUID], for_update: bool = False
+    ) -> List[Wallet]:
+        """
+        Retrieve the wallets of the given users in one query.
+
+        Args:
+            user_ids (Iterable[UUID]): The wallet owners' IDs.
+            for_update (bool): Lock the rows until the transaction ends. Rows are
+                locked in wallet ID order, so concurrent batches cannot deadlock.
+
+        Returns:
+            List[Wallet]: The wallets found.
+        """
+        stmt = (
+            select(Wallet)
+            .where(Wallet.user_id.in_(list(user_ids)))
+            .order_by(Wallet.id)
+        )
+        if for_update:
+            stmt = stmt.with_for_update()
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def apply_balance_delta(
+        self,
+        user_id: UUID,
+        amount_delta: Decimal,
+        min_available: Optional[Decimal] = None,
+    ) -> Optional[Row]:
+        """
+        Atomically add a delta to a user's wallet balance in a single UPDATE.
+
+        The change is not committed, so it lands in the same database transaction
+        as the ledger entry recorded next.
+
+        Args:
+            user_id (UUID): The wallet owner's ID.
+            amount_delta (Decimal): The amount to add (positive) or subtract (negative).
+            min_available (Optional[Decimal]): If given, only update when the
+                available balance (total - locked) is at least this amount.
+
+        Returns:
+            Optional[Row]: The wallet's id, new total_balance, locked_amount and
+                version; None if the wallet does not exist or has insufficient funds.
+        """
+        stmt = update(Wallet).where(Wallet.user_id == user_id)
+        if min_available is not None:
+            stmt = stmt.where(
+                Wallet.total_balance - Wallet.locked_amount >= min_available
+            )
+        result = await self.db.execute(
+            stmt.values(
+                total_balance=Wallet.total_balance + amount_delta,
+                version=Wallet.version + 1,
+            ).returning(
+                Wallet.id, Wallet.total_balance, Wallet.locked_amount, Wallet.version
+            )
+        )
+        return result.one_or_none()
+
     async def update_locked_amount(
         self, wallet_id: UUID, amount_delta: Decimal
-    ) -> None:
+    ) -> Row:
         """
         Update wallet's locked amount by a delta.
 
         Args:
             wallet_id (UUID): The wallet ID.
             amount_delta (Decimal): The amount to add (positive) or subtract (negative).
-        """
-        from sqlalchemy import update
 
-        await self.db.execute(
+        Returns:
+            Row: The wallet's new total_balance, locked_amount and version.
+        """
+        result = await self.db.execute(
             update(Wallet)
             .where(Wallet.id == wallet_id)
-            .values(locked_amount=Wallet.locked_amount + amount_delta)
+            .values(
+                locked_amount=Wallet.locked_amount + amount_delta,
+                version=Wallet.version + 1,
+            )
+            .returning(Wallet.total_balance, Wallet.locked_amount, Wallet.version)
+        )
+        return result.one()
+
+    async def update_locked_amounts(self, deltas: Dict[UUID, Decimal]) -> None:
+        """
+        Batch form of `update_locked_amount`: one executemany UPDATE for all
+        wallets. Does not commit.
+
+        Args:
+            deltas (Dict[UUID, Decimal]): Wallet ID -> amount to add to its locked amount.
+        """
+        if not deltas:
+            return
+        table = Wallet.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("b_wallet_id"))
+            .values(
+                locked_amount=table.c.locked_amount + bindparam("b_amount_delta"),
+                version=table.c.version + 1,
+            )
+        )
+        await self.db.execute(
+            stmt,
+            [
+                {"b_wallet_id": wallet_id, "b_amount_delta": delta}
+                for wallet_id, delta in sorted(deltas.items())
+            ],
         )
 
 
@@ -65,13 +163,18 @@ class TransactionRepository:
         self.db = db
 
     async def create(self, transaction: Transaction) -> Transaction:
-        """Persist a Transaction and return the refreshed instance."""
+        """
+        Persist a Transaction, committing it together with any pending changes
+        of the session (e.g. the balance update it records).
+
+        Server defaults (created_at, executed_at) come back from the INSERT's
+        RETURNING clause, so no refresh query is needed.
+        """
         if not getattr(transaction, "status", None):
             transaction.status = TransactionStatus.COMPLETED
 
         self.db.add(transaction)
         await self.db.commit()
-        await self.db.refresh(transaction)
         return transaction
 
     async def get_by_id(self, trans_id: UUID) -> Optional[Transaction]:
@@ -79,6 +182,7 @@ class TransactionRepository:
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
+    @read_only
     async def get_user_transactions(self, user_id: UUID) -> List[Transaction]:
         """Retrieve all transactions for a given user."""
         stmt = (
@@ -89,6 +193,7 @@ class TransactionRepository:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    @read_only
     async def get_user_transactions_count(self, user_id: UUID) -> int:
         """Return total number of transactions for a given user."""
         stmt = (
@@ -99,6 +204,7 @@ class TransactionRepository:
         result = await self.db.execute(stmt)
         return int(result.scalar() or 0)
 
+    @read_only
     async def get_user_transactions_paginated(
         self, user_id: UUID, offset: int, limit: int
     ) -> List[Transaction]:
@@ -121,3 +227,36 @@ class TransactionRepository:
         )
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
+
+    @read_only
+    async def get_user_transactions_before(
+        self,
+        user_id: UUID,
+        limit: int,
+        cursor: Optional[tuple[datetime, UUID]] = None,
+    ) -> List[Transaction]:
+        """Retrieve the next page of a user's transactions using keyset pagination.
+
+        Ordering is by (created_at, id) descending, and rows are read straight
+        from the (owner_id, created_at DESC, id DESC) index, so the cost does not
+        grow with the depth of the page.
+
+        Args:
+            user_id (UUID): The user's ID.
+            limit (int): Max number of records to return.
+            cursor (Optional[tuple[datetime, UUID]]): (created_at, id) of the last
+                record of the previous page; None for the first page.
+
+        Returns:
+            List[Transaction]: Transactions older than the cursor.
+        """
+        stmt = select(Transaction).where(Transaction.owner_id == user_id)
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(Transaction.created_at, Transaction.id) < tuple_(*cursor)
+            )
+        stmt = stmt.order_by(
+            Transaction.created_at.desc(), Transaction.id.desc()
+        ).limit(limit)
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
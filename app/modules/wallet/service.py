@@ -1,4 +1,5 @@
 # app/modules/wallet/service.py
+from decimal import Decimal
 from typing import Any, Optional
 
 from fastapi import BackgroundTasks
@@ -6,25 +7,70 @@ from redis.asyncio import Redis
 
 from app.core.config import settings
 from app.core.middleware.logging import logger
-from app.core.utils.cache import cache_or_get, invalidate_cache
+from app.core.utils.cache import cache_or_get, write_through
 from app.core.utils.exceptions import CustomException
 from app.modules.shared.enums import (NotificationType, TransactionStatus,
                                       TransactionType)
-from app.modules.shared.helpers import transform_time
+from app.modules.shared.helpers import (decode_cursor, encode_cursor,
+                                        transform_time)
 from app.modules.user.models import User
 from app.modules.wallet.models import Transaction
 from app.modules.wallet.schemas import TransactionRequest
 
+BALANCE_CACHE_TTL = 300  # 5 minutes
+
+
+def _balance_snapshot(wallet) -> dict[str, Any]:
+    """Cached balance fields of a Wallet (or an `update_locked_amount` row)."""
+    total_balance = float(wallet.total_balance)
+    locked_amount = float(wallet.locked_amount)
+    return {
+        "total_balance": total_balance,
+        "locked_amount": locked_amount,
+        "available_balance": total_balance - locked_amount,
+        "version": wallet.version,
+    }
+
+
+async def refresh_wallet_caches(redis: Redis, user_id, wallet) -> None:
+    """
+    Update the caches of a wallet after a committed balance change: derived
+    entries (e.g. transaction pages) are invalidated and the new balance is
+    written through, in one atomic Redis call, so the next balance read does
+    not hit the database.
+
+    Args:
+        redis (Redis): Redis client.
+        user_id (UUID): Wallet owner.
+        wallet: The refreshed Wallet, or the row returned by `update_locked_amount`.
+    """
+    tag = f"wallet:{user_id}"
+    balance = _balance_snapshot(wallet)
+    version = balance.pop("version")
+
+    await write_through(
+        redis,
+        key=f"wallet_balance:{user_id}",
+        data=balance,
+        version=version,
+        ttl=BALANCE_CACHE_TTL,
+        tags=[tag],
+        invalidate=[tag],
+    )
+
 
 class WalletService:
     """Service for handling wallet operations including deposits and withdrawals."""
 
-    def __init__(self, wallet_repo, transaction_repo, notification_manager):
+    def __init__(self, wallet_repo, transaction_repo, user_repo, notification_manager):
         self.wallet_repo = wallet_repo
         self.transaction_repo = transaction_repo
+        self.user_repo = user_repo
         self.notification_manager = notification_manager
 
     async def _record_transaction(self, wallet, user, amount, tx_type):
+        # Commits the pending balance update and summary increment along with
+        # the ledger entry
         transaction = Transaction(
             amount=float(amount),
             type=tx_type,
@@ -32,6 +78,7 @@ class WalletService:
             wallet_id=wallet.id,
             owner_id=user.id,
         )
+        await self.user_repo.apply_transaction_to_summary(transaction)
         return await self.transaction_repo.create(transaction)
 
     async def _send_wallet_io_notification(
@@ -79,7 +126,8 @@ class WalletService:
     def _generate_transaction_response(self, wallet, transaction):
         return {
             "balance": float(wallet.total_balance),
-            "available_balance": wallet.available_balance,
+            "available_balance": float(wallet.total_balance)
+            - float(wallet.locked_amount),
             "transaction": {
                 "id": str(transaction.id),
                 "amount": float(transaction.amount),
@@ -94,6 +142,17 @@ class WalletService:
             },
         }
 
+    @staticmethod
+    def _serialize_transaction(tx: Transaction) -> dict[str, Any]:
+        return {
+            "id": str(tx.id),
+            "amount": float(tx.amount),
+            "type": tx.type.value,
+            "status": tx.status.value,
+            "created_at": tx.created_at.isoformat() if tx.created_at else None,
+            "executed_at": tx.executed_at.isoformat() if tx.executed_at else None,
+        }
+
     async def get_balance(self, redis: Redis, current_user: User) -> dict[str, Any]:
         """
         Get the wallet balance for the current user with caching.
@@ -114,17 +173,15 @@ class WalletService:
                     "Wallet not found. Please contact support."
                 )
 
-            return {
-                "total_balance": float(wallet.total_balance),
-                "locked_amount": float(wallet.locked_amount),
-                "available_balance": wallet.available_balance,
-            }
+            return _balance_snapshot(wallet)
 
         return await cache_or_get(
             redis=redis,
             key=cache_key,
             fetch_func=fetch_balance,
-            ttl=300,  # Cache for 5 minutes
+            ttl=BALANCE_CACHE_TTL,
+            tags=[f"wallet:{current_user.id}"],
+            version_field="version",
         )
 
     async def get_transactions(
@@ -174,19 +231,7 @@ class WalletService:
                     )
                 )
 
-            tx_payload = [
-                {
-                    "id": str(tx.id),
-                    "amount": float(tx.amount),
-                    "type": tx.type.value,
-                    "status": tx.status.value,
-                    "created_at": tx.created_at.isoformat() if tx.created_at else None,
-                    "executed_at": tx.executed_at.isoformat()
-                    if tx.executed_at
-                    else None,
-                }
-                for tx in transactions
-            ]
+            tx_payload = [self._serialize_transaction(tx) for tx in transactions]
 
             return {
                 "transactions": tx_payload,
@@ -202,10 +247,91 @@ class WalletService:
             key=cache_key,
             fetch_func=fetch_transactions,
             ttl=600,
+            tags=[f"wallet:{current_user.id}"],
         )
 
         return transactions_data
 
+    async def get_transactions_by_cursor(
+        self,
+        redis: Redis,
+        current_user: User,
+        cursor: Optional[str],
+        limit: int,
+        include_total: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Return the next page of transactions for the current user using keyset
+        pagination, so deep pages cost the same as the first one.
+
+        Transactions are ordered by (created_at, id) descending (most recent first).
+
+        Args:
+            current_user (User): The authenticated user.
+            cursor (Optional[str]): Opaque `next_cursor` of the previous page;
+                None for the first page.
+            limit (int): Number of items per page.
+            include_total (bool): Also count all transactions of the user
+                (one extra COUNT query per uncached page).
+
+        Returns:
+            dict[str, Any]: Transaction payload containing:
+                - transactions: list of transaction dicts
+                - next_cursor: cursor for the next page, or None on the last page
+                - has_more: whether more transactions follow
+                - total_transactions: total transaction count (only if requested)
+
+        Raises:
+            HTTPException: 400 Bad Request if the cursor is malformed.
+        """
+        position = None
+        if cursor:
+            try:
+                position = decode_cursor(cursor)
+            except ValueError:
+                raise CustomException.e400_bad_request("Invalid pagination cursor.")
+
+        cache_key = (
+            f"wallet_transactions:{current_user.id}:cursor:{cursor or 'start'}"
+            f":size:{limit}:total:{int(include_total)}"
+        )
+
+        async def fetch_transactions():
+            # One extra row tells whether another page follows
+            transactions = await self.transaction_repo.get_user_transactions_before(
+                current_user.id, limit=limit + 1, cursor=position
+            )
+            has_more = len(transactions) > limit
+            transactions = transactions[:limit]
+
+            next_cursor = None
+            if has_more:
+                last = transactions[-1]
+                next_cursor = encode_cursor(last.created_at, last.id)
+
+            data = {
+                "transactions": [
+                    self._serialize_transaction(tx) for tx in transactions
+                ],
+                "next_cursor": next_cursor,
+                "has_more": has_more,
+            }
+            if include_total:
+                data["total_transactions"] = (
+                    await self.transaction_repo.get_user_transactions_count(
+                        current_user.id
+                    )
+                )
+            return data
+
+        return await cache_or_get(
+            redis=redis,
+            key=cache_key,
+            fetch_func=fetch_transactions,
+            ttl=600,
+            tags=[f"wallet:{current_user.id}"],
+        )
+
     async def deposit(
         self,
         redis: Redis,
@@ -216,8 +342,9 @@ class WalletService:
         """
         Process a deposit transaction for the user's wallet.
 
-        Validates the amount is positive, updates the wallet balance by adding
-        the amount, and records a DEPOSIT transaction with status COMPLETED.
+        Validates the amount is positive, adds it to the wallet balance in a single
+        UPDATE and records a DEPOSIT transaction with status COMPLETED, both in
+        one database transaction.
 
         Args:
             transaction_request (TransactionRequest): Transaction details including amount and optional currency.
@@ -226,12 +353,6 @@ class WalletService:
         Returns:
             dict[str, Any]: Dictionary containing updated balance and transaction details.
         """
-        wallet = await self.wallet_repo.get_wallet_by_user_id(current_user.id)
-        if not wallet:
-            raise CustomException.e404_not_found(
-                "Wallet not found. Please contact support."
-            )
-
         min_deposit = settings.MIN_WALLET_TRANSACTION_AMOUNT
         max_deposit = settings.MAX_WALLET_TRANSACTION_AMOUNT
         if (
@@ -242,8 +363,13 @@ class WalletService:
                 f"Transaction amount must be between {min_deposit} and {max_deposit} {current_user.preferred_currency.value}"
             )
 
-        new_balance = float(wallet.total_balance) + float(transaction_request.amount)
-        wallet = await self.wallet_repo.update(wallet, {"total_balance": new_balance})
+        wallet = await self.wallet_repo.apply_balance_delta(
+            current_user.id, Decimal(str(transaction_request.amount))
+        )
+        if not wallet:
+            raise CustomException.e404_not_found(
+                "Wallet not found. Please contact support."
+            )
 
         transaction = await self._record_transaction(
             wallet,
@@ -252,8 +378,7 @@ class WalletService:
             tx_type=TransactionType.WALLET_DEPOSIT,
         )
 
-        await invalidate_cache(redis, f"wallet_transactions:{current_user.id}:*")
-        await invalidate_cache(redis, f"wallet_balance:{current_user.id}")
+        await refresh_wallet_caches(redis, current_user.id, wallet)
 
         await self._send_wallet_io_notification(
             current_user, wallet, transaction_request, transaction, background_tasks
@@ -270,9 +395,10 @@ class WalletService:
         """
         Process a withdrawal transaction from the user's wallet.
 
-        Validates the amount is positive and that the wallet has sufficient
-        available balance. Updates the wallet balance by subtracting the amount
-        and records a WITHDRAW transaction with status COMPLETED.
+        Validates the amount is positive, then subtracts it from the wallet balance
+        in a single UPDATE that only matches if the available balance covers it,
+        and records a WITHDRAW transaction with status COMPLETED, both in one
+        database transaction.
 
         Args:
             transaction_request (TransactionRequest): Transaction details including amount and optional currency.
@@ -281,13 +407,6 @@ class WalletService:
         Returns:
             dict[str, Any]: Dictionary containing updated balance and transaction details.
         """
-        wallet = await self.wallet_repo.get_wallet_by_user_id(current_user.id)
-
-        if not wallet:
-            raise CustomException.e404_not_found(
-                "Wallet not found. Please contact support."
-            )
-
         min_withdrawal = settings.MIN_WALLET_TRANSACTION_AMOUNT
         max_withdrawal = settings.MAX_WALLET_TRANSACTION_AMOUNT
         if (
@@ -298,14 +417,22 @@ class WalletService:
                 f"Transaction amount must be between {min_withdrawal} and {max_withdrawal} {current_user.preferred_currency.value}"
             )
 
-        available_balance = wallet.available_balance
-        if available_balance < float(transaction_request.amount):
+        amount = Decimal(str(transaction_request.amount))
+        # The funds check is part of the UPDATE, so concurrent withdrawals
+        # cannot overdraw the wallet
+        wallet = await self.wallet_repo.apply_balance_delta(
+            current_user.id, -amount, min_available=amount
+        )
+        if not wallet:
+            existing = await self.wallet_repo.get_wallet_by_user_id(current_user.id)
+            if not existing:
+                raise CustomException.e404_not_found(
+                    "Wallet not found. Please contact support."
+                )
             raise CustomException.e400_bad_request(
-                f"Insufficient funds. Available balance: {available_balance:.4f}"
+                f"Insufficient funds. Available balance: {existing.available_balance:.4f}"
             )
 
-        new_balance = float(wallet.total_balance) - float(transaction_request.amount)
-        wallet = await self.wallet_repo.update(wallet, {"total_balance": new_balance})
         transaction = await self._record_transaction(
             wallet,
             user=current_user,
@@ -313,8 +440,7 @@ class WalletService:
             tx_type=TransactionType.WALLET_WITHDRAWAL,
         )
 
-        await invalidate_cache(redis, f"wallet_transactions:{current_user.id}:*")
-        await invalidate_cache(redis, f"wallet_balance:{current_user.id}")
+        await refresh_wallet_caches(redis, current_user.id, wallet)
 
         await self._send_wallet_io_notification(
             current_user, wallet, transaction_request, transaction, background_tasks
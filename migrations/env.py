@@ -14,7 +14,7 @@ from app.modules.ims.models import IMSAction, ScheduledTransaction
 # ================================
 # MODELS
 # ================================
-from app.modules.user.models import User
+from app.modules.user.models import User, UserTransactionSummary
 from app.modules.wallet.models import ExchangeRate, Transaction, Wallet
 
 # this is the Alembic Config object, which provides
@@ -0,0 +1,40 @@
+"""add scheduled transaction due index
+
+Revision ID: 4f8b1d3e7a92
+Revises: 9a4d2c6e8b17
+Create Date: 2026-10-17 13:12:05.418273
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4f8b1d3e7a92"
+down_revision: Union[str, Sequence[str], None] = "9a4d2c6e8b17"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Partial index for the scheduler's due-work lookups (active rows only).
+    op.create_index(
+        "ix_scheduled_transaction_active_next_run_at",
+        "scheduled_transaction",
+        ["next_run_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'ACTIVE'"),
+    )
+    # ### end Alembic commands ###
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Remove scheduler due index.
+    op.drop_index(
+        "ix_scheduled_transaction_active_next_run_at",
+        table_name="scheduled_transaction",
+    )
+    # ### end Alembic commands ###
@@ -0,0 +1,36 @@
+"""add transaction keyset index
+
+Revision ID: 5c2e8d7f1a63
+Revises: b3f1a9c2d4e5
+Create Date: 2026-10-17 11:02:48.731560
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c2e8d7f1a63"
+down_revision: Union[str, Sequence[str], None] = "b3f1a9c2d4e5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Composite index for keyset pagination of a user's transaction history.
+    op.create_index(
+        "ix_transaction_owner_id_created_at_id",
+        "transaction",
+        ["owner_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+    # ### end Alembic commands ###
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Remove keyset pagination index.
+    op.drop_index("ix_transaction_owner_id_created_at_id", table_name="transaction")
+    # ### end Alembic commands ###
@@ -0,0 +1,106 @@
+"""add user transaction summary table
+
+Revision ID: 9a4d2c6e8b17
+Revises: 5c2e8d7f1a63
+Create Date: 2026-10-17 12:41:09.553281
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "9a4d2c6e8b17"
+down_revision: Union[str, Sequence[str], None] = "5c2e8d7f1a63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Per-user transaction aggregates for financial analytics.
+    # Kept up to date by upserts on every new transaction; backfilled below and
+    # repairable with scripts/maintenance/rebuild_transaction_summaries.py.
+    op.create_table(
+        "user_transaction_summary",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "total_transactions",
+            sa.Integer(),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+        sa.Column(
+            "total_amount_in",
+            sa.Numeric(15, 4),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+        sa.Column(
+            "total_amount_out",
+            sa.Numeric(15, 4),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+        sa.Column(
+            "deposit_count", sa.Integer(), nullable=False, server_default=sa.text("0")
+        ),
+        sa.Column(
+            "withdrawal_count",
+            sa.Integer(),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+        sa.Column(
+            "group_contribution_count",
+            sa.Integer(),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+        sa.Column(
+            "solo_contribution_count",
+            sa.Integer(),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default="now()",
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["app_user.id"]),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    # Backfill existing users from their transaction history
+    op.execute(
+        """
+        INSERT INTO user_transaction_summary (
+            user_id, total_transactions, total_amount_in, total_amount_out,
+            deposit_count, withdrawal_count, group_contribution_count,
+            solo_contribution_count
+        )
+        SELECT
+            owner_id,
+            count(id),
+            coalesce(sum(amount) FILTER (WHERE type = 'WALLET_DEPOSIT'), 0),
+            coalesce(sum(amount) FILTER (WHERE type = 'WALLET_WITHDRAWAL'), 0),
+            count(id) FILTER (WHERE type = 'WALLET_DEPOSIT'),
+            count(id) FILTER (WHERE type = 'WALLET_WITHDRAWAL'),
+            count(id) FILTER (WHERE type = 'GROUP_SAVINGS_DEPOSIT'),
+            count(id) FILTER (WHERE type = 'INDIVIDUAL_SAVINGS_DEPOSIT')
+        FROM "transaction"
+        WHERE owner_id IS NOT NULL
+        GROUP BY owner_id
+        """
+    )
+    # ### end Alembic commands ###
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Drop per-user transaction aggregates.
+    op.drop_table("user_transaction_summary")
+    # ### end Alembic commands ###
@@ -0,0 +1,39 @@
+"""add version to wallet
+
+Revision ID: b3f1a9c2d4e5
+Revises: 1e224c0fa607
+Create Date: 2026-10-17 10:12:31.402118
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3f1a9c2d4e5"
+down_revision: Union[str, Sequence[str], None] = "1e224c0fa607"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Add `version` counter, bumped on every balance change.
+    op.add_column(
+        "wallet",
+        sa.Column(
+            "version",
+            sa.Integer(),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+    )
+    # ### end Alembic commands ###
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Remove `version` counter from wallet.
+    op.drop_column("wallet", "version")
+    # ### end Alembic commands ###
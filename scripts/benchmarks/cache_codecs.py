@@ -0,0 +1,146 @@
+# scripts/benchmarks/cache_codecs.py
+"""
+Compare cache codecs on the payloads the API actually caches.
+
+Reports encode/decode time per call and stored size per key. With --redis-url,
+each value is also written to Redis and `MEMORY USAGE` is reported.
+
+Usage:
+    python scripts/benchmarks/cache_codecs.py [--redis-url redis://localhost:6379/0]
+"""
+
+import argparse
+import asyncio
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from app.core.utils.cache_codec import decode, encode  # noqa: E402
+from app.modules.shared.enums import (Currency, Role,  # noqa: E402
+                                      TransactionStatus, TransactionType)
+from app.modules.user.models import User  # noqa: E402
+
+VARIANTS = [
+    ("json", "none"),
+    ("msgpack", "none"),
+    ("msgpack", "zlib"),
+    ("msgpack", "lz4"),
+]
+
+
+def build_payloads() -> dict:
+    now = datetime.now(timezone.utc)
+    user = User(
+        email="john.doe@example.com",
+        full_name="John Doe",
+        stag="johndoe",
+        password_hash="$2b$12$" + "x" * 53,
+        role=Role.USER,
+        is_verified=True,
+        is_enabled=True,
+        is_deleted=False,
+        is_anonymized=False,
+        created_at=now,
+        updated_at=now,
+        last_login_at=now,
+        preferred_currency=Currency.EUR,
+    )
+
+    def transactions_page(size: int) -> dict:
+        return {
+            "transactions": [
+                {
+                    "id": str(uuid4()),
+                    "amount": 125.5,
+                    "type": TransactionType.WALLET_DEPOSIT.value,
+                    "status": TransactionStatus.COMPLETED.value,
+                    "created_at": (now - timedelta(hours=i)).isoformat(),
+                    "executed_at": (now - timedelta(hours=i)).isoformat(),
+                }
+                for i in range(size)
+            ],
+            "page": 1,
+            "page_size": size,
+            "total_pages": 50,
+            "total_transactions": 50 * size,
+        }
+
+    return {
+        "user_current": user.model_dump(),
+        "wallet_balance": {
+            "total_balance": 1520.75,
+            "locked_amount": 200.0,
+            "available_balance": 1320.75,
+        },
+        "wallet_transactions (10)": transactions_page(10),
+        "wallet_transactions (100)": transactions_page(100),
+        "api_health": {
+            "uptime": "0.0d 3h 12m 5s",
+            "hostname": "api-smartsave",
+            "db_status": "running",
+            "cache_status": "running",
+            "last_request_latency_ms": 12.3,
+            "last_request_path": "/v1/wallet/balance",
+            "last_request_method": "GET",
+            "system_metrics": {"cpu_usage_percent": 7.5, "memory_usage_percent": 41.2},
+        },
+    }
+
+
+def time_call(func, number: int) -> float:
+    """Return the mean time of `func` in microseconds."""
+    return timeit.timeit(func, number=number) / number * 1_000_000
+
+
+async def redis_memory_usage(redis_url: str, key: str, value: bytes) -> int:
+    import redis.asyncio as redis
+
+    client = redis.from_url(redis_url)
+    try:
+        await client.set(key, value, ex=60)
+        return await client.memory_usage(key)
+    finally:
+        await client.delete(key)
+        await client.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--redis-url", help="Also report Redis MEMORY USAGE per key")
+    parser.add_argument("--number", type=int, default=2000, help="Calls per timing")
+    args = parser.parse_args()
+
+    header = f"{'payload':<28}{'codec':<16}{'encode us':>11}{'decode us':>11}{'bytes':>8}"
+    if args.redis_url:
+        header += f"{'redis mem':>11}"
+    print(header)
+    print("-" * len(header))
+
+    for name, data in build_payloads().items():
+        for codec, compression in VARIANTS:
+            encoded = encode(data, codec=codec, compression=compression)
+            encode_us = time_call(
+                lambda: encode(data, codec=codec, compression=compression),
+                args.number,
+            )
+            decode_us = time_call(lambda: decode(encoded), args.number)
+
+            row = (
+                f"{name:<28}{codec + '+' + compression:<16}"
+                f"{encode_us:>11.1f}{decode_us:>11.1f}{len(encoded):>8}"
+            )
+            if args.redis_url:
+                memory = asyncio.run(
+                    redis_memory_usage(args.redis_url, f"bench:{name}", encoded)
+                )
+                row += f"{memory:>11}"
+            print(row)
+        print()
+
+
+if __name__ == "__main__":
+    main()
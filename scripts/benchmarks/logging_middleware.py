@@ -0,0 +1,150 @@
+# scripts/benchmarks/logging_middleware.py
+"""
+Compare requests/sec of the application with the request logging middleware
+implemented on BaseHTTPMiddleware (the old behaviour) vs. as pure ASGI.
+
+Runs the real application in-process through httpx's ASGI transport, so the
+numbers show framework and middleware overhead rather than network cost. The
+wallet balance route is served with its authentication and service
+dependencies overridden (no database or Redis needed) and rate limiting off.
+
+Usage:
+    python scripts/benchmarks/logging_middleware.py [--requests 3000] [--concurrency 50]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import httpx
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+# Importing the app needs these; nothing connects to them
+for name, value in {
+    "APP_NAME": "SmartSave",
+    "IP_HASH_SALT": "benchmark-salt",
+    "REDIS_URL": "redis://localhost:6379",
+    "DB_HOST": "localhost",
+    "DB_PORT": "5432",
+}.items():
+    os.environ.setdefault(name, value)
+
+import app.main as main_module  # noqa: E402
+from app.api.dependencies import (get_current_user,  # noqa: E402
+                                  get_redis, get_wallet_service)
+from app.core.middleware import logging as logging_module  # noqa: E402
+from app.core.middleware.logging import (LoggingMiddleware,  # noqa: E402
+                                         get_request_log_message, hash_ip,
+                                         logger, set_latest_latency_filtered)
+from app.core.middleware.rate_limiter import limiter  # noqa: E402
+from app.core.security.principal import Principal  # noqa: E402
+from app.modules.shared.enums import Currency, Role  # noqa: E402
+
+
+class BaseHTTPLoggingMiddleware(BaseHTTPMiddleware):
+    """Request logging as it was before the pure ASGI middleware."""
+
+    async def dispatch(self, request: Request, call_next):
+        masked_ip = hash_ip(request.client.host)
+        start_time = time.time()
+        response = await call_next(request)
+        process_time = (time.time() - start_time) * 1000
+        set_latest_latency_filtered(request.scope, process_time, response.status_code)
+
+        logger.info(
+            msg=get_request_log_message(response.status_code),
+            extra={
+                "method": request.method,
+                "path": request.url.path,
+                "status_code": response.status_code,
+                "completed_in_ms": process_time,
+                "ip_anonymized": masked_ip,
+            },
+        )
+        return response
+
+
+class StubWalletService:
+    async def get_balance(self, redis, current_user):
+        return {"total_balance": 120.0, "locked_amount": 20.0, "available_balance": 100.0}
+
+
+PRINCIPAL = Principal(
+    id=uuid.uuid4(),
+    email="john.doe@example.com",
+    role=Role.USER,
+    token_version=0,
+    is_verified=True,
+    is_enabled=True,
+    is_deleted=False,
+    preferred_currency=Currency.EUR,
+)
+
+
+def use_logging_middleware(middleware_class) -> None:
+    app = main_module.main_app
+    for i, middleware in enumerate(app.user_middleware):
+        if middleware.cls in (LoggingMiddleware, BaseHTTPLoggingMiddleware):
+            app.user_middleware[i].cls = middleware_class
+    app.middleware_stack = None  # rebuilt on the next request
+
+
+async def drive(path: str, requests: int, concurrency: int) -> float:
+    """Send `requests` GETs with `concurrency` in flight; return requests/s."""
+    transport = httpx.ASGITransport(app=main_module.main_app, client=("10.0.0.1", 1234))
+    remaining = iter(range(requests))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker():
+            for _ in remaining:
+                response = await client.get(path)
+                response.raise_for_status()
+
+        await client.get(path)  # warm up
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return requests / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=3000, help="Requests per run")
+    parser.add_argument(
+        "--concurrency", type=int, default=50, help="Requests in flight"
+    )
+    args = parser.parse_args()
+
+    # Keep log writes out of the measurement; records are still built and enqueued
+    logging_module.log_listener.handlers = ()
+    limiter.enabled = False
+    app = main_module.main_app
+    app.dependency_overrides[get_redis] = lambda: None
+    app.dependency_overrides[get_current_user] = lambda: PRINCIPAL
+    app.dependency_overrides[get_wallet_service] = lambda: StubWalletService()
+
+    paths = ("/", "/v1/wallet/balance")
+    modes = (("BaseHTTP", BaseHTTPLoggingMiddleware), ("pure ASGI", LoggingMiddleware))
+
+    header = f"{'path':<22}" + "".join(f"{name + ' req/s':>18}" for name, _ in modes)
+    print(f"{args.requests} requests, {args.concurrency} in flight\n")
+    print(header)
+    print("-" * len(header))
+    for path in paths:
+        row = f"{path:<22}"
+        for _, middleware_class in modes:
+            use_logging_middleware(middleware_class)
+            rps = asyncio.run(drive(path, args.requests, args.concurrency))
+            row += f"{rps:>18.0f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# scripts/benchmarks/password_hashing.py
+"""
+Measure event-loop lag while bcrypt verifications run, inline vs. offloaded.
+
+A ticker coroutine sleeps for a fixed interval and records how late it wakes
+up, standing in for every other request on the worker, while a burst of
+concurrent logins verifies passwords. Modes:
+- inline: verify_password called on the event loop (the old behaviour)
+- threads: PasswordHasher with PASSWORD_HASH_WORKERS=0
+- processes: PasswordHasher with a process pool
+
+Usage:
+    python scripts/benchmarks/password_hashing.py [--logins 32] [--rounds 12] [--workers 2]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from app.core.security.hashing import (hash_password,  # noqa: E402
+                                       verify_password)
+from app.core.security.password_hasher import PasswordHasher  # noqa: E402
+
+TICK_S = 0.005
+
+
+async def measure_lag(stop: asyncio.Event) -> list[float]:
+    """Return how late (ms) each tick woke up until `stop` is set."""
+    lags = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(TICK_S)
+        lags.append((time.perf_counter() - started - TICK_S) * 1000)
+    return lags
+
+
+async def run(mode: str, logins: int, rounds: int, workers: int) -> dict:
+    hashed = hash_password("Test@123", rounds)
+    hasher = PasswordHasher(
+        workers=workers if mode == "processes" else 0,
+        max_pending=logins,
+        rounds=rounds,
+    )
+
+    async def login():
+        if mode == "inline":
+            return verify_password("Test@123", hashed)
+        return await hasher.verify("Test@123", hashed)
+
+    if mode == "processes":
+        # Start the pool outside the measured window
+        await asyncio.gather(*(hasher.verify("x", hashed) for _ in range(workers)))
+
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(measure_lag(stop))
+    await asyncio.sleep(TICK_S * 2)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    lags = await ticker
+    hasher.shutdown()
+
+    lags.sort()
+    return {
+        "elapsed_s": elapsed,
+        "lag_p50_ms": statistics.median(lags),
+        "lag_p99_ms": lags[min(len(lags) - 1, int(len(lags) * 0.99))],
+        "lag_max_ms": lags[-1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--logins", type=int, default=32, help="Concurrent logins")
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt work factor")
+    parser.add_argument("--workers", type=int, default=2, help="Hashing processes")
+    args = parser.parse_args()
+
+    header = f"{'mode':<12}{'total s':>9}{'lag p50 ms':>12}{'lag p99 ms':>12}{'lag max ms':>12}"
+    print(f"{args.logins} concurrent logins, bcrypt rounds={args.rounds}\n")
+    print(header)
+    print("-" * len(header))
+    for mode in ("inline", "threads", "processes"):
+        result = asyncio.run(run(mode, args.logins, args.rounds, args.workers))
+        print(
+            f"{mode:<12}{result['elapsed_s']:>9.2f}{result['lag_p50_ms']:>12.1f}"
+            f"{result['lag_p99_ms']:>12.1f}{result['lag_max_ms']:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
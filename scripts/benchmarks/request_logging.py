@@ -0,0 +1,148 @@
+# scripts/benchmarks/request_logging.py
+"""
+Compare hello-world throughput with per-request logging done through the
+default executor vs. the bounded logging queue.
+
+Both modes run the same FastAPI app and JSON formatter and write to a file:
+- executor: every request awaits run_in_executor(logger.info) into a
+  StreamHandler (the old behaviour)
+- queue: LoggingMiddleware enqueues the record and the listener thread
+  writes in batches (LoggingMiddleware is now pure ASGI, so this
+  also includes that saving; see logging_middleware.py to isolate it)
+
+Requests are driven in-process through httpx's ASGI transport, so the
+numbers show middleware overhead rather than network cost.
+
+Usage:
+    python scripts/benchmarks/request_logging.py [--requests 5000] [--concurrency 50]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import queue
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+os.environ.setdefault("IP_HASH_SALT", "benchmark-salt")
+
+from app.core.middleware import logging as logging_module  # noqa: E402
+from app.core.middleware.logging import (BatchQueueListener,  # noqa: E402
+                                         BatchStreamHandler, JsonFormatter,
+                                         LoggingMiddleware,
+                                         SamplingQueueHandler, hash_ip,
+                                         logger)
+
+
+class ExecutorLoggingMiddleware(BaseHTTPMiddleware):
+    """Request logging as it was before the queue pipeline."""
+
+    async def dispatch(self, request: Request, call_next):
+        masked_ip = hash_ip(request.client.host)
+        start_time = time.time()
+        response = await call_next(request)
+        process_time = (time.time() - start_time) * 1000
+
+        await asyncio.get_running_loop().run_in_executor(
+            None,
+            lambda: logger.info(
+                msg="Request successful",
+                extra={
+                    "method": request.method,
+                    "path": request.url.path,
+                    "status_code": response.status_code,
+                    "completed_in_ms": process_time,
+                    "ip_anonymized": masked_ip,
+                },
+            ),
+        )
+        return response
+
+
+def build_app(middleware) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/hello")
+    async def hello():
+        return {"message": "hello"}
+
+    app.add_middleware(middleware)
+    return app
+
+
+async def drive(app: FastAPI, requests: int, concurrency: int) -> float:
+    """Send `requests` GETs with `concurrency` in flight; return requests/s."""
+    transport = httpx.ASGITransport(app=app, client=("10.0.0.1", 1234))
+    remaining = iter(range(requests))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker():
+            for _ in remaining:
+                response = await client.get("/hello")
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return requests / (time.perf_counter() - started)
+
+
+def run(mode: str, log_path: Path, requests: int, concurrency: int) -> float:
+    logger.handlers.clear()
+    listener = None
+
+    if mode == "executor":
+        handler = logging.StreamHandler(open(log_path, "w"))
+        handler.setFormatter(JsonFormatter())
+        logger.addHandler(handler)
+        app = build_app(ExecutorLoggingMiddleware)
+    else:
+        handler = BatchStreamHandler(open(log_path, "w"))
+        handler.setFormatter(JsonFormatter())
+        log_queue = queue.Queue(maxsize=10_000)
+        logger.addHandler(SamplingQueueHandler(log_queue, sample_rate=10))
+        listener = BatchQueueListener(log_queue, handler, batch_size=256)
+        listener.start()
+        app = build_app(LoggingMiddleware)
+
+    try:
+        return asyncio.run(drive(app, requests, concurrency))
+    finally:
+        if listener:
+            listener.stop()
+        handler.close()
+        handler.stream.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000, help="Requests per mode")
+    parser.add_argument(
+        "--concurrency", type=int, default=50, help="Requests in flight"
+    )
+    args = parser.parse_args()
+
+    logging_module.log_listener.stop()
+
+    header = f"{'mode':<10}{'req/s':>10}{'log lines':>11}"
+    print(f"{args.requests} requests, {args.concurrency} in flight\n")
+    print(header)
+    print("-" * len(header))
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ("executor", "queue"):
+            log_path = Path(tmp) / f"{mode}.log"
+            rps = run(mode, log_path, args.requests, args.concurrency)
+            lines = sum(1 for _ in open(log_path))
+            print(f"{mode:<10}{rps:>10.0f}{lines:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# scripts/maintenance/rebuild_transaction_summaries.py
+"""
+Rebuild the per-user transaction summaries behind the financial analytics
+endpoint from the full transaction history.
+
+The `user_transaction_summary` migration already backfills every user; run this
+to repair drifted rows, or with --user-id for a single user.
+
+Usage:
+    python scripts/maintenance/rebuild_transaction_summaries.py [--user-id UUID]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from uuid import UUID
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from app.infra.database.session import AsyncSessionLocal  # noqa: E402
+from app.modules.user.repository import UserRepository  # noqa: E402
+
+
+async def rebuild(user_id: UUID | None) -> int:
+    async with AsyncSessionLocal() as db:
+        return await UserRepository(db).rebuild_transaction_summaries(user_id)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--user-id", type=UUID, help="Only rebuild this user")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    written = asyncio.run(rebuild(args.user_id))
+    print(f"Rebuilt {written} summary row(s) in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
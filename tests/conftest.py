@@ -1,7 +1,11 @@
 import os
 import sys
+import tempfile
 from pathlib import Path
 
 # Add the project root directory to Python path
 root_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(root_dir))
+
+# Keep log files written during tests out of the source tree
+os.environ.setdefault("LOG_DIR", tempfile.mkdtemp(prefix="savings-test-logs-"))
@@ -0,0 +1,101 @@
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.security.hashing import (UNUSABLE_PASSWORD_HASH, hash_password,
+                                       verify_password)
+from app.modules.gdpr.repository import GDPRRepository
+from app.modules.user.repository import UserRepository
+
+# cron_jobs creates the DB engine and Redis client on import; their settings
+# may be unset in CI
+with patch("sqlalchemy.ext.asyncio.create_async_engine"), patch(
+    "redis.asyncio.Redis.from_url"
+):
+    from app.core.tasks import cron_jobs
+
+
+def compiled(db) -> str:
+    stmt = db.execute.await_args.args[0]
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def db():
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value=MagicMock())
+    return db
+
+
+@pytest.mark.asyncio
+async def test_anonymization_commits_per_keyset_chunk():
+    first = sorted(uuid.uuid4() for _ in range(2))
+    second = [uuid.uuid4()]
+    user_repo = AsyncMock()
+    user_repo.claim_users_to_anonymize = AsyncMock(side_effect=[first, second, []])
+    gdpr_repo = AsyncMock()
+    session = AsyncMock()
+
+    with patch.multiple(
+        cron_jobs,
+        UserRepository=MagicMock(return_value=user_repo),
+        GDPRRepository=MagicMock(return_value=gdpr_repo),
+        AsyncSessionLocal=MagicMock(),
+    ), patch("app.core.tasks.cron_jobs.settings.ANONYMIZATION_BATCH_SIZE", 2):
+        cron_jobs.AsyncSessionLocal.return_value.__aenter__.return_value = session
+
+        anonymized = await cron_jobs.anonymize_soft_deleted_users()
+
+    assert anonymized == 3
+    assert session.commit.await_count == 2
+    # Each chunk resumes after the last ID of the previous one
+    cursors = [
+        call.kwargs["after_id"]
+        for call in user_repo.claim_users_to_anonymize.await_args_list
+    ]
+    assert cursors == [None, first[-1], second[-1]]
+    assert user_repo.claim_users_to_anonymize.await_args.args[1] == 2
+    gdpr_repo.snapshot_users_for_anonymization.assert_any_await(first)
+    user_repo.anonymize_users.assert_awaited_with(second, UNUSABLE_PASSWORD_HASH)
+
+
+@pytest.mark.asyncio
+async def test_claim_users_to_anonymize_query(db):
+    await UserRepository(db).claim_users_to_anonymize(
+        datetime.now(timezone.utc), 100, after_id=uuid.uuid4()
+    )
+
+    sql = compiled(db)
+    assert sql.startswith("SELECT app_user.id")
+    assert "app_user.id >" in sql
+    assert "ORDER BY app_user.id" in sql
+    assert sql.endswith("FOR UPDATE SKIP LOCKED")
+
+
+@pytest.mark.asyncio
+async def test_anonymize_users_is_one_update(db):
+    await UserRepository(db).anonymize_users([uuid.uuid4()], UNUSABLE_PASSWORD_HASH)
+
+    sql = compiled(db)
+    assert sql.startswith("UPDATE app_user SET")
+    assert "email=concat(" in sql
+    assert "WHERE app_user.id IN" in sql
+    db.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_gdpr_snapshot_is_one_update_from_users(db):
+    await GDPRRepository(db).snapshot_users_for_anonymization([uuid.uuid4()])
+
+    sql = compiled(db)
+    assert "user_email_snapshot=app_user.email" in sql
+    assert "FROM app_user WHERE gdpr_request.user_id = app_user.id" in sql
+
+
+def test_unusable_password_never_verifies():
+    assert not verify_password("", UNUSABLE_PASSWORD_HASH)
+    assert not verify_password("unusable", UNUSABLE_PASSWORD_HASH)
+    assert verify_password("secret", hash_password("secret"))
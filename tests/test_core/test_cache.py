@@ -0,0 +1,548 @@
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.utils import cache as cache_module
+from app.core.utils import cache_codec
+from app.core.utils.cache import (_MISSING, LocalCache, cache_or_get,
+                                  cache_stats, invalidate_cache,
+                                  invalidate_many, invalidate_tags,
+                                  local_cache, write_through)
+
+
+@pytest.fixture(autouse=True)
+def reset_cache_state(monkeypatch):
+    monkeypatch.setattr(cache_module.settings, "LOCAL_CACHE_ENABLED", True)
+    monkeypatch.setattr(cache_module.settings, "LOCAL_CACHE_TTL", 30)
+    local_cache.clear()
+    cache_stats.reset()
+    yield
+    local_cache.clear()
+    cache_stats.reset()
+
+
+@pytest.fixture
+def mock_redis():
+    redis = AsyncMock()
+    redis.get.return_value = None
+    redis.scan.return_value = (0, [])
+    # pipeline() is synchronous; queued commands run on execute()
+    redis.pipeline = MagicMock(return_value=MagicMock(execute=AsyncMock()))
+    return redis
+
+
+# ---------------------------
+# LocalCache tests
+# ---------------------------
+class TestLocalCache:
+    def test_get_returns_stored_value(self):
+        lc = LocalCache(max_entries=10, max_bytes=1000)
+        lc.set("a", {"x": 1}, ttl=30, size=10)
+        assert lc.get("a") == {"x": 1}
+        assert lc.get("b") is _MISSING
+
+    def test_expired_entry_is_dropped(self):
+        lc = LocalCache(max_entries=10, max_bytes=1000)
+        with patch("app.core.utils.cache.time.monotonic", return_value=100.0):
+            lc.set("a", 1, ttl=5, size=1)
+        with patch("app.core.utils.cache.time.monotonic", return_value=106.0):
+            assert lc.get("a") is _MISSING
+        assert len(lc) == 0
+        assert lc.size_bytes == 0
+
+    def test_evicts_least_recently_used_by_count(self):
+        lc = LocalCache(max_entries=2, max_bytes=1000)
+        lc.set("a", 1, ttl=30, size=1)
+        lc.set("b", 2, ttl=30, size=1)
+        lc.get("a")  # "b" becomes least recently used
+        lc.set("c", 3, ttl=30, size=1)
+
+        assert lc.get("b") is _MISSING
+        assert lc.get("a") == 1
+        assert lc.get("c") == 3
+
+    def test_evicts_by_size(self):
+        lc = LocalCache(max_entries=10, max_bytes=100)
+        lc.set("a", 1, ttl=30, size=60)
+        lc.set("b", 2, ttl=30, size=60)
+
+        assert lc.get("a") is _MISSING
+        assert lc.size_bytes == 60
+
+    def test_oversized_value_is_not_stored(self):
+        lc = LocalCache(max_entries=10, max_bytes=100)
+        lc.set("a", 1, ttl=30, size=101)
+        assert len(lc) == 0
+
+    def test_delete_pattern(self):
+        lc = LocalCache(max_entries=10, max_bytes=1000)
+        lc.set("wallet_transactions:1:page:1", 1, ttl=30, size=1)
+        lc.set("wallet_transactions:1:page:2", 1, ttl=30, size=1)
+        lc.set("wallet_transactions:2:page:1", 1, ttl=30, size=1)
+
+        lc.delete_pattern("wallet_transactions:1:*")
+
+        assert len(lc) == 1
+        assert lc.get("wallet_transactions:2:page:1") == 1
+
+
+# ---------------------------
+# cache_or_get tests
+# ---------------------------
+class TestCacheOrGet:
+    @pytest.mark.asyncio
+    async def test_miss_populates_both_tiers(self, mock_redis):
+        fetch = AsyncMock(return_value={"balance": 10.0})
+
+        data = await cache_or_get(mock_redis, "wallet_balance:1", fetch, ttl=300)
+
+        assert data == {"balance": 10.0}
+        mock_redis.set.assert_awaited_with(
+            "wallet_balance:1", cache_codec.encode({"balance": 10.0}), ex=300
+        )
+        assert local_cache.get("wallet_balance:1") == {"balance": 10.0}
+        assert cache_stats.redis_misses == 1
+        assert cache_stats.local_misses == 1
+
+    @pytest.mark.asyncio
+    async def test_local_hit_skips_redis(self, mock_redis):
+        local_cache.set("user_current:a@b.c", {"id": "1"}, ttl=30, size=10)
+        fetch = AsyncMock()
+
+        data = await cache_or_get(mock_redis, "user_current:a@b.c", fetch)
+
+        assert data == {"id": "1"}
+        mock_redis.get.assert_not_awaited()
+        fetch.assert_not_awaited()
+        assert cache_stats.local_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_fills_local_tier(self, mock_redis):
+        mock_redis.get.return_value = json.dumps({"id": "1"})
+        fetch = AsyncMock()
+
+        data = await cache_or_get(mock_redis, "user_current:a@b.c", fetch)
+
+        assert data == {"id": "1"}
+        assert local_cache.get("user_current:a@b.c") == {"id": "1"}
+        assert cache_stats.redis_hits == 1
+        fetch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_local_tier_disabled(self, mock_redis, monkeypatch):
+        monkeypatch.setattr(cache_module.settings, "LOCAL_CACHE_ENABLED", False)
+        fetch = AsyncMock(return_value={"x": 1})
+
+        await cache_or_get(mock_redis, "k", fetch)
+
+        assert len(local_cache) == 0
+        assert cache_stats.local_misses == 0
+
+    @pytest.mark.asyncio
+    async def test_zero_local_ttl_skips_local_tier(self, mock_redis):
+        fetch = AsyncMock(return_value={"x": 1})
+
+        await cache_or_get(mock_redis, "k", fetch, local_ttl=0)
+
+        assert len(local_cache) == 0
+
+
+# ---------------------------
+# invalidate_cache tests
+# ---------------------------
+class TestInvalidateCache:
+    @pytest.mark.asyncio
+    async def test_evicts_local_tier_and_publishes(self, mock_redis):
+        local_cache.set("wallet_balance:1", {"x": 1}, ttl=30, size=1)
+
+        await invalidate_cache(mock_redis, "wallet_balance:1")
+
+        assert local_cache.get("wallet_balance:1") is _MISSING
+        pipe = mock_redis.pipeline.return_value
+        pipe.unlink.assert_called_once_with("wallet_balance:1")
+        pipe.publish.assert_called_once_with(
+            cache_module.settings.CACHE_INVALIDATION_CHANNEL, "wallet_balance:1"
+        )
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_no_publish_when_local_tier_disabled(self, mock_redis, monkeypatch):
+        monkeypatch.setattr(cache_module.settings, "LOCAL_CACHE_ENABLED", False)
+
+        await invalidate_cache(mock_redis, "wallet_balance:1")
+
+        mock_redis.unlink.assert_awaited_once_with("wallet_balance:1")
+        mock_redis.publish.assert_not_awaited()
+        mock_redis.pipeline.assert_not_called()
+
+
+# ---------------------------
+# Stampede protection tests
+# ---------------------------
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self, mock_redis):
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"x": 1}
+
+        results = await asyncio.gather(
+            *[
+                cache_or_get(mock_redis, "api_health", fetch, local_ttl=0)
+                for _ in range(5)
+            ]
+        )
+
+        assert calls == 1
+        assert results == [{"x": 1}] * 5
+        assert cache_stats.coalesced_misses == 4
+        mock_redis.eval.assert_awaited_once()  # lock released
+
+    @pytest.mark.asyncio
+    async def test_waiters_fetch_themselves_when_first_caller_is_cancelled(
+        self, mock_redis
+    ):
+        started = asyncio.Event()
+
+        async def request_bound_fetch():
+            started.set()
+            await asyncio.sleep(10)  # the first request's session, never answers
+
+        first = asyncio.create_task(
+            cache_or_get(mock_redis, "user_principal:a", request_bound_fetch, local_ttl=0)
+        )
+        await started.wait()
+        waiter = asyncio.create_task(
+            cache_or_get(
+                mock_redis, "user_principal:a", AsyncMock(return_value={"x": 1}), local_ttl=0
+            )
+        )
+        await asyncio.sleep(0)
+
+        first.cancel()
+
+        assert await waiter == {"x": 1}
+        assert first.cancelled()
+        assert cache_stats.coalesced_misses == 1
+        assert "user_principal:a" not in cache_module._inflight
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_shared_fetch(self, mock_redis):
+        async def fetch():
+            await asyncio.sleep(0.02)
+            return {"x": 1}
+
+        first = asyncio.create_task(
+            cache_or_get(mock_redis, "api_health", fetch, local_ttl=0)
+        )
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(
+            cache_or_get(mock_redis, "api_health", fetch, local_ttl=0)
+        )
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+
+        assert await first == {"x": 1}
+        assert waiter.cancelled()
+        assert cache_stats.coalesced_misses == 1
+
+    @pytest.mark.asyncio
+    async def test_waits_for_other_worker_when_lock_is_taken(
+        self, mock_redis, monkeypatch
+    ):
+        monkeypatch.setattr(cache_module.settings, "CACHE_FILL_WAIT_MS", 500)
+        mock_redis.set.return_value = None  # lock held by another worker
+        mock_redis.get.side_effect = [None, None, json.dumps({"x": 2})]
+        fetch = AsyncMock()
+
+        data = await cache_or_get(mock_redis, "wallet_balance:1", fetch, local_ttl=0)
+
+        assert data == {"x": 2}
+        fetch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_fetches_anyway_when_wait_times_out(self, mock_redis, monkeypatch):
+        monkeypatch.setattr(cache_module.settings, "CACHE_FILL_WAIT_MS", 100)
+        mock_redis.set.return_value = None
+        fetch = AsyncMock(return_value={"x": 3})
+
+        data = await cache_or_get(mock_redis, "wallet_balance:1", fetch, local_ttl=0)
+
+        assert data == {"x": 3}
+        fetch.assert_awaited_once()
+        mock_redis.eval.assert_not_awaited()  # never held the lock
+
+    @pytest.mark.asyncio
+    async def test_fetch_errors_propagate_to_all_waiters(self, mock_redis):
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            *[cache_or_get(mock_redis, "k", fetch, local_ttl=0) for _ in range(3)],
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        mock_redis.eval.assert_awaited_once()
+
+
+class TestStaleWhileRevalidate:
+    @pytest.mark.asyncio
+    async def test_fill_stores_envelope_with_extended_ttl(self, mock_redis):
+        fetch = AsyncMock(return_value={"x": 1})
+
+        await cache_or_get(mock_redis, "api_health", fetch, ttl=120, stale_ttl=60)
+
+        stored = mock_redis.set.await_args_list[-1]
+        assert stored.kwargs["ex"] == 180
+        envelope = cache_codec.decode(stored.args[1])
+        assert envelope["data"] == {"x": 1}
+
+    @pytest.mark.asyncio
+    async def test_fresh_envelope_is_unwrapped(self, mock_redis):
+        mock_redis.get.return_value = json.dumps(
+            {"__fresh_until__": time.time() + 60, "data": {"x": 1}}
+        )
+        fetch = AsyncMock()
+
+        data = await cache_or_get(mock_redis, "api_health", fetch, stale_ttl=60)
+
+        assert data == {"x": 1}
+        fetch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stale_value_returned_and_refreshed_in_background(self, mock_redis):
+        mock_redis.get.return_value = json.dumps(
+            {"__fresh_until__": time.time() - 1, "data": {"x": "old"}}
+        )
+        fetch = AsyncMock(return_value={"x": "new"})
+
+        data = await cache_or_get(
+            mock_redis, "api_health", fetch, ttl=120, stale_ttl=60, local_ttl=0
+        )
+        assert data == {"x": "old"}
+        assert cache_stats.stale_hits == 1
+
+        await asyncio.gather(*cache_module._refresh_tasks)
+        fetch.assert_awaited_once()
+        envelope = cache_codec.decode(mock_redis.set.await_args_list[-1].args[1])
+        assert envelope["data"] == {"x": "new"}
+
+
+# ---------------------------
+# Tag-based invalidation tests
+# ---------------------------
+class TestTags:
+    @pytest.mark.asyncio
+    async def test_fill_registers_key_under_tags(self, mock_redis):
+        fetch = AsyncMock(return_value={"x": 1})
+
+        await cache_or_get(
+            mock_redis, "wallet_balance:1", fetch, ttl=300, tags=["wallet:1"]
+        )
+
+        script_call = mock_redis.eval.await_args_list[0]
+        assert script_call.args[0] == cache_module._SET_TAGGED_SCRIPT
+        assert script_call.args[1:] == (
+            2,
+            "wallet_balance:1",
+            "tag:wallet:1",
+            cache_codec.encode({"x": 1}),
+            300,
+        )
+        # The value is written by the script, not by a plain SET
+        assert all(
+            c.args[0] != "wallet_balance:1" for c in mock_redis.set.await_args_list
+        )
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_evicts_returned_keys(self, mock_redis):
+        local_cache.set("wallet_balance:1", 1, ttl=30, size=1)
+        local_cache.set("wallet_transactions:1:page:1:size:10", 1, ttl=30, size=1)
+        local_cache.set("wallet_balance:2", 1, ttl=30, size=1)
+        mock_redis.eval.return_value = [
+            "wallet_balance:1",
+            "wallet_transactions:1:page:1:size:10",
+        ]
+
+        await invalidate_tags(mock_redis, "wallet:1")
+
+        # The script itself publishes the removed keys to other workers
+        mock_redis.eval.assert_awaited_once_with(
+            cache_module._INVALIDATE_TAGS_SCRIPT,
+            1,
+            "tag:wallet:1",
+            cache_module.settings.CACHE_INVALIDATION_CHANNEL,
+        )
+        mock_redis.scan.assert_not_awaited()
+        mock_redis.publish.assert_not_awaited()
+        assert len(local_cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_exact_key_invalidation_skips_scan(self, mock_redis):
+        await invalidate_cache(mock_redis, "user_current:a@b.c")
+
+        mock_redis.pipeline.return_value.unlink.assert_called_once_with(
+            "user_current:a@b.c"
+        )
+        mock_redis.scan.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_pattern_invalidation_scans(self, mock_redis):
+        mock_redis.scan.return_value = (0, ["user_consent:1:A"])
+
+        await invalidate_cache(mock_redis, "user_consent:1:*")
+
+        mock_redis.scan.assert_awaited_once()
+        mock_redis.delete.assert_awaited_once_with("user_consent:1:A")
+
+
+# ---------------------------
+# Batched operations tests
+# ---------------------------
+class TestBatching:
+    @pytest.mark.asyncio
+    async def test_invalidate_many_uses_one_pipeline(self, mock_redis):
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.return_value = [1, 1, [b"wallet_balance:1"]]
+        local_cache.set("user_current:a@b.c", 1, ttl=30, size=1)
+        local_cache.set("wallet_balance:1", 1, ttl=30, size=1)
+
+        await invalidate_many(
+            mock_redis, keys=["user_current:a@b.c"], tags=["wallet:1", "wallet:2"]
+        )
+
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        pipe.unlink.assert_called_once_with("user_current:a@b.c")
+        pipe.eval.assert_called_once_with(
+            cache_module._INVALIDATE_TAGS_SCRIPT,
+            2,
+            "tag:wallet:1",
+            "tag:wallet:2",
+            cache_module.settings.CACHE_INVALIDATION_CHANNEL,
+        )
+        pipe.execute.assert_awaited_once()
+        assert len(local_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_invalidate_many_noop_without_keys(self, mock_redis):
+        await invalidate_many(mock_redis)
+
+        mock_redis.pipeline.assert_not_called()
+        mock_redis.eval.assert_not_awaited()
+
+
+class TestWriteThrough:
+    @pytest.mark.asyncio
+    async def test_stores_versioned_value_and_announces_key(self, mock_redis):
+        local_cache.set("wallet_balance:1", {"total_balance": 1.0}, ttl=30, size=1)
+        mock_redis.eval.return_value = [1, b"wallet_balance:1"]
+
+        stored = await write_through(
+            mock_redis,
+            "wallet_balance:1",
+            {"total_balance": 2.0},
+            version=7,
+            ttl=300,
+            tags=["wallet:1"],
+        )
+
+        assert stored is True
+        mock_redis.eval.assert_awaited_once_with(
+            cache_module._SET_VERSIONED_SCRIPT,
+            3,
+            "wallet_balance:1",
+            "ver:wallet_balance:1",
+            "tag:wallet:1",
+            cache_codec.encode({"total_balance": 2.0}),
+            300,
+            7,
+            cache_module.settings.CACHE_INVALIDATION_CHANNEL,
+            1,
+        )
+        # The local copy is dropped and re-read from Redis
+        assert local_cache.get("wallet_balance:1") is _MISSING
+
+    @pytest.mark.asyncio
+    async def test_invalidates_tags_in_the_same_call(self, mock_redis):
+        local_cache.set("wallet_transactions:1:page:1", [1], ttl=30, size=1)
+        mock_redis.eval.return_value = [
+            1,
+            b"wallet_transactions:1:page:1",
+            b"wallet_balance:1",
+        ]
+
+        stored = await write_through(
+            mock_redis,
+            "wallet_balance:1",
+            {"total_balance": 2.0},
+            version=8,
+            ttl=300,
+            tags=["wallet:1"],
+            invalidate=["wallet:1"],
+        )
+
+        assert stored is True
+        mock_redis.eval.assert_awaited_once()
+        assert mock_redis.eval.await_args.args[1:5] == (
+            4,
+            "wallet_balance:1",
+            "ver:wallet_balance:1",
+            "tag:wallet:1",
+        )
+        assert mock_redis.eval.await_args.args[5] == "tag:wallet:1"
+        assert mock_redis.eval.await_args.args[-1] == 1
+        mock_redis.pipeline.assert_not_called()
+        assert len(local_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_older_version_is_rejected(self, mock_redis):
+        mock_redis.eval.return_value = [0]
+
+        stored = await write_through(
+            mock_redis, "wallet_balance:1", {"total_balance": 1.0}, version=3
+        )
+
+        assert stored is False
+
+    @pytest.mark.asyncio
+    async def test_versioned_fill_strips_version_field(self, mock_redis):
+        fetch = AsyncMock(return_value={"total_balance": 2.0, "version": 7})
+        mock_redis.eval.return_value = [1]
+
+        result = await cache_or_get(
+            mock_redis, "wallet_balance:1", fetch, ttl=300, version_field="version"
+        )
+
+        assert result == {"total_balance": 2.0}
+        script_call = mock_redis.eval.await_args_list[0]
+        assert script_call.args[0] == cache_module._SET_VERSIONED_SCRIPT
+        assert script_call.args[4:] == (
+            cache_codec.encode({"total_balance": 2.0}),
+            300,
+            7,
+            "",
+            0,
+        )
+        assert local_cache.get("wallet_balance:1") == {"total_balance": 2.0}
+
+    @pytest.mark.asyncio
+    async def test_fill_losing_to_newer_write_skips_local_tier(self, mock_redis):
+        fetch = AsyncMock(return_value={"total_balance": 1.0, "version": 3})
+        mock_redis.eval.return_value = [0]
+
+        result = await cache_or_get(
+            mock_redis, "wallet_balance:1", fetch, ttl=300, version_field="version"
+        )
+
+        assert result == {"total_balance": 1.0}
+        assert local_cache.get("wallet_balance:1") is _MISSING
@@ -0,0 +1,71 @@
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.core.utils.cache_codec import decode, encode
+from app.modules.shared.enums import Role
+
+
+@pytest.fixture
+def payload():
+    return {
+        "id": uuid4(),
+        "role": Role.USER,
+        "created_at": datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "naive_at": datetime(2025, 1, 2, 3, 4, 5),
+        "birthday": date(2000, 1, 1),
+        "balance": Decimal("1234.5600"),
+        "ratio": 0.25,
+        "tags": ["a", "b"],
+        "nested": {"deleted_at": None},
+    }
+
+
+def test_msgpack_round_trip_preserves_types(payload):
+    result = decode(encode(payload, codec="msgpack", compression="none"))
+
+    assert result["id"] == payload["id"]
+    assert result["created_at"] == payload["created_at"]
+    assert result["created_at"].tzinfo is not None
+    assert result["naive_at"] == payload["naive_at"]
+    assert result["birthday"] == payload["birthday"]
+    assert result["balance"] == Decimal("1234.5600")
+    assert result["role"] == "USER"
+    assert result["tags"] == ["a", "b"]
+    assert result["nested"] == {"deleted_at": None}
+
+
+def test_json_codec_degrades_to_strings(payload):
+    result = decode(encode(payload, codec="json", compression="none"))
+
+    assert result["id"] == str(payload["id"])
+    assert result["created_at"] == str(payload["created_at"])
+
+
+@pytest.mark.parametrize("compression", ["zlib", "lz4"])
+def test_compression_applies_above_threshold(compression):
+    data = {"transactions": [{"id": str(i), "amount": 1.0} for i in range(200)]}
+
+    small = encode({"x": 1}, codec="msgpack", compression=compression, threshold=1024)
+    large = encode(data, codec="msgpack", compression=compression, threshold=1024)
+    uncompressed = encode(data, codec="msgpack", compression="none")
+
+    assert small[2] == 0  # compression id: none
+    assert large[2] != 0
+    assert len(large) < len(uncompressed)
+    assert decode(large) == data
+
+
+@pytest.mark.parametrize(
+    "legacy,expected",
+    [
+        (json.dumps({"a": 1}).encode(), {"a": 1}),
+        (json.dumps({"a": 1}), {"a": 1}),
+        (b"plain text", "plain text"),
+    ],
+)
+def test_decode_reads_legacy_values(legacy, expected):
+    assert decode(legacy) == expected
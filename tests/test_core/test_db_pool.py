@@ -0,0 +1,85 @@
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from app.infra.database.pool import InstrumentedAsyncQueuePool, pool_stats
+
+
+@pytest.fixture(autouse=True)
+def reset_pool_stats():
+    pool_stats.reset()
+    yield
+    pool_stats.reset()
+
+
+@pytest.fixture
+def pool():
+    pool = InstrumentedAsyncQueuePool(
+        creator=lambda: MagicMock(), pool_size=1, max_overflow=1, timeout=0.05
+    )
+    yield pool
+    pool.dispose()
+
+
+def test_record_wait_buckets():
+    for wait_ms in (0.5, 3, 7000):
+        pool_stats.record_wait(wait_ms)
+
+    snapshot = pool_stats.snapshot(MagicMock(overflow=MagicMock(return_value=-1)))
+
+    assert snapshot["checkouts"] == 3
+    assert snapshot["wait_ms_max"] == 7000
+    assert snapshot["overflow"] == 0
+    assert snapshot["wait_histogram_ms"]["<=1"] == 1
+    assert snapshot["wait_histogram_ms"]["<=5"] == 1
+    assert snapshot["wait_histogram_ms"][">5000"] == 1
+
+
+@pytest.mark.asyncio
+async def test_checkouts_and_overflow_are_reported(pool):
+    first = await greenlet_spawn(pool.connect)
+    second = await greenlet_spawn(pool.connect)
+
+    snapshot = pool_stats.snapshot(pool)
+    assert snapshot["checkouts"] == 2
+    assert snapshot["checked_out"] == 2
+    assert snapshot["overflow"] == 1
+
+    await greenlet_spawn(second.close)
+    await greenlet_spawn(first.close)
+    assert pool_stats.snapshot(pool)["checked_in"] == 1
+
+
+@pytest.mark.asyncio
+async def test_timeout_is_counted(pool):
+    held = [await greenlet_spawn(pool.connect) for _ in range(2)]
+
+    with pytest.raises(exc.TimeoutError):
+        await greenlet_spawn(pool.connect)
+
+    snapshot = pool_stats.snapshot(pool)
+    assert snapshot["timeouts"] == 1
+    # The timed-out attempt is not a checkout and leaves the waits alone
+    assert snapshot["checkouts"] == 2
+    assert snapshot["wait_ms_max"] < 50
+    for connection in held:
+        await greenlet_spawn(connection.close)
+
+
+@pytest.mark.asyncio
+async def test_connect_error_is_counted():
+    def refuse():
+        raise ConnectionRefusedError("db is down")
+
+    pool = InstrumentedAsyncQueuePool(creator=refuse, pool_size=1, max_overflow=0)
+
+    with pytest.raises(ConnectionRefusedError):
+        await greenlet_spawn(pool.connect)
+
+    snapshot = pool_stats.snapshot(pool)
+    assert snapshot["errors"] == 1
+    assert snapshot["timeouts"] == 0
+    assert snapshot["checkouts"] == 0
+    pool.dispose()
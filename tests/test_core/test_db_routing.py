@@ -0,0 +1,131 @@
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import (Column, Integer, MetaData, Table, create_engine,
+                        select, update)
+
+from app.infra.database.routing import (RoutingSession, bind_session_to_user,
+                                        read_only, record_user_write)
+
+primary = create_engine("sqlite://")
+replica = create_engine("sqlite://")
+
+items = Table("items", MetaData(), Column("id", Integer, primary_key=True))
+
+
+class ReplicaSession(RoutingSession):
+    replica_bind = replica
+
+
+@pytest.fixture
+def session():
+    session = ReplicaSession(bind=primary)
+    yield session
+    session.close()
+
+
+async def bind_in_read_only(session, clause):
+    @read_only
+    async def query():
+        return session.get_bind(clause=clause)
+
+    return await query()
+
+
+@pytest.mark.asyncio
+async def test_read_only_select_goes_to_replica(session):
+    assert await bind_in_read_only(session, select(items)) is replica
+
+
+def test_select_outside_read_only_goes_to_primary(session):
+    assert session.get_bind(clause=select(items)) is primary
+
+
+def test_read_only_session_goes_to_replica(session):
+    session.info["read_only"] = True
+    assert session.get_bind(clause=select(items)) is replica
+
+
+@pytest.mark.asyncio
+async def test_writes_and_locking_reads_go_to_primary(session):
+    assert await bind_in_read_only(session, update(items).values(id=1)) is primary
+    assert session.info["has_writes"] is True
+
+    session.info.clear()
+    locking = select(items).with_for_update(skip_locked=True)
+    assert await bind_in_read_only(session, locking) is primary
+
+
+@pytest.mark.asyncio
+async def test_reads_after_write_stay_on_primary(session):
+    await bind_in_read_only(session, update(items).values(id=1))
+    assert await bind_in_read_only(session, select(items)) is primary
+
+
+@pytest.mark.asyncio
+async def test_read_your_writes_window_pins_primary(session):
+    session.info["read_your_writes"] = True
+    assert await bind_in_read_only(session, select(items)) is primary
+
+
+@pytest.mark.asyncio
+async def test_no_replica_configured():
+    session = RoutingSession(bind=primary)
+    try:
+        assert await bind_in_read_only(session, select(items)) is primary
+    finally:
+        session.close()
+
+
+@pytest.mark.asyncio
+async def test_bind_session_to_user_opens_window_from_redis(session):
+    redis = AsyncMock()
+    redis.exists.return_value = 1
+    user_id = uuid4()
+
+    with patch("app.infra.database.routing.settings.DB_REPLICA_HOST", "replica"):
+        await bind_session_to_user(session, redis, user_id)
+
+    redis.exists.assert_awaited_once_with(f"ryw:{user_id}")
+    assert session.info["user_id"] == user_id
+    assert session.info["read_your_writes"] is True
+
+
+@pytest.mark.asyncio
+async def test_bind_session_to_user_falls_back_to_primary(session):
+    redis = AsyncMock()
+    redis.exists.side_effect = ConnectionError("redis down")
+
+    with patch("app.infra.database.routing.settings.DB_REPLICA_HOST", "replica"):
+        await bind_session_to_user(session, redis, uuid4())
+
+    assert session.info["read_your_writes"] is True
+
+
+@pytest.mark.asyncio
+async def test_bind_session_to_user_without_replica(session):
+    redis = AsyncMock()
+
+    with patch("app.infra.database.routing.settings.DB_REPLICA_HOST", None):
+        await bind_session_to_user(session, redis, uuid4())
+
+    redis.exists.assert_not_awaited()
+    assert "user_id" not in session.info
+
+
+@pytest.mark.asyncio
+async def test_record_user_write_only_after_writes(session):
+    redis = AsyncMock()
+    user_id = uuid4()
+    session.info.update(user_id=user_id, redis=redis)
+
+    await record_user_write(session)
+    redis.set.assert_not_awaited()
+
+    session.info["has_writes"] = True
+    with patch(
+        "app.infra.database.routing.settings.DB_READ_YOUR_WRITES_SECONDS", 7
+    ):
+        await record_user_write(session)
+    redis.set.assert_awaited_once_with(f"ryw:{user_id}", 1, ex=7)
@@ -0,0 +1,80 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.infra.metrics import health
+from app.infra.metrics.health import HealthMonitor
+from app.infra.metrics.metrics_data import get_redis_status, get_system_metrics
+
+
+def test_system_metrics_do_not_block():
+    with patch("psutil.cpu_percent", return_value=12.5) as cpu_percent:
+        metrics = get_system_metrics()
+
+    cpu_percent.assert_called_once_with(interval=None)
+    assert metrics["cpu_usage_percent"] == 12.5
+
+
+@pytest.mark.asyncio
+async def test_redis_probe_times_out():
+    redis = AsyncMock()
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    redis.ping = hang
+
+    assert await get_redis_status(redis, timeout=0.01) is False
+
+
+@pytest.mark.asyncio
+async def test_readiness_reuses_result_within_ttl():
+    monitor = HealthMonitor(check_timeout=1, readiness_ttl=60)
+
+    with patch.object(
+        health, "get_db_status", new=AsyncMock(return_value=True)
+    ) as db, patch.object(
+        health, "get_redis_status", new=AsyncMock(return_value=False)
+    ):
+        first = await monitor.check_readiness(AsyncMock())
+        second = await monitor.check_readiness(AsyncMock())
+
+    assert first == second == {"db": True, "cache": False}
+    db.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_readiness_checks_share_one_probe():
+    monitor = HealthMonitor(check_timeout=1, readiness_ttl=0)
+    calls = 0
+
+    async def slow_db_status(timeout):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return True
+
+    with patch.object(health, "get_db_status", new=slow_db_status), patch.object(
+        health, "get_redis_status", new=AsyncMock(return_value=True)
+    ):
+        results = await asyncio.gather(
+            *(monitor.check_readiness(AsyncMock()) for _ in range(5))
+        )
+
+    assert calls == 1
+    assert all(result == {"db": True, "cache": True} for result in results)
+
+
+@pytest.mark.asyncio
+async def test_sampler_refreshes_system_metrics():
+    monitor = HealthMonitor(check_timeout=1, readiness_ttl=1)
+
+    with patch.object(
+        health, "get_system_metrics", return_value={"cpu_usage_percent": 3.0}
+    ):
+        sampler = asyncio.create_task(monitor.run_sampler(interval_seconds=60))
+        await asyncio.sleep(0)
+        sampler.cancel()
+
+    assert monitor.system_metrics == {"cpu_usage_percent": 3.0}
@@ -0,0 +1,61 @@
+import hashlib
+from unittest.mock import patch
+
+import pytest
+
+from app.core.security import hashing
+from app.core.security.hashing import hash_ip
+
+
+@pytest.fixture(autouse=True)
+def ip_salt():
+    with patch.object(hashing, "SALT", "test-salt"):
+        hashing._hash_ip.cache_clear()
+        yield
+    hashing._hash_ip.cache_clear()
+
+
+@pytest.fixture
+def blake2b():
+    with patch.object(hashing.settings, "IP_HASH_ALGORITHM", "blake2b"):
+        yield
+
+
+def test_default_keeps_the_stored_sha256_format():
+    assert hashing.settings.IP_HASH_ALGORITHM == "sha256"
+    assert (
+        hash_ip("203.0.113.7") == hashlib.sha256(b"203.0.113.7test-salt").hexdigest()
+    )
+
+
+def test_blake2b_is_keyed_with_the_salt(blake2b):
+    expected = hashlib.blake2b(
+        b"203.0.113.7", key=b"test-salt", digest_size=32
+    ).hexdigest()
+
+    assert hash_ip("203.0.113.7") == expected
+    assert len(hash_ip("203.0.113.7")) == 64
+
+    with patch.object(hashing, "SALT", "other-salt"):
+        hashing._hash_ip.cache_clear()
+        assert hash_ip("203.0.113.7") != expected
+
+
+def test_long_salt_is_hashed_down_to_a_valid_key(blake2b):
+    with patch.object(hashing, "SALT", "x" * 100):
+        assert len(hash_ip("203.0.113.7")) == 64
+
+
+def test_results_are_memoized():
+    hash_ip("198.51.100.1")
+    hash_ip("198.51.100.1")
+    hash_ip("198.51.100.2")
+
+    info = hashing._hash_ip.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
+def test_missing_salt_is_an_error():
+    with patch.object(hashing, "SALT", None):
+        with pytest.raises(RuntimeError):
+            hash_ip("198.51.100.1")
@@ -1,11 +1,14 @@
+import time
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 import pytest
 from fastapi import HTTPException
 from jose import jwt
 
 import app.core.security.jwt as jwt_module
-from app.core.security.jwt import create_access_token, decode_token
+from app.core.security.jwt import (DecodedTokenCache, create_access_token,
+                                   decode_access_token, decode_token)
 
 
 @pytest.fixture(autouse=True)
@@ -13,6 +16,9 @@ def patch_jwt_constants(monkeypatch):
     monkeypatch.setattr("app.core.security.jwt.KEY", "testsecret")
     monkeypatch.setattr("app.core.security.jwt.ALGORITHM", "HS256")
     monkeypatch.setattr("app.core.security.jwt.EXPIRY", 60)
+    monkeypatch.setattr(
+        "app.core.security.jwt.decoded_token_cache", DecodedTokenCache(max_entries=2)
+    )
 
 
 def test_create_access_token_and_decode():
@@ -63,3 +69,52 @@ def test_decode_token_failures(token_factory):
 
     assert exc.value.status_code == 400
     assert "Token could not be validated" in exc.value.detail
+
+
+def test_decode_access_token_verifies_once():
+    token = create_access_token({"sub": "user123"}, token_version=3)
+
+    with patch.object(jwt_module, "decode_token", wraps=decode_token) as decode:
+        first = decode_access_token(token)
+        second = decode_access_token(token)
+
+    assert decode.call_count == 1
+    assert first is second
+    assert first["ver"] == 3
+
+
+def test_decode_access_token_rejects_bad_tokens_every_time():
+    token = jwt.encode({"sub": "user123"}, "wrongkey", algorithm="HS256")
+
+    for _ in range(2):
+        with pytest.raises(HTTPException):
+            decode_access_token(token)
+    assert len(jwt_module.decoded_token_cache) == 0
+
+
+def test_decoded_token_cache_expiry_and_eviction():
+    cache = DecodedTokenCache(max_entries=2)
+    now = time.time()
+
+    cache.set("expired", {"sub": "a", "exp": now - 1})
+    assert cache.get("expired") is None
+
+    cache.set("no-exp", {"sub": "a"})
+    assert cache.get("no-exp") is None
+
+    cache.set("t1", {"sub": "a", "exp": now + 60})
+    cache.set("t2", {"sub": "b", "exp": now + 60})
+    cache.get("t1")
+    cache.set("t3", {"sub": "c", "exp": now + 60})
+    assert cache.get("t2") is None  # least recently used
+    assert cache.get("t1")["sub"] == "a"
+
+    cache.delete("t1")
+    assert cache.get("t1") is None
+    assert len(cache) == 1
+
+
+def test_decoded_token_cache_disabled():
+    cache = DecodedTokenCache(max_entries=0)
+    cache.set("t1", {"sub": "a", "exp": time.time() + 60})
+    assert cache.get("t1") is None
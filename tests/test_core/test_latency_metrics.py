@@ -0,0 +1,106 @@
+from collections import defaultdict
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.middleware.logging import route_label
+from app.infra.metrics.latency import (LATENCY_BUCKETS, UNMATCHED_ROUTE,
+                                       LatencyHistograms, render_prometheus)
+
+
+def make_redis():
+    """Redis stub whose pipeline HINCRBY/HINCRBYFLOAT land in a plain dict."""
+    store = defaultdict(float)
+    pipe = MagicMock(execute=AsyncMock())
+    pipe.hincrby.side_effect = lambda key, field, n: store.__setitem__(
+        field.encode(), store[field.encode()] + n
+    )
+    pipe.hincrbyfloat.side_effect = pipe.hincrby.side_effect
+
+    redis = AsyncMock()
+    redis.pipeline = MagicMock(return_value=pipe)
+    redis.hgetall = AsyncMock(side_effect=lambda key: dict(store))
+    return redis
+
+
+def test_observe_places_latency_in_bucket():
+    histograms = LatencyHistograms()
+
+    histograms.observe("GET", "/v1/user/me", 200, 0.004)
+    histograms.observe("GET", "/v1/user/me", 200, 0.3)
+    histograms.observe("GET", "/v1/user/me", 200, 60)
+
+    series = histograms.local_series()[("GET", "/v1/user/me", "200")]
+    assert series.buckets[0] == 1
+    assert series.buckets[LATENCY_BUCKETS.index(0.5)] == 1
+    assert series.buckets[-1] == 1
+    assert series.total == pytest.approx(60.304)
+
+
+def test_render_prometheus_is_cumulative():
+    histograms = LatencyHistograms()
+    histograms.observe("POST", "/v1/auth/login", 401, 0.02)
+    histograms.observe("POST", "/v1/auth/login", 401, 0.2)
+
+    text = render_prometheus(histograms.local_series())
+
+    labels = 'method="POST",route="/v1/auth/login",status="401"'
+    assert "# TYPE http_request_duration_seconds histogram" in text
+    assert f'http_request_duration_seconds_bucket{{{labels},le="0.01"}} 0' in text
+    assert f'http_request_duration_seconds_bucket{{{labels},le="0.025"}} 1' in text
+    assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"http_request_duration_seconds_count{{{labels}}} 2" in text
+    assert text.endswith("\n")
+
+
+@pytest.mark.asyncio
+async def test_collect_merges_workers_through_redis():
+    redis = make_redis()
+    worker_a, worker_b = LatencyHistograms(), LatencyHistograms()
+    worker_a.observe("GET", "/health", 200, 0.001)
+    worker_b.observe("GET", "/health", 200, 0.001)
+    worker_b.observe("GET", "/health", 500, 2)
+
+    await worker_a.flush(redis)
+    merged = await worker_b.collect(redis)
+
+    assert sum(merged[("GET", "/health", "200")].buckets) == 2
+    assert sum(merged[("GET", "/health", "500")].buckets) == 1
+    assert merged[("GET", "/health", "500")].total == pytest.approx(2)
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_counts_and_collect_falls_back():
+    redis = make_redis()
+    redis.pipeline.return_value.execute.side_effect = ConnectionError("down")
+    histograms = LatencyHistograms()
+    histograms.observe("GET", "/", 200, 0.01)
+
+    merged = await histograms.collect(redis)
+
+    assert sum(merged[("GET", "/", "200")].buckets) == 1
+    assert ("GET", "/", "200") in histograms._pending
+
+
+def test_route_label_uses_template_not_raw_path():
+    app = FastAPI()
+    labels = []
+
+    @app.middleware("http")
+    async def capture(request, call_next):
+        response = await call_next(request)
+        labels.append(route_label(request.scope))
+        return response
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        return {}
+
+    client = TestClient(app)
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/missing")
+
+    assert labels == ["/items/{item_id}", "/items/{item_id}", UNMATCHED_ROUTE]
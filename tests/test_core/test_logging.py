@@ -1,18 +1,21 @@
 import asyncio
 import datetime
+import io
 import json
 import logging
-import sys
+import queue
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
-from fastapi import Request, Response
-from slowapi.errors import RateLimitExceeded
-from slowapi.wrappers import Limit
 
-from app.core.middleware.logging import (CleanupJsonFormatter, JsonFormatter,
-                                         LoggingMiddleware, cleanup_old_logs,
+from app.core.middleware.logging import (BatchQueueListener,
+                                         BatchStreamHandler,
+                                         CleanupJsonFormatter, JsonFormatter,
+                                         LoggingMiddleware,
+                                         SamplingQueueHandler,
+                                         cleanup_old_logs,
                                          get_request_log_message)
+from app.core.middleware.rate_limiter import RateLimitExceeded, RateLimitInfo
 
 
 # ---------------------------
@@ -88,82 +91,204 @@ class TestCleanupJsonFormatter:
         assert "datetime" in log_entry
 
 
+# ---------------------------
+# Queue pipeline tests
+# ---------------------------
+def make_record(level=logging.INFO, msg="Request successful"):
+    return logging.LogRecord("test", level, "", 0, msg, (), None)
+
+
+class TestSamplingQueueHandler:
+    def test_enqueues_without_blocking(self):
+        log_queue = queue.Queue(maxsize=10)
+        handler = SamplingQueueHandler(log_queue, sample_rate=10)
+
+        handler.emit(make_record())
+
+        assert log_queue.get_nowait().getMessage() == "Request successful"
+        assert handler.dropped == 0
+
+    def test_drops_when_full(self):
+        log_queue = queue.Queue(maxsize=2)
+        handler = SamplingQueueHandler(log_queue, sample_rate=1)
+
+        for _ in range(5):
+            handler.emit(make_record(logging.WARNING))
+
+        assert log_queue.qsize() == 2
+        assert handler.dropped == 3
+
+    def test_samples_info_above_high_water_but_keeps_warnings(self):
+        log_queue = queue.Queue(maxsize=100)
+        handler = SamplingQueueHandler(log_queue, sample_rate=5)
+        for _ in range(handler.high_water):
+            log_queue.put_nowait(make_record())
+
+        for _ in range(10):
+            handler.emit(make_record())
+        handler.emit(make_record(logging.ERROR, "boom"))
+
+        assert log_queue.qsize() == handler.high_water + 2 + 1
+        assert handler.dropped == 8
+
+    def test_reports_drops_once_queue_drains(self):
+        log_queue = queue.Queue(maxsize=1)
+        handler = SamplingQueueHandler(log_queue, sample_rate=1)
+        handler.emit(make_record(logging.WARNING))
+        handler.emit(make_record(logging.WARNING))
+        log_queue.get_nowait()
+
+        handler.emit(make_record(logging.WARNING))  # report takes the only slot
+
+        report = log_queue.get_nowait()
+        assert report.levelno == logging.WARNING
+        assert report.getMessage() == "Dropped 1 log records under load"
+        assert handler.dropped == 2
+
+
+class TestBatchQueueListener:
+    def test_writes_records_in_batches(self):
+        stream = io.StringIO()
+        stream.write = Mock(wraps=stream.write)
+        handler = BatchStreamHandler(stream)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        log_queue = queue.Queue()
+        for i in range(5):
+            log_queue.put_nowait(make_record(msg=f"record {i}"))
+
+        listener = BatchQueueListener(log_queue, handler, batch_size=2)
+        listener.start()
+        listener.stop()
+
+        assert stream.getvalue().splitlines() == [f"record {i}" for i in range(5)]
+        assert stream.write.call_count == 3
+
+    def test_stop_flushes_buffered_records(self):
+        stream = io.StringIO()
+        handler = BatchStreamHandler(stream)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        listener = BatchQueueListener(queue.Queue(), handler, batch_size=100)
+
+        handler.handle(make_record(msg="pending"))
+        assert stream.getvalue() == ""
+
+        listener.stop()
+
+        assert stream.getvalue() == "pending\n"
+
+
 # ---------------------------
 # Middleware tests
 # ---------------------------
+def make_scope(path="/api/test", method="GET", host="10.0.0.1"):
+    return {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "client": (host, 50000),
+        "headers": [],
+    }
+
+
 class TestLoggingMiddleware:
     @pytest.mark.asyncio
     async def test_middleware_logs_normal_request(self):
-        mock_request = Mock(spec=Request)
-        mock_request.method = "GET"
-        mock_request.url.path = "/api/test"
-        mock_request.client.host = "10.0.0.1"
-
-        mock_response = Mock(spec=Response)
-        mock_response.status_code = 200
-
-        async def mock_call_next(req):
-            return mock_response
-
-        # Mock app.main module before it gets imported
-        mock_main = Mock()
-        mock_metrics = Mock()
-        mock_metrics.set_latest_response_latency = Mock()
-        mock_main.metrics = mock_metrics
-
-        with patch.dict(sys.modules, {"app.main": mock_main}):
-            with patch("app.core.middleware.logging.logger") as mock_logger, patch(
-                "app.core.middleware.logging.hash_ip",
-                return_value="cefd8b4a2e549a7476a56e92387",
-            ):
-                mw = LoggingMiddleware(app=None)
-                response = await mw.dispatch(mock_request, mock_call_next)
-
-                assert response == mock_response
-                mock_logger.info.assert_called_once()
-                call_args = mock_logger.info.call_args
-                assert call_args[1]["extra"]["status_code"] == 200
-                assert (
-                    call_args[1]["extra"]["ip_anonymized"]
-                    == "cefd8b4a2e549a7476a56e92387"
-                )
+        sent = []
+
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+
+        async def send(message):
+            sent.append(message)
+
+        with patch("app.core.middleware.logging.logger") as mock_logger, patch(
+            "app.core.middleware.logging.hash_ip",
+            return_value="cefd8b4a2e549a7476a56e92387",
+        ):
+            mw = LoggingMiddleware(app)
+            await mw(make_scope(), None, send)
+
+        assert [m["type"] for m in sent] == [
+            "http.response.start",
+            "http.response.body",
+        ]
+        mock_logger.log.assert_called_once()
+        level, message = mock_logger.log.call_args[0]
+        extra = mock_logger.log.call_args[1]["extra"]
+        assert level == logging.INFO
+        assert message == "Request successful"
+        assert extra["status_code"] == 200
+        assert extra["ip_anonymized"] == "cefd8b4a2e549a7476a56e92387"
 
     @pytest.mark.asyncio
     async def test_middleware_logs_rate_limited_request(self):
-        mock_request = Mock(spec=Request)
-        mock_request.method = "POST"
-        mock_request.url.path = "/api/test"
-        mock_request.client.host = "10.0.0.2"
-
-        dummy_limit = Mock(spec=Limit)
-        dummy_limit.error_message = "Too many requests"
-
-        async def mock_call_next(req):
-            raise RateLimitExceeded(dummy_limit)
-
-        # Mock app.main module before it gets imported
-        mock_main = Mock()
-        mock_metrics = Mock()
-        mock_metrics.set_latest_response_latency = Mock()
-        mock_main.metrics = mock_metrics
-
-        with patch.dict(sys.modules, {"app.main": mock_main}):
-            with patch("app.core.middleware.logging.logger") as mock_logger, patch(
-                "app.core.middleware.logging.hash_ip",
-                return_value="cefd8b4a2e549a7476a56e92387",
-            ):
-                mw = LoggingMiddleware(app=None)
-
-                with pytest.raises(RateLimitExceeded):
-                    await mw.dispatch(mock_request, mock_call_next)
-
-                mock_logger.warning.assert_called_once()
-                call_args = mock_logger.warning.call_args
-                assert call_args[1]["extra"]["status_code"] == 429
-                assert (
-                    call_args[1]["extra"]["ip_anonymized"]
-                    == "cefd8b4a2e549a7476a56e92387"
+        async def app(scope, receive, send):
+            raise RateLimitExceeded(RateLimitInfo(limit=5, remaining=0, reset=30))
+
+        with patch("app.core.middleware.logging.logger") as mock_logger, patch(
+            "app.core.middleware.logging.hash_ip",
+            return_value="cefd8b4a2e549a7476a56e92387",
+        ):
+            mw = LoggingMiddleware(app)
+
+            with pytest.raises(RateLimitExceeded):
+                await mw(make_scope(method="POST", host="10.0.0.2"), None, None)
+
+        level, message = mock_logger.log.call_args[0]
+        extra = mock_logger.log.call_args[1]["extra"]
+        assert level == logging.WARNING
+        assert message == "Request rate-limited"
+        assert extra["status_code"] == 429
+        assert extra["ip_anonymized"] == "cefd8b4a2e549a7476a56e92387"
+
+    @pytest.mark.asyncio
+    async def test_middleware_logs_unhandled_error_as_500(self):
+        async def app(scope, receive, send):
+            raise RuntimeError("boom")
+
+        with patch("app.core.middleware.logging.logger") as mock_logger, patch(
+            "app.core.middleware.logging.hash_ip"
+        ):
+            with pytest.raises(RuntimeError):
+                await LoggingMiddleware(app)(make_scope(), None, None)
+
+        assert mock_logger.log.call_args[1]["extra"]["status_code"] == 500
+
+    @pytest.mark.asyncio
+    async def test_middleware_streams_body_chunks_through(self):
+        sent = []
+
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            for chunk in (b"a", b"b"):
+                await send(
+                    {"type": "http.response.body", "body": chunk, "more_body": True}
                 )
+            await send({"type": "http.response.body", "body": b""})
+
+        async def send(message):
+            sent.append(message)
+
+        with patch("app.core.middleware.logging.logger"), patch(
+            "app.core.middleware.logging.hash_ip"
+        ):
+            await LoggingMiddleware(app)(make_scope(), None, send)
+
+        assert [m.get("body") for m in sent[1:]] == [b"a", b"b", b""]
+
+    @pytest.mark.asyncio
+    async def test_middleware_passes_through_non_http_scopes(self):
+        calls = []
+
+        async def app(scope, receive, send):
+            calls.append(scope["type"])
+
+        with patch("app.core.middleware.logging.logger") as mock_logger:
+            await LoggingMiddleware(app)({"type": "lifespan"}, None, None)
+
+        assert calls == ["lifespan"]
+        mock_logger.log.assert_not_called()
 
 
 # ---------------------------
@@ -0,0 +1,144 @@
+import asyncio
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+from app.core.security.hashing import UNUSABLE_PASSWORD_HASH, verify_password
+from app.core.security.password_hasher import PasswordHasher
+from app.core.utils.error_handlers import http_exception_handler
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_off_the_event_loop():
+    hasher = PasswordHasher(workers=0, max_pending=4, rounds=4)
+
+    hashed = await hasher.hash("Test@123")
+
+    assert hashed.startswith("$2b$04$")
+    assert verify_password("Test@123", hashed)
+    assert await hasher.verify("Test@123", hashed)
+    assert not await hasher.verify("wrong", hashed)
+    assert hasher.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_process_pool_hashes():
+    hasher = PasswordHasher(workers=1, max_pending=4, rounds=4)
+    try:
+        hashed = await hasher.hash("Test@123")
+        assert await hasher.verify("Test@123", hashed)
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_unusable_password_skips_the_pool():
+    hasher = PasswordHasher(workers=0, max_pending=1, rounds=4)
+    with patch.object(hasher, "_run", new=AsyncMock()) as run:
+        assert not await hasher.verify("anything", UNUSABLE_PASSWORD_HASH)
+    run.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_sheds_load_beyond_max_pending():
+    hasher = PasswordHasher(workers=0, max_pending=2, rounds=4)
+    release = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    def blocked_hash(*args):
+        asyncio.run_coroutine_threadsafe(release.wait(), loop).result()
+        return "hash"
+
+    with patch("app.core.security.password_hasher.hash_password", blocked_hash):
+        running = [asyncio.create_task(hasher.hash("pw")) for _ in range(2)]
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(HTTPException) as exc:
+            await hasher.hash("pw")
+
+        release.set()
+        assert await asyncio.gather(*running) == ["hash", "hash"]
+
+    assert exc.value.status_code == 503
+    assert exc.value.headers == {"Retry-After": "1"}
+    assert hasher.stats() == {"workers": 0, "max_pending": 2, "pending": 0, "shed": 1}
+
+
+def fake_run_in_executor(broken, failures):
+    """run_in_executor stand-in: calls on `broken` stay pending in `failures`."""
+
+    def run_in_executor(executor, func, *args):
+        future = asyncio.get_running_loop().create_future()
+        if executor is broken:
+            failures.append(future)
+        else:
+            future.set_result("hash")
+        return future
+
+    return run_in_executor
+
+
+@pytest.mark.asyncio
+async def test_broken_pool_is_restarted():
+    hasher = PasswordHasher(workers=1, max_pending=4, rounds=4)
+    broken, healthy = MagicMock(), MagicMock()
+    hasher._executor = broken
+    failures = []
+
+    with patch(
+        "app.core.security.password_hasher.ProcessPoolExecutor", return_value=healthy
+    ), patch.object(
+        asyncio.get_running_loop(), "run_in_executor", fake_run_in_executor(broken, failures)
+    ):
+        task = asyncio.create_task(hasher.hash("pw"))
+        await asyncio.sleep(0)
+        failures[0].set_exception(BrokenProcessPool())
+        assert await task == "hash"
+
+    broken.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+    assert hasher._executor is healthy
+
+
+@pytest.mark.asyncio
+async def test_broken_pool_is_replaced_once_by_concurrent_callers():
+    hasher = PasswordHasher(workers=1, max_pending=4, rounds=4)
+    broken, healthy = MagicMock(), MagicMock()
+    hasher._executor = broken
+    failures = []
+
+    with patch(
+        "app.core.security.password_hasher.ProcessPoolExecutor", return_value=healthy
+    ) as new_pool, patch.object(
+        asyncio.get_running_loop(), "run_in_executor", fake_run_in_executor(broken, failures)
+    ):
+        tasks = [asyncio.create_task(hasher.hash("pw")) for _ in range(3)]
+        await asyncio.sleep(0)
+        for future in failures:
+            future.set_exception(BrokenProcessPool())
+        assert await asyncio.gather(*tasks) == ["hash", "hash", "hash"]
+
+    new_pool.assert_called_once()
+    broken.shutdown.assert_called_once()
+    healthy.shutdown.assert_not_called()
+    assert hasher._executor is healthy
+
+
+def test_shed_request_gets_503_with_retry_after():
+    hasher = PasswordHasher(workers=0, max_pending=1, rounds=4)
+    hasher.pending = 1  # a login already in flight
+    app = FastAPI()
+    app.add_exception_handler(StarletteHTTPException, http_exception_handler)
+
+    @app.post("/login")
+    async def login():
+        await hasher.verify("pw", "$2b$04$hash")
+
+    response = TestClient(app).post("/login")
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert response.json()["status"] == "error"
@@ -0,0 +1,114 @@
+import dataclasses
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.security.principal import Principal, principal_cache_key
+from app.core.utils import cache_codec
+from app.modules.shared.enums import Currency, Role
+from app.modules.user.models import User
+
+# dependencies creates the DB engine on import; its settings may be unset in CI
+with patch("sqlalchemy.ext.asyncio.create_async_engine"), patch(
+    "redis.asyncio.Redis.from_url"
+):
+    from app.api import dependencies
+
+
+def make_user(**overrides) -> User:
+    fields = dict(
+        id=uuid.uuid4(),
+        email="john@example.com",
+        full_name="John Doe",
+        stag="johndoe",
+        password_hash="$2b$12$" + "x" * 53,
+        role=Role.USER,
+        is_verified=True,
+        is_enabled=True,
+        is_deleted=False,
+        token_version=2,
+        preferred_currency=Currency.EUR,
+    )
+    fields.update(overrides)
+    return User(**fields)
+
+
+def test_principal_is_frozen_and_slotted():
+    principal = Principal.from_user(make_user())
+
+    assert not hasattr(principal, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        principal.role = Role.ADMIN
+
+
+@pytest.mark.parametrize("codec", ["json", "msgpack"])
+def test_principal_round_trips_through_cache_codecs(codec):
+    user = make_user()
+    principal = Principal.from_user(user)
+
+    cached = cache_codec.decode(cache_codec.encode(principal.to_cache(), codec=codec))
+
+    assert "password_hash" not in cached
+    assert Principal.from_cache(cached) == principal
+    assert Principal.from_cache(cached).id == user.id
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_returns_cached_principal():
+    principal = Principal.from_user(make_user())
+    redis = AsyncMock()
+    user_repo = MagicMock()
+
+    with patch.object(
+        dependencies, "decode_access_token", return_value={"sub": principal.email, "ver": 2}
+    ), patch.object(
+        dependencies, "cache_or_get", new=AsyncMock(return_value=principal.to_cache())
+    ) as cache_or_get, patch.object(
+        dependencies, "bind_session_to_user", new_callable=AsyncMock
+    ):
+        current_user = await dependencies.get_current_user("token", redis, user_repo)
+
+    assert current_user == principal
+    assert cache_or_get.await_args.kwargs["key"] == principal_cache_key(principal.email)
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_caches_principal_not_row():
+    user = make_user()
+    user_repo = MagicMock()
+    user_repo.get_by_email = AsyncMock(return_value=user)
+
+    async def cache_or_get(redis, key, fetch_func, ttl):
+        return await fetch_func()
+
+    with patch.object(
+        dependencies, "decode_access_token", return_value={"sub": user.email, "ver": 2}
+    ), patch.object(dependencies, "cache_or_get", new=cache_or_get), patch.object(
+        dependencies, "bind_session_to_user", new_callable=AsyncMock
+    ):
+        current_user = await dependencies.get_current_user(
+            "token", AsyncMock(), user_repo
+        )
+
+    assert isinstance(current_user, Principal)
+    assert current_user.id == user.id
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_rejects_old_token_version():
+    principal = Principal.from_user(make_user(token_version=3))
+
+    with patch.object(
+        dependencies, "decode_access_token", return_value={"sub": principal.email, "ver": 2}
+    ), patch.object(
+        dependencies, "cache_or_get", new=AsyncMock(return_value=principal.to_cache())
+    ), patch.object(
+        dependencies, "invalidate_cache", new_callable=AsyncMock
+    ) as invalidate:
+        with pytest.raises(HTTPException) as exc:
+            await dependencies.get_current_user("token", AsyncMock(), MagicMock())
+
+    assert exc.value.status_code == 401
+    invalidate.assert_awaited_once()
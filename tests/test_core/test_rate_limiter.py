@@ -0,0 +1,132 @@
+import math
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.core.middleware import rate_limiter
+from app.core.middleware.rate_limiter import (Limiter, RateLimit,
+                                              RateLimitExceeded,
+                                              RateLimitHeadersMiddleware,
+                                              identify)
+from app.core.utils.error_handlers import rate_limit_handler
+
+
+class FakeRedis:
+    """Runs the sliding window script's logic over a dict and counts calls."""
+
+    def __init__(self):
+        self.store = {}
+        self.calls = []
+
+    def register_script(self, source):
+        async def script(keys, args, client):
+            client.calls.append((keys, args))
+            curr = client.store.get(keys[0], 0)
+            prev = client.store.get(keys[1], 0)
+            limit, weight, wanted = args[0], args[1], args[2]
+            used = prev * weight + curr
+            granted = max(min(wanted, math.floor(limit - used)), 0)
+            client.store[keys[0]] = curr + granted
+            return [granted, max(0, math.floor(limit - used - granted))]
+
+        return script
+
+
+class BrokenRedis:
+    def register_script(self, source):
+        async def script(keys, args, client):
+            raise ConnectionError("redis down")
+
+        return script
+
+
+def make_app(redis, limit="5/minute", local_batch=10):
+    limiter = Limiter(local_batch=local_batch, local_ttl_ms=60_000)
+    limiter.enabled = True
+    app = FastAPI()
+    app.state.redis = redis
+    app.add_middleware(RateLimitHeadersMiddleware)
+    app.add_exception_handler(RateLimitExceeded, rate_limit_handler)
+
+    @app.get("/limited")
+    @limiter.limit(limit)
+    async def limited(request: Request):
+        return {"ok": True}
+
+    return app
+
+
+def test_parse_limits():
+    assert RateLimit.parse("5/minute") == RateLimit(5, 60)
+    assert RateLimit.parse("1/hour") == RateLimit(1, 3600)
+    assert RateLimit.parse("2/hours") == RateLimit(2, 3600)
+
+
+def test_small_limit_is_exact_and_sends_headers():
+    redis = FakeRedis()
+    client = TestClient(make_app(redis, "3/minute"))
+
+    responses = [client.get("/limited") for _ in range(4)]
+
+    assert [r.status_code for r in responses] == [200, 200, 200, 429]
+    assert [r.headers["RateLimit-Remaining"] for r in responses] == ["2", "1", "0", "0"]
+    assert responses[0].headers["RateLimit-Limit"] == "3"
+    assert int(responses[3].headers["Retry-After"]) >= 1
+    assert len(redis.calls) == 4
+
+
+def test_large_limit_pre_allocates_tokens_locally():
+    redis = FakeRedis()
+    client = TestClient(make_app(redis, "100/minute", local_batch=10))
+
+    responses = [client.get("/limited") for _ in range(12)]
+
+    assert all(r.status_code == 200 for r in responses)
+    assert [r.headers["RateLimit-Remaining"] for r in responses[:3]] == ["99", "98", "97"]
+    # One Redis round-trip per batch of 10
+    assert len(redis.calls) == 2
+    assert redis.calls[0][1][2] == 10
+
+
+def test_previous_window_is_weighted_by_overlap():
+    redis = FakeRedis()
+    client = TestClient(make_app(redis, "4/minute"))
+
+    with patch.object(rate_limiter.time, "time", return_value=6000 + 15):
+        client.get("/limited")
+
+    keys, args = redis.calls[0]
+    assert keys[0].endswith(":6000") and keys[1].endswith(":5940")
+    assert args[1] == pytest.approx(0.75)
+
+
+def test_fails_open_without_redis():
+    client = TestClient(make_app(BrokenRedis(), "1/minute"))
+
+    responses = [client.get("/limited") for _ in range(3)]
+
+    assert all(r.status_code == 200 for r in responses)
+    assert "RateLimit-Limit" not in responses[0].headers
+
+
+def test_identify_prefers_token_subject_over_ip():
+    app = FastAPI()
+    seen = []
+
+    @app.get("/whoami")
+    async def whoami(request: Request):
+        seen.append(identify(request))
+        return {}
+
+    client = TestClient(app)
+    with patch.object(
+        rate_limiter, "decode_access_token", return_value={"sub": "john@example.com"}
+    ):
+        client.get("/whoami", headers={"Authorization": "Bearer token"})
+    with patch.object(rate_limiter, "decode_access_token", side_effect=ValueError):
+        client.get("/whoami", headers={"Authorization": "Bearer invalid"})
+    client.get("/whoami")
+
+    assert seen == ["user:john@example.com", "ip:testclient", "ip:testclient"]
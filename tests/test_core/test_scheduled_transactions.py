@@ -0,0 +1,355 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.modules.ims.repository import IMSRepository
+from app.modules.shared.enums import (DestinationType, NotificationType,
+                                      TransactionStatus, TransactionType)
+
+# cron_jobs creates the DB engine and Redis client on import; their settings
+# may be unset in CI
+with patch("sqlalchemy.ext.asyncio.create_async_engine"), patch(
+    "redis.asyncio.Redis.from_url"
+):
+    from app.core.tasks import cron_jobs
+
+
+def make_scheduled(user_id, group_id, amount):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        user_id=user_id,
+        amount=Decimal(amount),
+        currency="EUR",
+        destination_type=DestinationType.GROUP,
+        group_id=group_id,
+        goal_id=None,
+        status=TransactionStatus.ACTIVE,
+        next_run_at=datetime.now(timezone.utc),
+        projection_log=[
+            (datetime.now(timezone.utc) + timedelta(days=7)).isoformat()
+        ],
+    )
+
+
+@pytest.fixture
+def repos():
+    repos = SimpleNamespace(
+        ims=AsyncMock(), user=AsyncMock(), wallet=AsyncMock(), group=AsyncMock()
+    )
+    with patch.multiple(
+        cron_jobs,
+        IMSRepository=MagicMock(return_value=repos.ims),
+        UserRepository=MagicMock(return_value=repos.user),
+        WalletRepository=MagicMock(return_value=repos.wallet),
+        GroupRepository=MagicMock(return_value=repos.group),
+    ):
+        yield repos
+
+
+@pytest.mark.asyncio
+async def test_process_batch_bulk_updates(repos):
+    user = SimpleNamespace(id=uuid.uuid4(), full_name="Ann", email="ann@example.com")
+    wallet = SimpleNamespace(
+        id=uuid.uuid4(),
+        user_id=user.id,
+        total_balance=Decimal("100"),
+        locked_amount=Decimal("30"),
+    )
+    group = SimpleNamespace(id=uuid.uuid4(), name="Trip", current_balance=Decimal("5"))
+    first = make_scheduled(user.id, group.id, "40")
+    second = make_scheduled(user.id, group.id, "25")
+    unfunded = make_scheduled(user.id, group.id, "10")
+    orphan = make_scheduled(uuid.uuid4(), group.id, "10")
+
+    repos.user.get_by_ids = AsyncMock(return_value=[user])
+    repos.wallet.get_wallets_by_user_ids = AsyncMock(return_value=[wallet])
+    repos.group.get_groups_by_ids = AsyncMock(return_value=[group])
+    db = MagicMock()
+
+    updated, pending = await cron_jobs._process_batch(
+        db, [first, second, unfunded, orphan]
+    )
+
+    assert updated == {user.id}
+    repos.wallet.get_wallets_by_user_ids.assert_awaited_once()
+    assert repos.wallet.get_wallets_by_user_ids.await_args.kwargs == {
+        "for_update": True
+    }
+    repos.wallet.update_locked_amounts.assert_awaited_once_with(
+        {wallet.id: Decimal("65")}
+    )
+    repos.group.update_group_balances.assert_awaited_once_with(
+        {group.id: Decimal("65")}
+    )
+    repos.group.update_member_contributions.assert_awaited_once_with(
+        {(group.id, user.id): Decimal("65")}
+    )
+
+    wallet_txs = db.add_all.call_args.args[0]
+    assert [tx.amount for tx in wallet_txs] == [-40.0, -25.0]
+    assert all(tx.type == TransactionType.GROUP_SAVINGS_DEPOSIT for tx in wallet_txs)
+    repos.user.apply_transactions_to_summary.assert_awaited_once_with(wallet_txs)
+
+    # 70 available: 40 + 25 run, 10 more does not fit and waits for the next run
+    assert unfunded.status == TransactionStatus.ACTIVE
+    assert unfunded.next_run_at > datetime.now(timezone.utc)
+    assert orphan.status == TransactionStatus.FAILED
+
+    assert [n["context"]["group_current_balance"] for n in pending] == ["45", "70"]
+    assert pending[0]["notification_type"] == (
+        NotificationType.GROUP_CONTRIBUTION_NOTIFICATION
+    )
+
+
+@pytest.mark.asyncio
+async def test_claim_loop_runs_until_nothing_is_due(repos):
+    batches = [
+        [make_scheduled(uuid.uuid4(), uuid.uuid4(), "1") for _ in range(2)],
+        [make_scheduled(uuid.uuid4(), uuid.uuid4(), "1")],
+        [],
+    ]
+    repos.ims.claim_due_transactions = AsyncMock(side_effect=batches)
+    session = AsyncMock()
+    notification = {"notification_type": "x", "recipients": ["a@b.c"]}
+    notifications = MagicMock()
+
+    with patch.object(cron_jobs, "AsyncSessionLocal") as session_factory, patch.object(
+        cron_jobs,
+        "_process_batch",
+        new=AsyncMock(return_value=({uuid.uuid4()}, [notification])),
+    ) as process_batch, patch.object(
+        cron_jobs, "invalidate_wallet_caches", new_callable=AsyncMock
+    ) as invalidate, patch(
+        "app.core.tasks.cron_jobs.settings.SCHEDULED_TX_BATCH_SIZE", 2
+    ):
+        session_factory.return_value.__aenter__.return_value = session
+
+        claimed = await cron_jobs._claim_and_process(notifications, set())
+
+    assert claimed == 3
+    assert repos.ims.claim_due_transactions.await_count == 3
+    assert repos.ims.claim_due_transactions.await_args.args == (2,)
+    assert process_batch.await_count == 2
+    assert session.commit.await_count == 2
+    assert invalidate.await_count == 2
+    assert notifications.put_nowait.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_claim_query_skips_locked_rows():
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value=MagicMock())
+
+    await IMSRepository(db).claim_due_transactions(50, exclude_ids={uuid.uuid4()})
+
+    sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "scheduled_transaction.status =" in sql
+    assert "scheduled_transaction.id NOT IN" in sql
+    assert sql.endswith("FOR UPDATE SKIP LOCKED")
+
+
+@pytest.mark.asyncio
+async def test_process_scheduled_transactions_sends_queued_notifications():
+    notification = {"notification_type": "x", "recipients": ["a@b.c"]}
+
+    loop_failed_sets = []
+
+    async def claim_and_process(notifications, failed_ids):
+        loop_failed_sets.append(failed_ids)
+        notifications.put_nowait(notification)
+        return 1
+
+    with patch.object(
+        cron_jobs, "_claim_and_process", new=claim_and_process
+    ), patch.object(cron_jobs, "EmailNotificationService") as email_service, patch(
+        "app.core.tasks.cron_jobs.settings.SCHEDULED_TX_CONCURRENCY", 3
+    ):
+        email_service.return_value.send = AsyncMock()
+
+        await cron_jobs.process_scheduled_transactions()
+
+    # One claim loop per unit of concurrency, each queued one notification
+    assert email_service.return_value.send.await_count == 3
+    email_service.return_value.send.assert_awaited_with(**notification)
+    # All loops share one set of failed rows
+    assert len(loop_failed_sets) == 3
+    assert all(failed is loop_failed_sets[0] for failed in loop_failed_sets)
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_falls_back_to_single_transactions(repos):
+    scheduled = [make_scheduled(uuid.uuid4(), uuid.uuid4(), "1") for _ in range(2)]
+    failed_id = scheduled[0].id
+    repos.ims.claim_due_transactions = AsyncMock(side_effect=[scheduled, []])
+    session = AsyncMock()
+    user_id = uuid.uuid4()
+    excluded_during_fallback = []
+
+    async def process_individually(db, tx_ids, notifications):
+        excluded_during_fallback.append(set(failed_ids))
+        return {user_id}, {failed_id}
+
+    with patch.object(
+        cron_jobs, "_process_batch", new=AsyncMock(side_effect=RuntimeError("boom"))
+    ), patch.object(cron_jobs, "AsyncSessionLocal") as session_factory, patch.object(
+        cron_jobs,
+        "_process_individually",
+        new=AsyncMock(side_effect=process_individually),
+    ) as individually, patch.object(
+        cron_jobs, "invalidate_wallet_caches", new_callable=AsyncMock
+    ) as invalidate:
+        session_factory.return_value.__aenter__.return_value = session
+        notifications = MagicMock()
+        failed_ids = set()
+
+        settled = await cron_jobs._claim_and_process(notifications, failed_ids)
+
+    assert settled == 1
+    session.rollback.assert_awaited_once()
+    individually.assert_awaited_once()
+    assert individually.await_args.args[1] == [tx.id for tx in scheduled]
+    invalidate.assert_awaited_once_with({user_id})
+    notifications.put_nowait.assert_not_called()
+    # A transaction that failed on its own is not claimed again in this run
+    assert repos.ims.claim_due_transactions.await_args.kwargs == {
+        "exclude_ids": {failed_id}
+    }
+    # and is reported to the scheduler
+    assert failed_ids == {failed_id}
+    # Other loops skip the whole batch while it is retried one by one
+    assert excluded_during_fallback == [{tx.id for tx in scheduled}]
+
+
+@pytest.mark.asyncio
+async def test_fallback_queues_notifications_after_commit(repos):
+    scheduled = make_scheduled(uuid.uuid4(), uuid.uuid4(), "1")
+    repos.ims.claim_due_transactions = AsyncMock(return_value=[scheduled])
+    db = AsyncMock()
+    notification = {"notification_type": "x", "recipients": ["a@b.c"]}
+    queued_before_commit = []
+
+    async def process_single(db_, tx, group_repo, wallet_repo, user_repo, pending):
+        pending.append(notification)
+        return tx.user_id
+
+    async def commit():
+        queued_before_commit.append(notifications.put_nowait.call_count)
+
+    db.commit = AsyncMock(side_effect=commit)
+    notifications = MagicMock()
+
+    with patch.object(
+        cron_jobs, "_process_single_transaction", new=AsyncMock(side_effect=process_single)
+    ):
+        updated_user_ids, failed_ids = await cron_jobs._process_individually(
+            db, [scheduled.id], notifications
+        )
+
+    assert updated_user_ids == {scheduled.user_id}
+    assert failed_ids == set()
+    assert queued_before_commit == [0]
+    notifications.put_nowait.assert_called_once_with(notification)
+
+
+@pytest.mark.asyncio
+async def test_due_time_scheduler_runs_when_due_and_wakes_on_publish():
+    async def fake_listener(redis, wakeup):
+        await asyncio.sleep(0.05)
+        wakeup.set()  # a schedule was confirmed
+        await asyncio.Event().wait()
+
+    # Due, due again, then the next schedule is 30s away
+    seconds_until_due = AsyncMock(side_effect=[0, 0, 30, 30, 30])
+    # The second run settles nothing: those rows are held by another worker
+    process = AsyncMock(side_effect=[3, 0])
+
+    with patch.object(
+        cron_jobs, "_seconds_until_next_due", seconds_until_due
+    ), patch.object(cron_jobs, "process_scheduled_transactions", process), patch.object(
+        cron_jobs, "_listen_for_wakeups", fake_listener
+    ), patch(
+        "app.core.tasks.cron_jobs.settings.SCHEDULED_TX_POLL_INTERVAL_SECONDS", 30
+    ):
+        task = asyncio.create_task(cron_jobs.run_due_time_scheduler(MagicMock()))
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert process.await_count == 2
+    # Woken up by the listener instead of sleeping the full 30s poll interval
+    assert seconds_until_due.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_due_time_scheduler_sleeps_past_rows_that_keep_failing():
+    failing_id = uuid.uuid4()
+
+    async def process(failed_ids):
+        failed_ids.add(failing_id)
+        return 0
+
+    async def fake_listener(redis, wakeup):
+        await asyncio.Event().wait()
+
+    # The failing row stays due; the next healthy schedule is 0.1s away
+    seconds_until_due = AsyncMock(side_effect=[0, 0.1, 0, 0.1])
+    process = AsyncMock(side_effect=process)
+
+    with patch.object(
+        cron_jobs, "_seconds_until_next_due", seconds_until_due
+    ), patch.object(cron_jobs, "process_scheduled_transactions", process), patch.object(
+        cron_jobs, "_listen_for_wakeups", fake_listener
+    ), patch(
+        "app.core.tasks.cron_jobs.settings.SCHEDULED_TX_POLL_INTERVAL_SECONDS", 30
+    ):
+        task = asyncio.create_task(cron_jobs.run_due_time_scheduler(MagicMock()))
+        await asyncio.sleep(0.15)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    # Slept until the next healthy row instead of the 30s poll interval
+    assert process.await_count == 2
+    assert seconds_until_due.await_args_list[1].kwargs == {"exclude_ids": {failing_id}}
+
+
+@pytest.mark.asyncio
+async def test_next_due_lookup_excludes_failing_rows():
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value=MagicMock())
+
+    await IMSRepository(db).get_next_due_at(exclude_ids={uuid.uuid4()})
+
+    sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("SELECT min(scheduled_transaction.next_run_at)")
+    assert "scheduled_transaction.id NOT IN" in sql
+
+
+@pytest.mark.asyncio
+async def test_seconds_until_next_due(repos):
+    with patch.object(cron_jobs, "AsyncSessionLocal"):
+        repos.ims.get_next_due_at = AsyncMock(
+            return_value=datetime.now(timezone.utc) + timedelta(seconds=10)
+        )
+        assert 9 < await cron_jobs._seconds_until_next_due(60) <= 10
+        assert await cron_jobs._seconds_until_next_due(5) == 5
+
+        repos.ims.get_next_due_at = AsyncMock(return_value=None)
+        assert await cron_jobs._seconds_until_next_due(60) == 60
+
+
+@pytest.mark.asyncio
+async def test_wake_scheduler_is_best_effort():
+    redis = AsyncMock()
+    await cron_jobs.wake_scheduler(redis)
+    redis.publish.assert_awaited_once_with(cron_jobs.SCHEDULER_WAKEUP_CHANNEL, b"1")
+
+    redis.publish.side_effect = ConnectionError("redis down")
+    await cron_jobs.wake_scheduler(redis)
@@ -0,0 +1,155 @@
+# tests/test_modules/test_user/test_transaction_summary.py
+
+import uuid
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.modules.shared.enums import TransactionStatus, TransactionType
+from app.modules.user.repository import UserRepository
+from app.modules.wallet.models import Transaction
+
+
+@pytest.fixture
+def mock_db():
+    return AsyncMock()
+
+
+@pytest.fixture
+def user_repo(mock_db):
+    return UserRepository(mock_db)
+
+
+def compiled(mock_db, call_index=-1):
+    stmt = mock_db.execute.await_args_list[call_index].args[0]
+    return stmt.compile(dialect=postgresql.dialect())
+
+
+def make_transaction(tx_type, owner_id=None, amount=25.0):
+    return Transaction(
+        amount=amount,
+        type=tx_type,
+        status=TransactionStatus.COMPLETED,
+        wallet_id=uuid.uuid4(),
+        owner_id=owner_id or uuid.uuid4(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_deposit_increments_count_and_amount(user_repo, mock_db):
+    await user_repo.apply_transaction_to_summary(
+        make_transaction(TransactionType.WALLET_DEPOSIT)
+    )
+
+    sql = str(compiled(mock_db))
+    params = compiled(mock_db).params
+    assert sql.startswith("INSERT INTO user_transaction_summary")
+    assert "ON CONFLICT (user_id) DO UPDATE SET" in sql
+    assert (
+        "total_transactions = (user_transaction_summary.total_transactions"
+        " + excluded.total_transactions)"
+    ) in sql
+    assert params["total_transactions_m0"] == 1
+    assert params["deposit_count_m0"] == 1
+    assert params["total_amount_in_m0"] == Decimal("25.0")
+    assert params["total_amount_out_m0"] == 0
+    mock_db.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_group_contribution_only_increments_counts(user_repo, mock_db):
+    await user_repo.apply_transaction_to_summary(
+        make_transaction(TransactionType.GROUP_SAVINGS_DEPOSIT, amount=-25.0)
+    )
+
+    params = compiled(mock_db).params
+    assert params["group_contribution_count_m0"] == 1
+    assert params["total_amount_in_m0"] == 0
+
+
+@pytest.mark.asyncio
+async def test_transaction_without_owner_is_skipped(user_repo, mock_db):
+    tx = make_transaction(TransactionType.WALLET_DEPOSIT)
+    tx.owner_id = None
+
+    await user_repo.apply_transaction_to_summary(tx)
+
+    mock_db.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_batch_sums_increments_per_owner(user_repo, mock_db):
+    owner_id = uuid.uuid4()
+    await user_repo.apply_transactions_to_summary(
+        [
+            make_transaction(TransactionType.WALLET_DEPOSIT, owner_id, amount=10.0),
+            make_transaction(TransactionType.WALLET_DEPOSIT, owner_id, amount=5.5),
+            make_transaction(TransactionType.GROUP_SAVINGS_DEPOSIT, owner_id),
+            make_transaction(TransactionType.WALLET_WITHDRAWAL),
+        ]
+    )
+
+    mock_db.execute.assert_awaited_once()
+    rows = mock_db.execute.await_args.args[0]._multi_values[0]
+    assert len(rows) == 2
+    owner = next(row for row in rows if row["user_id"] == owner_id)
+    assert owner["total_transactions"] == 3
+    assert owner["deposit_count"] == 2
+    assert owner["total_amount_in"] == Decimal("15.5")
+    assert owner["group_contribution_count"] == 1
+    assert owner["withdrawal_count"] == 0
+    assert "ON CONFLICT (user_id) DO UPDATE" in str(compiled(mock_db))
+    mock_db.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_missing_summary_reads_as_zero_without_writing(user_repo, mock_db):
+    mock_db.execute.return_value = MagicMock(
+        scalar_one_or_none=MagicMock(return_value=None)
+    )
+
+    summary = await user_repo.get_transaction_summary(uuid.uuid4())
+
+    mock_db.execute.assert_awaited_once()
+    mock_db.commit.assert_not_awaited()
+    assert summary["total_transactions"] == 0
+    assert summary["total_amount_in"] == 0.0
+    assert summary["transaction_type_distribution"] == {
+        "deposit": 0,
+        "withdrawal": 0,
+        "group_contribution": 0,
+        "solo_contribution": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_full_rebuild_overwrites_rows(user_repo, mock_db):
+    mock_db.execute.return_value = MagicMock(rowcount=7)
+
+    written = await user_repo.rebuild_transaction_summaries()
+
+    sql = str(compiled(mock_db))
+    assert "GROUP BY transaction.owner_id" in sql
+    assert "ON CONFLICT (user_id) DO UPDATE" in sql
+    assert written == 7
+    mock_db.commit.assert_awaited_once()
+
+
+
+@pytest.mark.asyncio
+async def test_group_contribution_stats_use_one_query(user_repo, mock_db):
+    mock_db.execute.return_value = MagicMock(
+        all=MagicMock(return_value=[("Trip", Decimal("50")), ("Car", Decimal("25.5"))])
+    )
+
+    stats = await user_repo.get_group_contribution_stats(uuid.uuid4())
+
+    mock_db.execute.assert_awaited_once()
+    assert "groups.is_solo = false" in str(compiled(mock_db))
+    assert stats == {
+        "total_contributed": 75.5,
+        "active_groups": 2,
+        "breakdown": {"Trip": 50.0, "Car": 25.5},
+    }
@@ -0,0 +1 @@
+# tests/test_modules/test_wallet/__init__.py
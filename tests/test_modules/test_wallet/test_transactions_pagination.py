@@ -0,0 +1,116 @@
+# tests/test_modules/test_wallet/test_transactions_pagination.py
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+
+from app.modules.shared.enums import TransactionStatus, TransactionType
+from app.modules.shared.helpers import decode_cursor, encode_cursor
+from app.modules.wallet.service import WalletService
+
+
+@pytest.fixture
+def mock_transaction_repo():
+    repo = AsyncMock()
+    repo.get_user_transactions_before = AsyncMock()
+    repo.get_user_transactions_count = AsyncMock(return_value=3)
+    return repo
+
+
+@pytest.fixture
+def wallet_service(mock_transaction_repo):
+    return WalletService(AsyncMock(), mock_transaction_repo, AsyncMock(), AsyncMock())
+
+
+@pytest.fixture
+def mock_redis():
+    redis = AsyncMock()
+    redis.get.return_value = None
+    return redis
+
+
+@pytest.fixture
+def current_user():
+    user = MagicMock()
+    user.id = uuid.uuid4()
+    return user
+
+
+def make_transactions(count):
+    now = datetime.now(timezone.utc)
+    return [
+        MagicMock(
+            id=uuid.uuid4(),
+            amount=10.0,
+            type=TransactionType.WALLET_DEPOSIT,
+            status=TransactionStatus.COMPLETED,
+            created_at=now - timedelta(minutes=i),
+            executed_at=now - timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2025, 5, 1, 12, 30, tzinfo=timezone.utc)
+    row_id = uuid.uuid4()
+
+    assert decode_cursor(encode_cursor(created_at, row_id)) == (created_at, row_id)
+
+
+@pytest.mark.asyncio
+async def test_first_page_returns_next_cursor(
+    wallet_service, mock_transaction_repo, mock_redis, current_user
+):
+    transactions = make_transactions(3)
+    mock_transaction_repo.get_user_transactions_before.return_value = transactions
+
+    result = await wallet_service.get_transactions_by_cursor(
+        mock_redis, current_user, cursor=None, limit=2
+    )
+
+    # One extra row is fetched to detect the next page
+    mock_transaction_repo.get_user_transactions_before.assert_awaited_once_with(
+        current_user.id, limit=3, cursor=None
+    )
+    assert len(result["transactions"]) == 2
+    assert result["has_more"] is True
+    assert decode_cursor(result["next_cursor"]) == (
+        transactions[1].created_at,
+        transactions[1].id,
+    )
+    assert "total_transactions" not in result
+    mock_transaction_repo.get_user_transactions_count.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_last_page_with_total(
+    wallet_service, mock_transaction_repo, mock_redis, current_user
+):
+    transactions = make_transactions(1)
+    mock_transaction_repo.get_user_transactions_before.return_value = transactions
+    cursor = encode_cursor(datetime.now(timezone.utc), uuid.uuid4())
+
+    result = await wallet_service.get_transactions_by_cursor(
+        mock_redis, current_user, cursor=cursor, limit=2, include_total=True
+    )
+
+    assert result["has_more"] is False
+    assert result["next_cursor"] is None
+    assert result["total_transactions"] == 3
+    assert mock_transaction_repo.get_user_transactions_before.await_args.kwargs[
+        "cursor"
+    ] == decode_cursor(cursor)
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_is_rejected(wallet_service, mock_redis, current_user):
+    with pytest.raises(HTTPException) as exc_info:
+        await wallet_service.get_transactions_by_cursor(
+            mock_redis, current_user, cursor="not-a-cursor", limit=2
+        )
+
+    assert exc_info.value.status_code == 400
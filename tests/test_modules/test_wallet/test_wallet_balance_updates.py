@@ -0,0 +1,165 @@
+# tests/test_modules/test_wallet/test_wallet_balance_updates.py
+
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app.modules.shared.enums import TransactionStatus, TransactionType
+from app.modules.wallet.repository import WalletRepository
+from app.modules.wallet.schemas import TransactionRequest
+from app.modules.wallet.service import WalletService
+
+
+@pytest.fixture
+def mock_wallet_repo():
+    repo = AsyncMock()
+    repo.apply_balance_delta = AsyncMock(
+        return_value=MagicMock(
+            id=uuid.uuid4(),
+            total_balance=Decimal("150.0000"),
+            locked_amount=Decimal("20.0000"),
+            version=4,
+        )
+    )
+    return repo
+
+
+@pytest.fixture
+def mock_transaction_repo():
+    async def create(transaction):
+        transaction.created_at = datetime.now(timezone.utc)
+        return transaction
+
+    repo = AsyncMock()
+    repo.create = AsyncMock(side_effect=create)
+    return repo
+
+
+@pytest.fixture
+def mock_user_repo():
+    return AsyncMock()
+
+
+@pytest.fixture
+def wallet_service(mock_wallet_repo, mock_transaction_repo, mock_user_repo):
+    return WalletService(
+        mock_wallet_repo, mock_transaction_repo, mock_user_repo, AsyncMock()
+    )
+
+
+@pytest.fixture
+def current_user():
+    user = MagicMock()
+    user.id = uuid.uuid4()
+    user.full_name = "Test User"
+    user.email = "user@example.com"
+    return user
+
+
+@pytest.fixture(autouse=True)
+def transaction_limits():
+    with patch.multiple(
+        "app.modules.wallet.service.settings",
+        MIN_WALLET_TRANSACTION_AMOUNT=1,
+        MAX_WALLET_TRANSACTION_AMOUNT=10_000,
+    ):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def mock_refresh_caches():
+    with patch(
+        "app.modules.wallet.service.refresh_wallet_caches", new_callable=AsyncMock
+    ) as refresh:
+        yield refresh
+
+
+@pytest.mark.asyncio
+async def test_deposit_is_one_update_and_one_insert(
+    wallet_service, mock_wallet_repo, mock_transaction_repo, mock_user_repo, current_user
+):
+    result = await wallet_service.deposit(
+        AsyncMock(), TransactionRequest(amount=50), current_user
+    )
+
+    mock_wallet_repo.apply_balance_delta.assert_awaited_once_with(
+        current_user.id, Decimal("50.0")
+    )
+    mock_wallet_repo.get_wallet_by_user_id.assert_not_awaited()
+    mock_transaction_repo.create.assert_awaited_once()
+
+    transaction = mock_transaction_repo.create.await_args.args[0]
+    assert transaction.type == TransactionType.WALLET_DEPOSIT
+    assert transaction.status == TransactionStatus.COMPLETED
+    # The summary increment is committed along with the insert
+    mock_user_repo.apply_transaction_to_summary.assert_awaited_once_with(transaction)
+    assert result["balance"] == 150.0
+    assert result["available_balance"] == 130.0
+
+
+@pytest.mark.asyncio
+async def test_withdraw_checks_funds_in_the_update(
+    wallet_service, mock_wallet_repo, current_user
+):
+    await wallet_service.withdraw(
+        AsyncMock(), TransactionRequest(amount=30), current_user
+    )
+
+    mock_wallet_repo.apply_balance_delta.assert_awaited_once_with(
+        current_user.id, Decimal("-30.0"), min_available=Decimal("30.0")
+    )
+
+
+@pytest.mark.asyncio
+async def test_withdraw_insufficient_funds(
+    wallet_service, mock_wallet_repo, mock_transaction_repo, current_user
+):
+    mock_wallet_repo.apply_balance_delta.return_value = None
+    mock_wallet_repo.get_wallet_by_user_id.return_value = MagicMock(
+        available_balance=10.0
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        await wallet_service.withdraw(
+            AsyncMock(), TransactionRequest(amount=30), current_user
+        )
+
+    assert exc.value.status_code == 400
+    assert "Insufficient funds" in exc.value.detail
+    mock_transaction_repo.create.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_deposit_without_wallet(
+    wallet_service, mock_wallet_repo, mock_transaction_repo, current_user
+):
+    mock_wallet_repo.apply_balance_delta.return_value = None
+
+    with pytest.raises(HTTPException) as exc:
+        await wallet_service.deposit(
+            AsyncMock(), TransactionRequest(amount=30), current_user
+        )
+
+    assert exc.value.status_code == 404
+    mock_transaction_repo.create.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_apply_balance_delta_guards_available_balance():
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value=MagicMock())
+    await WalletRepository(db).apply_balance_delta(
+        uuid.uuid4(), Decimal("-30"), min_available=Decimal("30")
+    )
+
+    stmt = db.execute.await_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE wallet SET total_balance=(wallet.total_balance +")
+    assert "wallet.total_balance - wallet.locked_amount >=" in sql
+    assert "RETURNING wallet.id, wallet.total_balance" in sql
+    db.commit.assert_not_awaited()